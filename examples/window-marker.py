@@ -75,10 +75,10 @@ def cb_get_letter(e):
 
     if grabbing is not None:
         keybind.ungrab_keyboard()
-        sym = keybind.get_keysym(e.detail)
+        sym = keybind.get_keysym_from_state(e.detail, e.state)
         letter = keybind.get_keysym_string(sym)
 
-        if len(letter) == 1 and ord(letter) in range(ord('a'), ord('z') + 1):
+        if letter and len(letter) == 1 and 'a' <= letter.lower() <= 'z':
             grabbing(letter.lower())
 
         grabbing = None
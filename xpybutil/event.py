@@ -2,10 +2,17 @@
 A module that can send client events to windows. It also allows
 registering callback functions to particular events. It can also
 run the main event loop.
+
+Functions can also be scheduled to run from the event loop after a delay
+with 'call_later'.
 """
 from collections import defaultdict, deque
+import heapq
+import itertools
+import select
 import struct
 import sys
+import time
 import traceback
 
 from xpybutil.compat import xcb_Exception, xproto
@@ -14,6 +21,9 @@ from xpybutil import conn, root, util
 
 __queue = deque()
 __callbacks = defaultdict(list)
+__hooks = defaultdict(list)
+__timers = [] # heap of [deadline, sequence number, callback]
+__timer_seq = itertools.count()
 EM = xproto.EventMask
 
 stringtype = str if sys.version_info[0] >= 3 else basestring
@@ -57,6 +67,12 @@ def replay_pointer():
     conn.core.AllowEventsChecked(xproto.Allow.ReplayPointer,
                                  xproto.Time.CurrentTime).check()
 
+def allow_events(mode, time=xproto.Time.CurrentTime):
+    return conn.core.AllowEvents(mode, time)
+
+def allow_events_checked(mode, time=xproto.Time.CurrentTime):
+    return conn.core.AllowEventsChecked(mode, time)
+
 def send_event(destination, event_mask, event, propagate=False):
     return conn.core.SendEvent(propagate, destination, event_mask, event)
 
@@ -109,10 +125,51 @@ def disconnect(event_name, window):
     if key in __callbacks:
         del __callbacks[key]
 
+def add_hook(event_name, callback):
+    """
+    Registers a callback for an event regardless of the window it is for.
+    Hooks run before the callbacks registered with 'connect', which makes
+    them suitable for keeping caches up to date. ``event_name`` may also be
+    an event class, i.e., for events of extensions.
+    """
+    __hooks[__event_class(event_name)].append(callback)
+
+def remove_hook(event_name, callback):
+    hooks = __hooks.get(__event_class(event_name), [])
+    if callback in hooks:
+        hooks.remove(callback)
+
+def __event_class(event_name):
+    if not isinstance(event_name, stringtype):
+        return event_name
+
+    member = '%sEvent' % event_name
+    assert hasattr(xproto, member)
+    return getattr(xproto, member)
+
+def call_later(delay, callback):
+    """
+    Schedules a function (that takes no arguments) to be called from the
+    event loop after ``delay`` seconds. It runs in the same thread as the
+    event callbacks, the next time 'read' is called with ``block=True``
+    after the delay has passed. (A blocking 'read' doesn't wait longer than
+    that.)
+
+    :return: A handle that can be passed to 'cancel_call'.
+    """
+    timer = [__now() + delay, next(__timer_seq), callback]
+    heapq.heappush(__timers, timer)
+    return timer
+
+def cancel_call(handle):
+    """
+    Cancels a function scheduled with 'call_later', if it hasn't run yet.
+    """
+    handle[2] = None
+
 def read(block=False):
     if block:
-        e = conn.wait_for_event()
-        __queue.appendleft(e)
+        __wait_for_event()
 
     while True:
         e = conn.poll_for_event()
@@ -122,6 +179,40 @@ def read(block=False):
 
         __queue.appendleft(e)
 
+    if block:
+        __run_timers()
+
+def __now():
+    return time.monotonic() if hasattr(time, 'monotonic') else time.time()
+
+def __wait_for_event():
+    """
+    Blocks until there is an event, or until the next function scheduled
+    with 'call_later' is due.
+    """
+    while __timers and __timers[0][2] is None:
+        heapq.heappop(__timers)
+
+    if not __timers:
+        __queue.appendleft(conn.wait_for_event())
+        return
+
+    e = conn.poll_for_event()
+    if e:
+        __queue.appendleft(e)
+        return
+
+    timeout = __timers[0][0] - __now()
+    if timeout > 0:
+        select.select([conn.get_file_descriptor()], [], [], timeout)
+
+def __run_timers():
+    now = __now()
+    while __timers and __timers[0][0] <= now:
+        cb = heapq.heappop(__timers)[2]
+        if cb is not None:
+            cb()
+
 def main():
     try:
         while True:
@@ -143,6 +234,9 @@ def main():
                 elif hasattr(e, 'requestor'):
                     w = e.requestor
 
+                for cb in __hooks.get(e.__class__, []):
+                    cb(e)
+
                 key = (e.__class__, w)
                 for cb in __callbacks.get(key, []):
                     cb(e)
@@ -157,3 +251,17 @@ def queue():
 def peek():
     return list(__queue)
 
+def peek_next():
+    """
+    Returns the event that will be processed after the current one without
+    removing it from the queue. If nothing is queued, the connection is
+    polled once (without blocking) first.
+
+    :return: The next event, or None if there isn't one yet.
+    """
+    if not __queue:
+        read(block=False)
+    if __queue:
+        return __queue[-1]
+    return None
+
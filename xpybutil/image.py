@@ -1,27 +1,49 @@
 """
 An incomplete and haphazard collection of functions that can
 bridge a gap between PIL and drawing images with X.
+
+If NumPy is installed, it is used to convert icons in bulk.
 """
+from array import array
+import struct
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from xpybutil.compat import xproto
 
 from xpybutil import conn
 from PIL import Image
 
 def net_wm_icon_to_bgra(data):
-    ret = [0] * (len(data) * 4)
-    for i, d in enumerate(data):
-        alpha = d >> 24
-        red = ((alpha << 24) ^ d) >> 16
-        green = (((alpha << 24) + (red << 16)) ^ d) >> 8
-        blue = (((alpha << 24) + (red << 16) + (green << 8)) ^ d) >> 0
+    """
+    Converts the pixels of an icon from _NET_WM_ICON (one ARGB word per
+    pixel) to BGRA bytes, ready for ``get_image`` or PutImage.
 
-        pixel = i * 4
-        ret[pixel] = blue
-        ret[pixel + 1] = green
-        ret[pixel + 2] = red
-        ret[pixel + 3] = alpha
+    A BGRA pixel is just its ARGB word in little-endian byte order, so the
+    whole buffer is converted at once: with NumPy if it's available, by
+    reinterpreting an array of 32 bit words otherwise, or with struct as a
+    last resort.
 
-    return ret
+    :param data: A list of ARGB pixels.
+    :return: 4 bytes per pixel, in BGRA order.
+    :rtype: bytes
+    """
+    if numpy is not None:
+        return numpy.asarray(data, dtype=numpy.uint32).astype('<u4').tobytes()
+
+    if array('I').itemsize == 4:
+        words = array('I', data)
+        if sys.byteorder == 'big':
+            words.byteswap()
+        if hasattr(words, 'tobytes'):
+            return words.tobytes()
+        return words.tostring()
+
+    return struct.pack('<%dI' % len(data), *data)
 
 def color_humanize(clr):
     t = hex(clr).replace('0x', '')
@@ -43,16 +65,26 @@ def get_image_from_pixmap(pid):
         return 0, 0, []
 
 def get_image(width, height, data):
-    im = Image.fromstring('RGBA', (width, height),
-                          ''.join([chr(i) for i in data]), 'raw', 'BGRA')
-
-    return im
+    """
+    :param data: BGRA pixels, as bytes (i.e., from ``net_wm_icon_to_bgra``)
+                 or a list of byte values.
+    :rtype: PIL.Image
+    """
+    return __image_from_bytes('RGBA', (width, height), data, 'BGRA')
 
 def get_bitmap(width, height, data):
-    im = Image.fromstring('1', (width, height),
-                          ''.join([chr(i) for i in data]), 'raw', '1;R')
+    return __image_from_bytes('1', (width, height), data, '1;R')
 
-    return im
+def __image_from_bytes(mode, size, data, rawmode):
+    """
+    Private function that builds a PIL image from raw data, which may be
+    bytes or a list of byte values.
+    """
+    if not isinstance(data, bytes):
+        data = bytes(bytearray(data))
+    if hasattr(Image, 'frombytes'):
+        return Image.frombytes(mode, size, data, 'raw', rawmode)
+    return Image.fromstring(mode, size, data, 'raw', rawmode)
 
 def get_data(image):
     return [ord(s) for s in image.tostring('raw', 'BGRA')]
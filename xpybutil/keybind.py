@@ -6,20 +6,33 @@ in event.py.
 The two functions of interest here are 'bind_global_key' and 'bind_key'. Most
 of the other functions facilitate the use of those two, but you may need them
 if you're getting down and dirty.
+
+If you load many bindings at once (i.e., from a configuration file), use
+'compile_keymap' to validate all of them up front. Parsed key strings are
+cached, so compiling the same bindings again (even after the keyboard mapping
+changes) is nearly free.
 """
-from collections import defaultdict
+from __future__ import print_function
+
+from collections import defaultdict, namedtuple
 import sys
 
 from xpybutil.compat import xproto
 
-from xpybutil import conn, root, event
-from xpybutil.keysymdef import keysyms, keysym_strings
+from xpybutil import conn, root, event, util
+from xpybutil.keysymdef import string_to_keysym, keysym_to_strings
 
 __kbmap = None
 __keysmods = None
+__keycodes = {} # keysym -> keycodes in the current keyboard mapping
+__keystrings = {} # key string -> (modifier mask, keysym), survives remaps
+__state_tables = None # built lazily, see 'get_keysym_from_state'
+__numlock_mask = 0
+__modeswitch_mask = 0
 
-__keybinds = defaultdict(list)
+__keybinds = defaultdict(list) # (window, cleaned state, keycode) -> handlers
 __keygrabs = defaultdict(int) # Key grab key -> number of grabs
+__repeating = set() # keycodes currently being auto-repeated
 
 EM = xproto.EventMask
 GM = xproto.GrabMode
@@ -30,7 +43,60 @@ TRIVIAL_MODS = [
     xproto.ModMask.Lock | xproto.ModMask._2
 ]
 
-def bind_global_key(event_type, key_string, cb):
+# Clears every trivial modifier from a key event's state in one operation.
+# (The union of all TRIVIAL_MODS.)
+__mods_mask = ~(xproto.ModMask.Lock | xproto.ModMask._2)
+
+# The result of compiling a key string like 'Mod4-Shift-a'. 'keycodes' is a
+# tuple of every keycode that currently produces 'keysym', in ascending order.
+KeyBinding = namedtuple('KeyBinding', ['mods', 'keysym', 'keycodes'])
+
+class Repeat(object):
+    """
+    Policies for what a key binding does while its key is held down and the
+    X server auto-repeats it. (Which it does by sending a KeyRelease and a
+    KeyPress with identical timestamps over and over again.)
+
+    Allow fires the callback for every repeat. (The default.) Ignore only
+    fires for the real press or release. RateLimit fires for the real press
+    or release and for at most ``rate`` repeats per second. OnRelease fires
+    once, when the key is really released, regardless of the event type the
+    binding was made with.
+    """
+    Allow = 0
+    Ignore = 1
+    RateLimit = 2
+    OnRelease = 3
+
+__unichr = chr if sys.version_info[0] >= 3 else unichr
+
+# Case pairs among the legacy (pre-Unicode) keysyms, as in Xlib's
+# XConvertCase: (first upper case keysym, last upper case keysym, first
+# lower case keysym).
+__legacy_case_ranges = [
+    # Latin 2
+    (0x1a1, 0x1a1, 0x1b1), (0x1a3, 0x1a6, 0x1b3), (0x1a9, 0x1ac, 0x1b9),
+    (0x1ae, 0x1af, 0x1be), (0x1c0, 0x1de, 0x1e0),
+    # Latin 3
+    (0x2a1, 0x2a6, 0x2b1), (0x2ab, 0x2ac, 0x2bb), (0x2c5, 0x2de, 0x2e5),
+    # Latin 4
+    (0x3a3, 0x3ac, 0x3b3), (0x3bd, 0x3bd, 0x3bf), (0x3c0, 0x3de, 0x3e0),
+    # Cyrillic
+    (0x6b1, 0x6bf, 0x6a1), (0x6e0, 0x6ff, 0x6c0),
+    # Greek
+    (0x7a1, 0x7ab, 0x7b1), (0x7c1, 0x7d9, 0x7e1),
+    # Latin 9
+    (0x13bc, 0x13bc, 0x13bd), (0x13be, 0x13be, 0xff),
+]
+__legacy_lower = dict((k, lower + k - first)
+                      for first, last, lower in __legacy_case_ranges
+                      for k in range(first, last + 1))
+# Greek_iotaaccentdieresis, Greek_upsilonaccentdieresis and
+# Greek_finalsmallsigma have no upper case.
+__legacy_upper = dict((v, k) for k, v in __legacy_lower.items()
+                      if v not in (0x7b6, 0x7ba, 0x7f3))
+
+def bind_global_key(event_type, key_string, cb, repeat=Repeat.Allow, rate=0):
     """
     An alias for ``bind_key(event_type, ROOT_WINDOW, key_string, cb)``.
 
@@ -40,14 +106,20 @@ def bind_global_key(event_type, key_string, cb):
                        Namely, a list of zero or more modifiers separated by
                        '-', followed by a single non-modifier key.
     :type key_string: str
-    :param cb: A first class function with no parameters.
+    :param cb: A first class function with no parameters, or with a single
+               parameter that receives the Key{Press,Release} event.
     :type cb: function
+    :param repeat: What to do when the key is auto-repeated.
+    :type repeat: A class variable of Repeat
+    :param rate: Maximum repeats per second when ``repeat`` is
+                 ``Repeat.RateLimit``.
+    :type rate: float
     :return: True if the binding was successful, False otherwise.
     :rtype: bool
     """
-    return bind_key(event_type, root, key_string, cb)
+    return bind_key(event_type, root, key_string, cb, repeat, rate)
 
-def bind_key(event_type, wid, key_string, cb):
+def bind_key(event_type, wid, key_string, cb, repeat=Repeat.Allow, rate=0):
     """
     Binds a function ``cb`` to a particular key press ``key_string`` on a
     window ``wid``. Whether it's a key release or key press binding is
@@ -57,6 +129,9 @@ def bind_key(event_type, wid, key_string, cb):
     so that if you're using ``event.main()`` for your main loop, everything
     will be taken care of for you.
 
+    Holding a key down makes the X server repeat it. If your callback is
+    expensive, use ``repeat`` to pick one of the ``Repeat`` policies.
+
     :param event_type: Either 'KeyPress' or 'KeyRelease'.
     :type event_type: str
     :param wid: The window to bind the key grab to.
@@ -65,28 +140,45 @@ def bind_key(event_type, wid, key_string, cb):
                        Namely, a list of zero or more modifiers separated by
                        '-', followed by a single non-modifier key.
     :type key_string: str
-    :param cb: A first class function with no parameters.
+    :param cb: A first class function with no parameters, or with a single
+               parameter that receives the Key{Press,Release} event.
     :type cb: function
+    :param repeat: What to do when the key is auto-repeated.
+    :type repeat: A class variable of Repeat
+    :param rate: Maximum repeats per second when ``repeat`` is
+                 ``Repeat.RateLimit``.
+    :type rate: float
     :return: True if the binding was successful, False otherwise.
     :rtype: bool
     """
     assert event_type in ('KeyPress', 'KeyRelease')
+    assert repeat != Repeat.RateLimit or rate > 0
 
-    mods, kc = parse_keystring(key_string)
-    key = (wid, mods, kc)
-
-    if not kc:
-        print >> sys.stderr, 'Could not find a keycode for %s' % key_string
+    binding = compile_keystring(key_string)
+    if binding is None:
+        print('Could not find a keysym for %s' % key_string, file=sys.stderr)
+        return False
+    if not binding.keycodes:
+        print('Could not find a keycode for %s' % key_string, file=sys.stderr)
         return False
 
+    mods, kc = binding.mods, binding.keycodes[0]
+    key = (wid, mods, kc)
+
     if not __keygrabs[key] and not grab_key(wid, mods, kc):
         return False
 
-    __keybinds[key].append(cb)
+    __keybinds[key].append(__make_handler(event_type, cb, repeat, rate))
     __keygrabs[key] += 1
 
-    if not event.is_connected(event_type, wid, __run_keybind_callbacks):
-        event.connect(event_type, wid, __run_keybind_callbacks)
+    # Detecting repeats requires seeing both halves of each repeat.
+    if repeat == Repeat.Allow:
+        event_types = (event_type,)
+    else:
+        event_types = ('KeyPress', 'KeyRelease')
+    for et in event_types:
+        if not event.is_connected(et, wid, __run_keybind_callbacks):
+            event.connect(et, wid, __run_keybind_callbacks)
 
     return True
 
@@ -104,18 +196,54 @@ def parse_keystring(key_string):
     :return: Tuple of modifier mask and keycode
     :rtype: (mask, int)
     """
-    modifiers = 0
-    keycode = None
+    binding = compile_keystring(key_string)
+    if binding is None:
+        return __keystrings[key_string][0], None
+    return binding.mods, get_keycode(binding.keysym)
 
-    for part in key_string.split('-'):
-        if hasattr(xproto.KeyButMask, part):
-            modifiers |= getattr(xproto.KeyButMask, part)
-        else:
-            if len(part) == 1:
-                part = part.lower()
-            keycode = lookup_string(part)
+def compile_keystring(key_string):
+    """
+    Turns a key string like 'Mod1-Mod4-a' into a ``KeyBinding`` of its
+    modifier mask, keysym and the keycodes that currently produce that keysym.
+
+    The parsing of the string is cached for the life of the process, and the
+    keycodes are looked up in an index that xpybutil rebuilds whenever the
+    keyboard mapping changes. So calling this repeatedly is cheap.
+
+    :param key_string: String starting with zero or more modifiers followed
+                       by exactly one key press.
+    :type key_string: str
+    :return: The compiled binding, or None if the key string does not name a
+             valid keysym. If the keysym is valid but isn't on the keyboard,
+             'keycodes' will be empty.
+    :rtype: KeyBinding
+    """
+    parsed = __keystrings.get(key_string)
+    if parsed is None:
+        parsed = __keystrings[key_string] = __parse_keystring(key_string)
 
-    return modifiers, keycode
+    mods, keysym = parsed
+    if keysym is None:
+        return None
+    return KeyBinding(mods, keysym, __keycodes.get(keysym, ()))
+
+def compile_keymap(key_strings):
+    """
+    Compiles many key strings at once with ``compile_keystring``. This is
+    useful to validate an entire set of bindings before grabbing any of them.
+
+    For example, to find all of the key strings that can't be bound:
+
+     ::
+
+        keymap = compile_keymap(config_bindings)
+        invalid = [ks for ks, b in keymap.items() if not b or not b.keycodes]
+
+    :param key_strings: An iterable of key strings.
+    :return: A dict mapping each key string to its KeyBinding (or None).
+    :rtype: dict
+    """
+    return dict((ks, compile_keystring(ks)) for ks in key_strings)
 
 def lookup_string(kstr):
     """
@@ -125,12 +253,11 @@ def lookup_string(kstr):
     :return: Keycode, if one exists.
     :rtype: int
     """
-    if kstr in keysyms:
-        return get_keycode(keysyms[kstr])
-    elif len(kstr) > 1 and kstr.capitalize() in keysyms:
-        return get_keycode(keysyms[kstr.capitalize()])
+    keysym = __string_to_keysym(kstr)
+    if keysym is None:
+        return None
 
-    return None
+    return get_keycode(keysym)
 
 def lookup_keysym(keysym):
     """
@@ -210,6 +337,44 @@ def get_keysym(keycode, col=0, kbmap=None):
 
     return kbmap.keysyms[ind]
 
+def get_keysym_from_state(keycode, state):
+    """
+    Get the keysym that a key press actually produces, given its keycode and
+    the ``state`` of the key event. Unlike ``get_keysym``, this accounts for
+    Shift, Lock (as Caps Lock), Num Lock on keypad keys and the active
+    keyboard group, following the rules of the core protocol:
+    http://www.x.org/releases/X11R7.7/doc/xproto/x11protocol.html#keysym_encoding
+
+    The active group is taken from the Mode_switch modifier. xpybutil doesn't
+    enable the XKB extension, so the server only reports the core state of
+    the keyboard; if you've enabled XKB yourself, the XKB group bits of
+    ``state`` are honored too. The core keyboard mapping only describes two
+    groups, so higher groups wrap around.
+
+    The keysyms for every combination of group and modifiers are computed
+    the first time this is called after the keyboard mapping changes, so
+    most calls are a single table lookup.
+
+    :param keycode: A physical key represented by an integer.
+    :type keycode: int
+    :param state: Typically from ``some_event.state``.
+    :type state: int
+    :return: A keysym, or 0 (NoSymbol) if the key produces nothing.
+    :rtype: int
+    """
+    global __state_tables
+
+    if __state_tables is None:
+        __state_tables = __build_state_tables(__kbmap)
+
+    mn, mx = get_min_max_keycode()
+    group = 1 if state & __modeswitch_mask else (state >> 13) & 1
+    level = state & (xproto.ModMask.Shift | xproto.ModMask.Lock)
+    if state & __numlock_mask:
+        level |= 4
+
+    return __state_tables[((group << 3) | level) * (mx - mn + 1) + keycode - mn]
+
 def get_keysym_string(keysym):
     """
     A simple wrapper to find the english string associated with a particular
@@ -218,25 +383,24 @@ def get_keysym_string(keysym):
     :param keysym: An X keysym.
     :rtype: str
     """
-    return keysym_strings.get(keysym, [None])[0]
+    names = keysym_to_strings(keysym)
+    return names[0] if names else None
 
 def get_keycode(keysym):
     """
     Given a keysym, find the keycode mapped to it in the current X environment.
-    It is necessary to search the keysym table in order to do this, including
-    all columns.
+    All columns of the keysym table are considered. If more than one keycode
+    produces the keysym, the smallest one is returned.
+
+    xpybutil keeps an index of the keysym table, so this doesn't search it.
 
     :param keysym: An X keysym.
     :return: A keycode or None if one could not be found.
     :rtype: int
     """
-    mn, mx = get_min_max_keycode()
-    cols = __kbmap.keysyms_per_keycode
-    for i in range(mn, mx + 1):
-        for j in range(0, cols):
-            ks = get_keysym(i, col=j)
-            if ks == keysym:
-                return i
+    keycodes = __keycodes.get(keysym)
+    if keycodes:
+        return keycodes[0]
 
     return None
 
@@ -420,13 +584,16 @@ def update_keyboard_mapping(e):
     :type e: xcb.xproto.MappingNotifyEvent
     :rtype: void
     """
-    global __kbmap, __keysmods
+    global __kbmap, __keysmods, __keycodes, __state_tables
 
     newmap = get_keyboard_mapping().reply()
 
     if e is None:
         __kbmap = newmap
+        __keycodes = __build_keycode_index(newmap)
+        __state_tables = None
         __keysmods = get_keys_to_mods()
+        __update_lock_masks()
         return
 
     if e.request == xproto.Mapping.Keyboard:
@@ -434,13 +601,176 @@ def update_keyboard_mapping(e):
         for kc in range(*get_min_max_keycode()):
             knew = get_keysym(kc, kbmap=newmap)
             oldkc = get_keycode(knew)
-            if oldkc != kc:
+            if oldkc is not None and oldkc != kc:
                 changes[oldkc] = kc
 
         __kbmap = newmap
+        __keycodes = __build_keycode_index(newmap)
+        __state_tables = None
+        __update_lock_masks()
         __regrab(changes)
     elif e.request == xproto.Mapping.Modifier:
         __keysmods = get_keys_to_mods()
+        __update_lock_masks()
+
+def __parse_keystring(key_string):
+    """
+    Private function that does the actual parsing for ``compile_keystring``.
+    The result doesn't depend on the keyboard mapping, so it can be cached.
+
+    :type key_string: str
+    :return: Tuple of modifier mask and keysym (or None).
+    :rtype: (mask, int)
+    """
+    modifiers = 0
+    keysym = None
+
+    for part in key_string.split('-'):
+        if hasattr(xproto.KeyButMask, part):
+            modifiers |= getattr(xproto.KeyButMask, part)
+        else:
+            if len(part) == 1:
+                part = part.lower()
+            keysym = __string_to_keysym(part)
+
+    return modifiers, keysym
+
+def __string_to_keysym(kstr):
+    """
+    Private function that finds the keysym for an English string
+    representation, being lenient about capitalization.
+
+    :type kstr: str
+    :return: A keysym or None.
+    :rtype: int
+    """
+    keysym = string_to_keysym(kstr)
+    if keysym is None and len(kstr) > 1:
+        keysym = string_to_keysym(kstr.capitalize())
+
+    return keysym
+
+def __build_keycode_index(kbmap):
+    """
+    Private function that inverts a keyboard mapping in a single pass, so that
+    finding the keycodes for a keysym doesn't require searching the table.
+
+    :param kbmap: The keyboard mapping to index.
+    :type kbmap: xcb.xproto.GetKeyboardMapingReply
+    :return: A dict mapping keysym to a tuple of keycodes in ascending order.
+    :rtype: dict
+    """
+    mn, mx = get_min_max_keycode()
+    per = kbmap.keysyms_per_keycode
+
+    index = defaultdict(list)
+    for i, keysym in enumerate(kbmap.keysyms):
+        if not keysym:
+            continue
+        keycodes = index[keysym]
+        kc = mn + i // per
+        if not keycodes or keycodes[-1] != kc:
+            keycodes.append(kc)
+
+    return dict((keysym, tuple(kcs)) for keysym, kcs in index.items())
+
+def __build_state_tables(kbmap):
+    """
+    Private function that resolves, for every keycode, the keysym produced
+    under each combination of group (2), Shift, Lock and Num Lock (8). The
+    result is one flat list so that ``get_keysym_from_state`` can index it
+    directly with ``(group << 3 | Shift | Lock | NumLock << 2) * nkeys + kc``.
+
+    :param kbmap: The keyboard mapping to resolve.
+    :type kbmap: xcb.xproto.GetKeyboardMapingReply
+    :rtype: [int]
+    """
+    mn, mx = get_min_max_keycode()
+    nkeys = mx - mn + 1
+    per = kbmap.keysyms_per_keycode
+    syms = list(kbmap.keysyms)
+    shift, lock = xproto.ModMask.Shift, xproto.ModMask.Lock
+
+    tables = [0] * (16 * nkeys)
+    for i in range(nkeys):
+        row = syms[i * per:(i + 1) * per] + [0] * 4
+        for group in (0, 1):
+            k1, k2 = row[2 * group], row[2 * group + 1]
+            if group == 1 and not k1 and not k2:
+                k1, k2 = row[0], row[1]
+            if not k2:
+                lower, upper = __convert_case(k1)
+                if lower != upper and k1 == lower:
+                    k2 = upper
+                else:
+                    k2 = k1
+
+            for level in range(8):
+                if level & 4 and __is_keypad(k2):
+                    ks = k1 if level & shift else k2
+                elif level & lock:
+                    ks = __convert_case(k2 if level & shift else k1)[1]
+                else:
+                    ks = k2 if level & shift else k1
+                tables[((group << 3) | level) * nkeys + i] = ks
+
+    return tables
+
+def __update_lock_masks():
+    """
+    Private function that finds which modifiers Num_Lock and Mode_switch are
+    currently mapped to.
+
+    :rtype: void
+    """
+    global __numlock_mask, __modeswitch_mask
+
+    __numlock_mask = __modeswitch_mask = 0
+    for kc in __keycodes.get(0xff7f, ()): # Num_Lock
+        __numlock_mask |= __keysmods.get(kc, 0)
+    for kc in __keycodes.get(0xff7e, ()): # Mode_switch
+        __modeswitch_mask |= __keysmods.get(kc, 0)
+
+def __convert_case(keysym):
+    """
+    Private function that returns the lower and upper case versions of a
+    keysym, like Xlib's XConvertCase: Latin-1 and Unicode keysyms follow
+    Unicode, and the legacy Latin 2-4, Latin 9, Cyrillic and Greek keysyms
+    have their own table. Keysyms without case are returned unchanged.
+
+    :type keysym: int
+    :rtype: (int, int)
+    """
+    if keysym in __legacy_lower:
+        return __legacy_lower[keysym], keysym
+    if keysym in __legacy_upper:
+        return keysym, __legacy_upper[keysym]
+
+    if keysym < 0x100:
+        base = 0
+    elif 0x1000100 <= keysym <= 0x110ffff:
+        base = 0x1000000
+    else:
+        return keysym, keysym
+
+    c = __unichr(keysym - base)
+    lower, upper = c.lower(), c.upper()
+    if len(lower) != 1 or len(upper) != 1:
+        return keysym, keysym
+
+    lower, upper = base + ord(lower), base + ord(upper)
+    if not base and (lower > 0xff or upper > 0xff):
+        return keysym, keysym
+    return lower, upper
+
+def __is_keypad(keysym):
+    """
+    Private function that reports whether a keysym is on the keypad.
+
+    :type keysym: int
+    :rtype: bool
+    """
+    return 0xff80 <= keysym <= 0xffbd or 0x11000000 <= keysym <= 0x1100ffff
 
 def __run_keybind_callbacks(e):
     """
@@ -450,21 +780,88 @@ def __run_keybind_callbacks(e):
     find the right callback.
 
     Callbacks are called in the order that they have been added. (FIFO.)
+    Their calling convention and repeat policy were resolved when they were
+    bound, so this is a single dictionary lookup per event.
 
     :param e: A Key{Press,Release} event.
     :type e: xcb.xproto.Key{Press,Release}Event
     :rtype: void
     """
-    kc, mods = e.detail, e.state
-    for mod in TRIVIAL_MODS:
-        mods &= ~mod
+    # The repeat state is tracked for every key event, bound or not. (i.e.,
+    # the release of a held key comes without the modifier if the modifier
+    # was let go first, and must still end the repeat.)
+    repeated = __is_repeat(e)
+    handlers = __keybinds.get((e.event, e.state & __mods_mask, e.detail))
+    if handlers:
+        for handler in handlers:
+            handler(e, repeated)
+
+def __is_repeat(e):
+    """
+    A private function that reports whether a key event is part of an
+    auto-repeat. The X server repeats a held key by sending a KeyRelease that
+    is immediately followed by a KeyPress with the same keycode and the same
+    timestamp. So a KeyRelease is a repeat if such a KeyPress is queued right
+    behind it, and a KeyPress is a repeat if it follows such a KeyRelease.
+
+    :param e: A Key{Press,Release} event.
+    :type e: xcb.xproto.Key{Press,Release}Event
+    :rtype: bool
+    """
+    kc = e.detail
+    if isinstance(e, xproto.KeyReleaseEvent):
+        nxt = event.peek_next()
+        if (isinstance(nxt, xproto.KeyPressEvent)
+                and nxt.detail == kc and nxt.time == e.time):
+            __repeating.add(kc)
+            return True
+
+        __repeating.discard(kc)
+        return False
 
-    key = (e.event, mods, kc)
-    for cb in __keybinds.get(key, []):
-        try:
+    return kc in __repeating
+
+def __make_handler(event_type, cb, repeat, rate):
+    """
+    A private function that compiles a callback and its repeat policy into a
+    single handler for the dispatch table. Handlers take the key event and
+    whether it is an auto-repeat.
+
+    :param event_type: Either 'KeyPress' or 'KeyRelease'.
+    :type event_type: str
+    :type cb: function
+    :param repeat: A class variable of Repeat.
+    :param rate: Maximum repeats per second for Repeat.RateLimit.
+    :rtype: function
+    """
+    cb = util.event_callback(cb)
+    etype = getattr(xproto, '%sEvent' % event_type)
+
+    if repeat == Repeat.Ignore:
+        def handler(e, repeated):
+            if not repeated and isinstance(e, etype):
+                cb(e)
+    elif repeat == Repeat.OnRelease:
+        def handler(e, repeated):
+            if not repeated and isinstance(e, xproto.KeyReleaseEvent):
+                cb(e)
+    elif repeat == Repeat.RateLimit:
+        interval = int(1000 / rate) # X timestamps are in milliseconds
+        last = [0]
+
+        def handler(e, repeated):
+            if not isinstance(e, etype):
+                return
+            if repeated and (e.time - last[0]) & 0xffffffff < interval:
+                return
+            last[0] = e.time
             cb(e)
-        except TypeError:
-            cb()
+    else:
+        def handler(e, repeated):
+            if isinstance(e, etype):
+                cb(e)
+
+    return handler
 
 def __regrab(changes):
     """
@@ -475,15 +872,15 @@ def __regrab(changes):
     :type changes: dict
     :rtype: void
     """
-    for wid, mods, kc in __keybinds.keys():
+    for wid, mods, kc in list(__keybinds.keys()):
         if kc in changes:
             ungrab_key(wid, mods, kc)
             grab_key(wid, mods, changes[kc])
 
             old = (wid, mods, kc)
             new = (wid, mods, changes[kc])
-            __keybinds[new] = __keybinds[old]
-            del __keybinds[old]
+            __keybinds[new] = __keybinds.pop(old)
+            __keygrabs[new] = __keygrabs.pop(old, 0)
 
 if conn is not None:
     update_keyboard_mapping(None)
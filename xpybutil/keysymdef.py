@@ -1,2023 +1,2164 @@
 """
-A module that creates a dictionary mapping from an english string of a key,
-to a keysym (an X data type) in ``keysyms``.
+A module that maps between English strings of keys and keysyms (an X data
+type). Use ``string_to_keysym`` and ``keysym_to_strings`` (or the ``keysyms``
+and ``keysym_strings`` read-only mappings) to look them up. (There are more
+string representations than there are keysyms, which is why the latter
+returns a **list**.)
 
-The module also creates a reverse mapping called ``keysym_strings`` that maps
-a keysym to a **list** of english string versions of that keysym. (There are
-more string representations than there are keysyms.)
+The table is stored as a compact block of text sorted by keysym. Nothing is
+parsed at import time; on the first lookup it is unpacked into sorted
+parallel arrays, which are then searched with bisection in both directions.
 
 This list is taken from Xlib.
 """
-from collections import defaultdict
+from array import array
+from bisect import bisect_left, bisect_right
+import sys
 
-keysyms = {
-    'VoidSymbol': 0xffffff,
-    'BackSpace': 0xff08,
-    'Tab': 0xff09,
-    'Linefeed': 0xff0a,
-    'Clear': 0xff0b,
-    'Return': 0xff0d,
-    'Pause': 0xff13,
-    'Scroll_Lock': 0xff14,
-    'Sys_Req': 0xff15,
-    'Escape': 0xff1b,
-    'Delete': 0xffff,
-    'Multi_key': 0xff20,
-    'Codeinput': 0xff37,
-    'SingleCandidate': 0xff3c,
-    'MultipleCandidate': 0xff3d,
-    'PreviousCandidate': 0xff3e,
-    'Kanji': 0xff21,
-    'Muhenkan': 0xff22,
-    'Henkan_Mode': 0xff23,
-    'Henkan': 0xff23,
-    'Romaji': 0xff24,
-    'Hiragana': 0xff25,
-    'Katakana': 0xff26,
-    'Hiragana_Katakana': 0xff27,
-    'Zenkaku': 0xff28,
-    'Hankaku': 0xff29,
-    'Zenkaku_Hankaku': 0xff2a,
-    'Touroku': 0xff2b,
-    'Massyo': 0xff2c,
-    'Kana_Lock': 0xff2d,
-    'Kana_Shift': 0xff2e,
-    'Eisu_Shift': 0xff2f,
-    'Eisu_toggle': 0xff30,
-    'Kanji_Bangou': 0xff37,
-    'Zen_Koho': 0xff3d,
-    'Mae_Koho': 0xff3e,
-    'Home': 0xff50,
-    'Left': 0xff51,
-    'Up': 0xff52,
-    'Right': 0xff53,
-    'Down': 0xff54,
-    'Prior': 0xff55,
-    'Page_Up': 0xff55,
-    'Next': 0xff56,
-    'Page_Down': 0xff56,
-    'End': 0xff57,
-    'Begin': 0xff58,
-    'Select': 0xff60,
-    'Print': 0xff61,
-    'Execute': 0xff62,
-    'Insert': 0xff63,
-    'Undo': 0xff65,
-    'Redo': 0xff66,
-    'Menu': 0xff67,
-    'Find': 0xff68,
-    'Cancel': 0xff69,
-    'Help': 0xff6a,
-    'Break': 0xff6b,
-    'Mode_switch': 0xff7e,
-    'script_switch': 0xff7e,
-    'Num_Lock': 0xff7f,
-    'KP_Space': 0xff80,
-    'KP_Tab': 0xff89,
-    'KP_Enter': 0xff8d,
-    'KP_F1': 0xff91,
-    'KP_F2': 0xff92,
-    'KP_F3': 0xff93,
-    'KP_F4': 0xff94,
-    'KP_Home': 0xff95,
-    'KP_Left': 0xff96,
-    'KP_Up': 0xff97,
-    'KP_Right': 0xff98,
-    'KP_Down': 0xff99,
-    'KP_Prior': 0xff9a,
-    'KP_Page_Up': 0xff9a,
-    'KP_Next': 0xff9b,
-    'KP_Page_Down': 0xff9b,
-    'KP_End': 0xff9c,
-    'KP_Begin': 0xff9d,
-    'KP_Insert': 0xff9e,
-    'KP_Delete': 0xff9f,
-    'KP_Equal': 0xffbd,
-    'KP_Multiply': 0xffaa,
-    'KP_Add': 0xffab,
-    'KP_Separator': 0xffac,
-    'KP_Subtract': 0xffad,
-    'KP_Decimal': 0xffae,
-    'KP_Divide': 0xffaf,
-    'KP_0': 0xffb0,
-    'KP_1': 0xffb1,
-    'KP_2': 0xffb2,
-    'KP_3': 0xffb3,
-    'KP_4': 0xffb4,
-    'KP_5': 0xffb5,
-    'KP_6': 0xffb6,
-    'KP_7': 0xffb7,
-    'KP_8': 0xffb8,
-    'KP_9': 0xffb9,
-    'F1': 0xffbe,
-    'F2': 0xffbf,
-    'F3': 0xffc0,
-    'F4': 0xffc1,
-    'F5': 0xffc2,
-    'F6': 0xffc3,
-    'F7': 0xffc4,
-    'F8': 0xffc5,
-    'F9': 0xffc6,
-    'F10': 0xffc7,
-    'F11': 0xffc8,
-    'L1': 0xffc8,
-    'F12': 0xffc9,
-    'L2': 0xffc9,
-    'F13': 0xffca,
-    'L3': 0xffca,
-    'F14': 0xffcb,
-    'L4': 0xffcb,
-    'F15': 0xffcc,
-    'L5': 0xffcc,
-    'F16': 0xffcd,
-    'L6': 0xffcd,
-    'F17': 0xffce,
-    'L7': 0xffce,
-    'F18': 0xffcf,
-    'L8': 0xffcf,
-    'F19': 0xffd0,
-    'L9': 0xffd0,
-    'F20': 0xffd1,
-    'L10': 0xffd1,
-    'F21': 0xffd2,
-    'R1': 0xffd2,
-    'F22': 0xffd3,
-    'R2': 0xffd3,
-    'F23': 0xffd4,
-    'R3': 0xffd4,
-    'F24': 0xffd5,
-    'R4': 0xffd5,
-    'F25': 0xffd6,
-    'R5': 0xffd6,
-    'F26': 0xffd7,
-    'R6': 0xffd7,
-    'F27': 0xffd8,
-    'R7': 0xffd8,
-    'F28': 0xffd9,
-    'R8': 0xffd9,
-    'F29': 0xffda,
-    'R9': 0xffda,
-    'F30': 0xffdb,
-    'R10': 0xffdb,
-    'F31': 0xffdc,
-    'R11': 0xffdc,
-    'F32': 0xffdd,
-    'R12': 0xffdd,
-    'F33': 0xffde,
-    'R13': 0xffde,
-    'F34': 0xffdf,
-    'R14': 0xffdf,
-    'F35': 0xffe0,
-    'R15': 0xffe0,
-    'Shift_L': 0xffe1,
-    'Shift_R': 0xffe2,
-    'Control_L': 0xffe3,
-    'Control_R': 0xffe4,
-    'Caps_Lock': 0xffe5,
-    'Shift_Lock': 0xffe6,
-    'Meta_L': 0xffe7,
-    'Meta_R': 0xffe8,
-    'Alt_L': 0xffe9,
-    'Alt_R': 0xffea,
-    'Super_L': 0xffeb,
-    'Super_R': 0xffec,
-    'Hyper_L': 0xffed,
-    'Hyper_R': 0xffee,
-    'ISO_Lock': 0xfe01,
-    'ISO_Level2_Latch': 0xfe02,
-    'ISO_Level3_Shift': 0xfe03,
-    'ISO_Level3_Latch': 0xfe04,
-    'ISO_Level3_Lock': 0xfe05,
-    'ISO_Level5_Shift': 0xfe11,
-    'ISO_Level5_Latch': 0xfe12,
-    'ISO_Level5_Lock': 0xfe13,
-    'ISO_Group_Shift': 0xff7e,
-    'ISO_Group_Latch': 0xfe06,
-    'ISO_Group_Lock': 0xfe07,
-    'ISO_Next_Group': 0xfe08,
-    'ISO_Next_Group_Lock': 0xfe09,
-    'ISO_Prev_Group': 0xfe0a,
-    'ISO_Prev_Group_Lock': 0xfe0b,
-    'ISO_First_Group': 0xfe0c,
-    'ISO_First_Group_Lock': 0xfe0d,
-    'ISO_Last_Group': 0xfe0e,
-    'ISO_Last_Group_Lock': 0xfe0f,
-    'ISO_Left_Tab': 0xfe20,
-    'ISO_Move_Line_Up': 0xfe21,
-    'ISO_Move_Line_Down': 0xfe22,
-    'ISO_Partial_Line_Up': 0xfe23,
-    'ISO_Partial_Line_Down': 0xfe24,
-    'ISO_Partial_Space_Left': 0xfe25,
-    'ISO_Partial_Space_Right': 0xfe26,
-    'ISO_Set_Margin_Left': 0xfe27,
-    'ISO_Set_Margin_Right': 0xfe28,
-    'ISO_Release_Margin_Left': 0xfe29,
-    'ISO_Release_Margin_Right': 0xfe2a,
-    'ISO_Release_Both_Margins': 0xfe2b,
-    'ISO_Fast_Cursor_Left': 0xfe2c,
-    'ISO_Fast_Cursor_Right': 0xfe2d,
-    'ISO_Fast_Cursor_Up': 0xfe2e,
-    'ISO_Fast_Cursor_Down': 0xfe2f,
-    'ISO_Continuous_Underline': 0xfe30,
-    'ISO_Discontinuous_Underline': 0xfe31,
-    'ISO_Emphasize': 0xfe32,
-    'ISO_Center_Object': 0xfe33,
-    'ISO_Enter': 0xfe34,
-    'dead_grave': 0xfe50,
-    'dead_acute': 0xfe51,
-    'dead_circumflex': 0xfe52,
-    'dead_tilde': 0xfe53,
-    'dead_perispomeni': 0xfe53,
-    'dead_macron': 0xfe54,
-    'dead_breve': 0xfe55,
-    'dead_abovedot': 0xfe56,
-    'dead_diaeresis': 0xfe57,
-    'dead_abovering': 0xfe58,
-    'dead_doubleacute': 0xfe59,
-    'dead_caron': 0xfe5a,
-    'dead_cedilla': 0xfe5b,
-    'dead_ogonek': 0xfe5c,
-    'dead_iota': 0xfe5d,
-    'dead_voiced_sound': 0xfe5e,
-    'dead_semivoiced_sound': 0xfe5f,
-    'dead_belowdot': 0xfe60,
-    'dead_hook': 0xfe61,
-    'dead_horn': 0xfe62,
-    'dead_stroke': 0xfe63,
-    'dead_abovecomma': 0xfe64,
-    'dead_psili': 0xfe64,
-    'dead_abovereversedcomma': 0xfe65,
-    'dead_dasia': 0xfe65,
-    'dead_doublegrave': 0xfe66,
-    'dead_belowring': 0xfe67,
-    'dead_belowmacron': 0xfe68,
-    'dead_belowcircumflex': 0xfe69,
-    'dead_belowtilde': 0xfe6a,
-    'dead_belowbreve': 0xfe6b,
-    'dead_belowdiaeresis': 0xfe6c,
-    'dead_invertedbreve': 0xfe6d,
-    'dead_belowcomma': 0xfe6e,
-    'dead_currency': 0xfe6f,
-    'dead_a': 0xfe80,
-    'dead_A': 0xfe81,
-    'dead_e': 0xfe82,
-    'dead_E': 0xfe83,
-    'dead_i': 0xfe84,
-    'dead_I': 0xfe85,
-    'dead_o': 0xfe86,
-    'dead_O': 0xfe87,
-    'dead_u': 0xfe88,
-    'dead_U': 0xfe89,
-    'dead_small_schwa': 0xfe8a,
-    'dead_capital_schwa': 0xfe8b,
-    'First_Virtual_Screen': 0xfed0,
-    'Prev_Virtual_Screen': 0xfed1,
-    'Next_Virtual_Screen': 0xfed2,
-    'Last_Virtual_Screen': 0xfed4,
-    'Terminate_Server': 0xfed5,
-    'AccessX_Enable': 0xfe70,
-    'AccessX_Feedback_Enable': 0xfe71,
-    'RepeatKeys_Enable': 0xfe72,
-    'SlowKeys_Enable': 0xfe73,
-    'BounceKeys_Enable': 0xfe74,
-    'StickyKeys_Enable': 0xfe75,
-    'MouseKeys_Enable': 0xfe76,
-    'MouseKeys_Accel_Enable': 0xfe77,
-    'Overlay1_Enable': 0xfe78,
-    'Overlay2_Enable': 0xfe79,
-    'AudibleBell_Enable': 0xfe7a,
-    'Pointer_Left': 0xfee0,
-    'Pointer_Right': 0xfee1,
-    'Pointer_Up': 0xfee2,
-    'Pointer_Down': 0xfee3,
-    'Pointer_UpLeft': 0xfee4,
-    'Pointer_UpRight': 0xfee5,
-    'Pointer_DownLeft': 0xfee6,
-    'Pointer_DownRight': 0xfee7,
-    'Pointer_Button_Dflt': 0xfee8,
-    'Pointer_Button1': 0xfee9,
-    'Pointer_Button2': 0xfeea,
-    'Pointer_Button3': 0xfeeb,
-    'Pointer_Button4': 0xfeec,
-    'Pointer_Button5': 0xfeed,
-    'Pointer_DblClick_Dflt': 0xfeee,
-    'Pointer_DblClick1': 0xfeef,
-    'Pointer_DblClick2': 0xfef0,
-    'Pointer_DblClick3': 0xfef1,
-    'Pointer_DblClick4': 0xfef2,
-    'Pointer_DblClick5': 0xfef3,
-    'Pointer_Drag_Dflt': 0xfef4,
-    'Pointer_Drag1': 0xfef5,
-    'Pointer_Drag2': 0xfef6,
-    'Pointer_Drag3': 0xfef7,
-    'Pointer_Drag4': 0xfef8,
-    'Pointer_Drag5': 0xfefd,
-    'Pointer_EnableKeys': 0xfef9,
-    'Pointer_Accelerate': 0xfefa,
-    'Pointer_DfltBtnNext': 0xfefb,
-    'Pointer_DfltBtnPrev': 0xfefc,
-    '3270_Duplicate': 0xfd01,
-    '3270_FieldMark': 0xfd02,
-    '3270_Right2': 0xfd03,
-    '3270_Left2': 0xfd04,
-    '3270_BackTab': 0xfd05,
-    '3270_EraseEOF': 0xfd06,
-    '3270_EraseInput': 0xfd07,
-    '3270_Reset': 0xfd08,
-    '3270_Quit': 0xfd09,
-    '3270_PA1': 0xfd0a,
-    '3270_PA2': 0xfd0b,
-    '3270_PA3': 0xfd0c,
-    '3270_Test': 0xfd0d,
-    '3270_Attn': 0xfd0e,
-    '3270_CursorBlink': 0xfd0f,
-    '3270_AltCursor': 0xfd10,
-    '3270_KeyClick': 0xfd11,
-    '3270_Jump': 0xfd12,
-    '3270_Ident': 0xfd13,
-    '3270_Rule': 0xfd14,
-    '3270_Copy': 0xfd15,
-    '3270_Play': 0xfd16,
-    '3270_Setup': 0xfd17,
-    '3270_Record': 0xfd18,
-    '3270_ChangeScreen': 0xfd19,
-    '3270_DeleteWord': 0xfd1a,
-    '3270_ExSelect': 0xfd1b,
-    '3270_CursorSelect': 0xfd1c,
-    '3270_PrintScreen': 0xfd1d,
-    '3270_Enter': 0xfd1e,
-    'space': 0x0020,
-    'exclam': 0x0021,
-    'quotedbl': 0x0022,
-    'numbersign': 0x0023,
-    'dollar': 0x0024,
-    'percent': 0x0025,
-    'ampersand': 0x0026,
-    'apostrophe': 0x0027,
-    'quoteright': 0x0027,
-    'parenleft': 0x0028,
-    'parenright': 0x0029,
-    'asterisk': 0x002a,
-    'plus': 0x002b,
-    'comma': 0x002c,
-    'minus': 0x002d,
-    'period': 0x002e,
-    'slash': 0x002f,
-    '0': 0x0030,
-    '1': 0x0031,
-    '2': 0x0032,
-    '3': 0x0033,
-    '4': 0x0034,
-    '5': 0x0035,
-    '6': 0x0036,
-    '7': 0x0037,
-    '8': 0x0038,
-    '9': 0x0039,
-    'colon': 0x003a,
-    'semicolon': 0x003b,
-    'less': 0x003c,
-    'equal': 0x003d,
-    'greater': 0x003e,
-    'question': 0x003f,
-    'at': 0x0040,
-    'A': 0x0041,
-    'B': 0x0042,
-    'C': 0x0043,
-    'D': 0x0044,
-    'E': 0x0045,
-    'F': 0x0046,
-    'G': 0x0047,
-    'H': 0x0048,
-    'I': 0x0049,
-    'J': 0x004a,
-    'K': 0x004b,
-    'L': 0x004c,
-    'M': 0x004d,
-    'N': 0x004e,
-    'O': 0x004f,
-    'P': 0x0050,
-    'Q': 0x0051,
-    'R': 0x0052,
-    'S': 0x0053,
-    'T': 0x0054,
-    'U': 0x0055,
-    'V': 0x0056,
-    'W': 0x0057,
-    'X': 0x0058,
-    'Y': 0x0059,
-    'Z': 0x005a,
-    'bracketleft': 0x005b,
-    'backslash': 0x005c,
-    'bracketright': 0x005d,
-    'asciicircum': 0x005e,
-    'underscore': 0x005f,
-    'grave': 0x0060,
-    'quoteleft': 0x0060,
-    'a': 0x0061,
-    'b': 0x0062,
-    'c': 0x0063,
-    'd': 0x0064,
-    'e': 0x0065,
-    'f': 0x0066,
-    'g': 0x0067,
-    'h': 0x0068,
-    'i': 0x0069,
-    'j': 0x006a,
-    'k': 0x006b,
-    'l': 0x006c,
-    'm': 0x006d,
-    'n': 0x006e,
-    'o': 0x006f,
-    'p': 0x0070,
-    'q': 0x0071,
-    'r': 0x0072,
-    's': 0x0073,
-    't': 0x0074,
-    'u': 0x0075,
-    'v': 0x0076,
-    'w': 0x0077,
-    'x': 0x0078,
-    'y': 0x0079,
-    'z': 0x007a,
-    'braceleft': 0x007b,
-    'bar': 0x007c,
-    'braceright': 0x007d,
-    'asciitilde': 0x007e,
-    'nobreakspace': 0x00a0,
-    'exclamdown': 0x00a1,
-    'cent': 0x00a2,
-    'sterling': 0x00a3,
-    'currency': 0x00a4,
-    'yen': 0x00a5,
-    'brokenbar': 0x00a6,
-    'section': 0x00a7,
-    'diaeresis': 0x00a8,
-    'copyright': 0x00a9,
-    'ordfeminine': 0x00aa,
-    'guillemotleft': 0x00ab,
-    'notsign': 0x00ac,
-    'hyphen': 0x00ad,
-    'registered': 0x00ae,
-    'macron': 0x00af,
-    'degree': 0x00b0,
-    'plusminus': 0x00b1,
-    'twosuperior': 0x00b2,
-    'threesuperior': 0x00b3,
-    'acute': 0x00b4,
-    'mu': 0x00b5,
-    'paragraph': 0x00b6,
-    'periodcentered': 0x00b7,
-    'cedilla': 0x00b8,
-    'onesuperior': 0x00b9,
-    'masculine': 0x00ba,
-    'guillemotright': 0x00bb,
-    'onequarter': 0x00bc,
-    'onehalf': 0x00bd,
-    'threequarters': 0x00be,
-    'questiondown': 0x00bf,
-    'Agrave': 0x00c0,
-    'Aacute': 0x00c1,
-    'Acircumflex': 0x00c2,
-    'Atilde': 0x00c3,
-    'Adiaeresis': 0x00c4,
-    'Aring': 0x00c5,
-    'AE': 0x00c6,
-    'Ccedilla': 0x00c7,
-    'Egrave': 0x00c8,
-    'Eacute': 0x00c9,
-    'Ecircumflex': 0x00ca,
-    'Ediaeresis': 0x00cb,
-    'Igrave': 0x00cc,
-    'Iacute': 0x00cd,
-    'Icircumflex': 0x00ce,
-    'Idiaeresis': 0x00cf,
-    'ETH': 0x00d0,
-    'Eth': 0x00d0,
-    'Ntilde': 0x00d1,
-    'Ograve': 0x00d2,
-    'Oacute': 0x00d3,
-    'Ocircumflex': 0x00d4,
-    'Otilde': 0x00d5,
-    'Odiaeresis': 0x00d6,
-    'multiply': 0x00d7,
-    'Oslash': 0x00d8,
-    'Ooblique': 0x00d8,
-    'Ugrave': 0x00d9,
-    'Uacute': 0x00da,
-    'Ucircumflex': 0x00db,
-    'Udiaeresis': 0x00dc,
-    'Yacute': 0x00dd,
-    'THORN': 0x00de,
-    'Thorn': 0x00de,
-    'ssharp': 0x00df,
-    'agrave': 0x00e0,
-    'aacute': 0x00e1,
-    'acircumflex': 0x00e2,
-    'atilde': 0x00e3,
-    'adiaeresis': 0x00e4,
-    'aring': 0x00e5,
-    'ae': 0x00e6,
-    'ccedilla': 0x00e7,
-    'egrave': 0x00e8,
-    'eacute': 0x00e9,
-    'ecircumflex': 0x00ea,
-    'ediaeresis': 0x00eb,
-    'igrave': 0x00ec,
-    'iacute': 0x00ed,
-    'icircumflex': 0x00ee,
-    'idiaeresis': 0x00ef,
-    'eth': 0x00f0,
-    'ntilde': 0x00f1,
-    'ograve': 0x00f2,
-    'oacute': 0x00f3,
-    'ocircumflex': 0x00f4,
-    'otilde': 0x00f5,
-    'odiaeresis': 0x00f6,
-    'division': 0x00f7,
-    'oslash': 0x00f8,
-    'ooblique': 0x00f8,
-    'ugrave': 0x00f9,
-    'uacute': 0x00fa,
-    'ucircumflex': 0x00fb,
-    'udiaeresis': 0x00fc,
-    'yacute': 0x00fd,
-    'thorn': 0x00fe,
-    'ydiaeresis': 0x00ff,
-    'Aogonek': 0x01a1,
-    'breve': 0x01a2,
-    'Lstroke': 0x01a3,
-    'Lcaron': 0x01a5,
-    'Sacute': 0x01a6,
-    'Scaron': 0x01a9,
-    'Scedilla': 0x01aa,
-    'Tcaron': 0x01ab,
-    'Zacute': 0x01ac,
-    'Zcaron': 0x01ae,
-    'Zabovedot': 0x01af,
-    'aogonek': 0x01b1,
-    'ogonek': 0x01b2,
-    'lstroke': 0x01b3,
-    'lcaron': 0x01b5,
-    'sacute': 0x01b6,
-    'caron': 0x01b7,
-    'scaron': 0x01b9,
-    'scedilla': 0x01ba,
-    'tcaron': 0x01bb,
-    'zacute': 0x01bc,
-    'doubleacute': 0x01bd,
-    'zcaron': 0x01be,
-    'zabovedot': 0x01bf,
-    'Racute': 0x01c0,
-    'Abreve': 0x01c3,
-    'Lacute': 0x01c5,
-    'Cacute': 0x01c6,
-    'Ccaron': 0x01c8,
-    'Eogonek': 0x01ca,
-    'Ecaron': 0x01cc,
-    'Dcaron': 0x01cf,
-    'Dstroke': 0x01d0,
-    'Nacute': 0x01d1,
-    'Ncaron': 0x01d2,
-    'Odoubleacute': 0x01d5,
-    'Rcaron': 0x01d8,
-    'Uring': 0x01d9,
-    'Udoubleacute': 0x01db,
-    'Tcedilla': 0x01de,
-    'racute': 0x01e0,
-    'abreve': 0x01e3,
-    'lacute': 0x01e5,
-    'cacute': 0x01e6,
-    'ccaron': 0x01e8,
-    'eogonek': 0x01ea,
-    'ecaron': 0x01ec,
-    'dcaron': 0x01ef,
-    'dstroke': 0x01f0,
-    'nacute': 0x01f1,
-    'ncaron': 0x01f2,
-    'odoubleacute': 0x01f5,
-    'udoubleacute': 0x01fb,
-    'rcaron': 0x01f8,
-    'uring': 0x01f9,
-    'tcedilla': 0x01fe,
-    'abovedot': 0x01ff,
-    'Hstroke': 0x02a1,
-    'Hcircumflex': 0x02a6,
-    'Iabovedot': 0x02a9,
-    'Gbreve': 0x02ab,
-    'Jcircumflex': 0x02ac,
-    'hstroke': 0x02b1,
-    'hcircumflex': 0x02b6,
-    'idotless': 0x02b9,
-    'gbreve': 0x02bb,
-    'jcircumflex': 0x02bc,
-    'Cabovedot': 0x02c5,
-    'Ccircumflex': 0x02c6,
-    'Gabovedot': 0x02d5,
-    'Gcircumflex': 0x02d8,
-    'Ubreve': 0x02dd,
-    'Scircumflex': 0x02de,
-    'cabovedot': 0x02e5,
-    'ccircumflex': 0x02e6,
-    'gabovedot': 0x02f5,
-    'gcircumflex': 0x02f8,
-    'ubreve': 0x02fd,
-    'scircumflex': 0x02fe,
-    'kra': 0x03a2,
-    'kappa': 0x03a2,
-    'Rcedilla': 0x03a3,
-    'Itilde': 0x03a5,
-    'Lcedilla': 0x03a6,
-    'Emacron': 0x03aa,
-    'Gcedilla': 0x03ab,
-    'Tslash': 0x03ac,
-    'rcedilla': 0x03b3,
-    'itilde': 0x03b5,
-    'lcedilla': 0x03b6,
-    'emacron': 0x03ba,
-    'gcedilla': 0x03bb,
-    'tslash': 0x03bc,
-    'ENG': 0x03bd,
-    'eng': 0x03bf,
-    'Amacron': 0x03c0,
-    'Iogonek': 0x03c7,
-    'Eabovedot': 0x03cc,
-    'Imacron': 0x03cf,
-    'Ncedilla': 0x03d1,
-    'Omacron': 0x03d2,
-    'Kcedilla': 0x03d3,
-    'Uogonek': 0x03d9,
-    'Utilde': 0x03dd,
-    'Umacron': 0x03de,
-    'amacron': 0x03e0,
-    'iogonek': 0x03e7,
-    'eabovedot': 0x03ec,
-    'imacron': 0x03ef,
-    'ncedilla': 0x03f1,
-    'omacron': 0x03f2,
-    'kcedilla': 0x03f3,
-    'uogonek': 0x03f9,
-    'utilde': 0x03fd,
-    'umacron': 0x03fe,
-    'Babovedot': 0x1001e02,
-    'babovedot': 0x1001e03,
-    'Dabovedot': 0x1001e0a,
-    'Wgrave': 0x1001e80,
-    'Wacute': 0x1001e82,
-    'dabovedot': 0x1001e0b,
-    'Ygrave': 0x1001ef2,
-    'Fabovedot': 0x1001e1e,
-    'fabovedot': 0x1001e1f,
-    'Mabovedot': 0x1001e40,
-    'mabovedot': 0x1001e41,
-    'Pabovedot': 0x1001e56,
-    'wgrave': 0x1001e81,
-    'pabovedot': 0x1001e57,
-    'wacute': 0x1001e83,
-    'Sabovedot': 0x1001e60,
-    'ygrave': 0x1001ef3,
-    'Wdiaeresis': 0x1001e84,
-    'wdiaeresis': 0x1001e85,
-    'sabovedot': 0x1001e61,
-    'Wcircumflex': 0x1000174,
-    'Tabovedot': 0x1001e6a,
-    'Ycircumflex': 0x1000176,
-    'wcircumflex': 0x1000175,
-    'tabovedot': 0x1001e6b,
-    'ycircumflex': 0x1000177,
-    'OE': 0x13bc,
-    'oe': 0x13bd,
-    'Ydiaeresis': 0x13be,
-    'overline': 0x047e,
-    'kana_fullstop': 0x04a1,
-    'kana_openingbracket': 0x04a2,
-    'kana_closingbracket': 0x04a3,
-    'kana_comma': 0x04a4,
-    'kana_conjunctive': 0x04a5,
-    'kana_middledot': 0x04a5,
-    'kana_WO': 0x04a6,
-    'kana_a': 0x04a7,
-    'kana_i': 0x04a8,
-    'kana_u': 0x04a9,
-    'kana_e': 0x04aa,
-    'kana_o': 0x04ab,
-    'kana_ya': 0x04ac,
-    'kana_yu': 0x04ad,
-    'kana_yo': 0x04ae,
-    'kana_tsu': 0x04af,
-    'kana_tu': 0x04af,
-    'prolongedsound': 0x04b0,
-    'kana_A': 0x04b1,
-    'kana_I': 0x04b2,
-    'kana_U': 0x04b3,
-    'kana_E': 0x04b4,
-    'kana_O': 0x04b5,
-    'kana_KA': 0x04b6,
-    'kana_KI': 0x04b7,
-    'kana_KU': 0x04b8,
-    'kana_KE': 0x04b9,
-    'kana_KO': 0x04ba,
-    'kana_SA': 0x04bb,
-    'kana_SHI': 0x04bc,
-    'kana_SU': 0x04bd,
-    'kana_SE': 0x04be,
-    'kana_SO': 0x04bf,
-    'kana_TA': 0x04c0,
-    'kana_CHI': 0x04c1,
-    'kana_TI': 0x04c1,
-    'kana_TSU': 0x04c2,
-    'kana_TU': 0x04c2,
-    'kana_TE': 0x04c3,
-    'kana_TO': 0x04c4,
-    'kana_NA': 0x04c5,
-    'kana_NI': 0x04c6,
-    'kana_NU': 0x04c7,
-    'kana_NE': 0x04c8,
-    'kana_NO': 0x04c9,
-    'kana_HA': 0x04ca,
-    'kana_HI': 0x04cb,
-    'kana_FU': 0x04cc,
-    'kana_HU': 0x04cc,
-    'kana_HE': 0x04cd,
-    'kana_HO': 0x04ce,
-    'kana_MA': 0x04cf,
-    'kana_MI': 0x04d0,
-    'kana_MU': 0x04d1,
-    'kana_ME': 0x04d2,
-    'kana_MO': 0x04d3,
-    'kana_YA': 0x04d4,
-    'kana_YU': 0x04d5,
-    'kana_YO': 0x04d6,
-    'kana_RA': 0x04d7,
-    'kana_RI': 0x04d8,
-    'kana_RU': 0x04d9,
-    'kana_RE': 0x04da,
-    'kana_RO': 0x04db,
-    'kana_WA': 0x04dc,
-    'kana_N': 0x04dd,
-    'voicedsound': 0x04de,
-    'semivoicedsound': 0x04df,
-    'kana_switch': 0xff7e,
-    'Farsi_0': 0x10006f0,
-    'Farsi_1': 0x10006f1,
-    'Farsi_2': 0x10006f2,
-    'Farsi_3': 0x10006f3,
-    'Farsi_4': 0x10006f4,
-    'Farsi_5': 0x10006f5,
-    'Farsi_6': 0x10006f6,
-    'Farsi_7': 0x10006f7,
-    'Farsi_8': 0x10006f8,
-    'Farsi_9': 0x10006f9,
-    'Arabic_percent': 0x100066a,
-    'Arabic_superscript_alef': 0x1000670,
-    'Arabic_tteh': 0x1000679,
-    'Arabic_peh': 0x100067e,
-    'Arabic_tcheh': 0x1000686,
-    'Arabic_ddal': 0x1000688,
-    'Arabic_rreh': 0x1000691,
-    'Arabic_comma': 0x05ac,
-    'Arabic_fullstop': 0x10006d4,
-    'Arabic_0': 0x1000660,
-    'Arabic_1': 0x1000661,
-    'Arabic_2': 0x1000662,
-    'Arabic_3': 0x1000663,
-    'Arabic_4': 0x1000664,
-    'Arabic_5': 0x1000665,
-    'Arabic_6': 0x1000666,
-    'Arabic_7': 0x1000667,
-    'Arabic_8': 0x1000668,
-    'Arabic_9': 0x1000669,
-    'Arabic_semicolon': 0x05bb,
-    'Arabic_question_mark': 0x05bf,
-    'Arabic_hamza': 0x05c1,
-    'Arabic_maddaonalef': 0x05c2,
-    'Arabic_hamzaonalef': 0x05c3,
-    'Arabic_hamzaonwaw': 0x05c4,
-    'Arabic_hamzaunderalef': 0x05c5,
-    'Arabic_hamzaonyeh': 0x05c6,
-    'Arabic_alef': 0x05c7,
-    'Arabic_beh': 0x05c8,
-    'Arabic_tehmarbuta': 0x05c9,
-    'Arabic_teh': 0x05ca,
-    'Arabic_theh': 0x05cb,
-    'Arabic_jeem': 0x05cc,
-    'Arabic_hah': 0x05cd,
-    'Arabic_khah': 0x05ce,
-    'Arabic_dal': 0x05cf,
-    'Arabic_thal': 0x05d0,
-    'Arabic_ra': 0x05d1,
-    'Arabic_zain': 0x05d2,
-    'Arabic_seen': 0x05d3,
-    'Arabic_sheen': 0x05d4,
-    'Arabic_sad': 0x05d5,
-    'Arabic_dad': 0x05d6,
-    'Arabic_tah': 0x05d7,
-    'Arabic_zah': 0x05d8,
-    'Arabic_ain': 0x05d9,
-    'Arabic_ghain': 0x05da,
-    'Arabic_tatweel': 0x05e0,
-    'Arabic_feh': 0x05e1,
-    'Arabic_qaf': 0x05e2,
-    'Arabic_kaf': 0x05e3,
-    'Arabic_lam': 0x05e4,
-    'Arabic_meem': 0x05e5,
-    'Arabic_noon': 0x05e6,
-    'Arabic_ha': 0x05e7,
-    'Arabic_heh': 0x05e7,
-    'Arabic_waw': 0x05e8,
-    'Arabic_alefmaksura': 0x05e9,
-    'Arabic_yeh': 0x05ea,
-    'Arabic_fathatan': 0x05eb,
-    'Arabic_dammatan': 0x05ec,
-    'Arabic_kasratan': 0x05ed,
-    'Arabic_fatha': 0x05ee,
-    'Arabic_damma': 0x05ef,
-    'Arabic_kasra': 0x05f0,
-    'Arabic_shadda': 0x05f1,
-    'Arabic_sukun': 0x05f2,
-    'Arabic_madda_above': 0x1000653,
-    'Arabic_hamza_above': 0x1000654,
-    'Arabic_hamza_below': 0x1000655,
-    'Arabic_jeh': 0x1000698,
-    'Arabic_veh': 0x10006a4,
-    'Arabic_keheh': 0x10006a9,
-    'Arabic_gaf': 0x10006af,
-    'Arabic_noon_ghunna': 0x10006ba,
-    'Arabic_heh_doachashmee': 0x10006be,
-    'Farsi_yeh': 0x10006cc,
-    'Arabic_farsi_yeh': 0x10006cc,
-    'Arabic_yeh_baree': 0x10006d2,
-    'Arabic_heh_goal': 0x10006c1,
-    'Arabic_switch': 0xff7e,
-    'Cyrillic_GHE_bar': 0x1000492,
-    'Cyrillic_ghe_bar': 0x1000493,
-    'Cyrillic_ZHE_descender': 0x1000496,
-    'Cyrillic_zhe_descender': 0x1000497,
-    'Cyrillic_KA_descender': 0x100049a,
-    'Cyrillic_ka_descender': 0x100049b,
-    'Cyrillic_KA_vertstroke': 0x100049c,
-    'Cyrillic_ka_vertstroke': 0x100049d,
-    'Cyrillic_EN_descender': 0x10004a2,
-    'Cyrillic_en_descender': 0x10004a3,
-    'Cyrillic_U_straight': 0x10004ae,
-    'Cyrillic_u_straight': 0x10004af,
-    'Cyrillic_U_straight_bar': 0x10004b0,
-    'Cyrillic_u_straight_bar': 0x10004b1,
-    'Cyrillic_HA_descender': 0x10004b2,
-    'Cyrillic_ha_descender': 0x10004b3,
-    'Cyrillic_CHE_descender': 0x10004b6,
-    'Cyrillic_che_descender': 0x10004b7,
-    'Cyrillic_CHE_vertstroke': 0x10004b8,
-    'Cyrillic_che_vertstroke': 0x10004b9,
-    'Cyrillic_SHHA': 0x10004ba,
-    'Cyrillic_shha': 0x10004bb,
-    'Cyrillic_SCHWA': 0x10004d8,
-    'Cyrillic_schwa': 0x10004d9,
-    'Cyrillic_I_macron': 0x10004e2,
-    'Cyrillic_i_macron': 0x10004e3,
-    'Cyrillic_O_bar': 0x10004e8,
-    'Cyrillic_o_bar': 0x10004e9,
-    'Cyrillic_U_macron': 0x10004ee,
-    'Cyrillic_u_macron': 0x10004ef,
-    'Serbian_dje': 0x06a1,
-    'Macedonia_gje': 0x06a2,
-    'Cyrillic_io': 0x06a3,
-    'Ukrainian_ie': 0x06a4,
-    'Ukranian_je': 0x06a4,
-    'Macedonia_dse': 0x06a5,
-    'Ukrainian_i': 0x06a6,
-    'Ukranian_i': 0x06a6,
-    'Ukrainian_yi': 0x06a7,
-    'Ukranian_yi': 0x06a7,
-    'Cyrillic_je': 0x06a8,
-    'Serbian_je': 0x06a8,
-    'Cyrillic_lje': 0x06a9,
-    'Serbian_lje': 0x06a9,
-    'Cyrillic_nje': 0x06aa,
-    'Serbian_nje': 0x06aa,
-    'Serbian_tshe': 0x06ab,
-    'Macedonia_kje': 0x06ac,
-    'Ukrainian_ghe_with_upturn': 0x06ad,
-    'Byelorussian_shortu': 0x06ae,
-    'Cyrillic_dzhe': 0x06af,
-    'Serbian_dze': 0x06af,
-    'numerosign': 0x06b0,
-    'Serbian_DJE': 0x06b1,
-    'Macedonia_GJE': 0x06b2,
-    'Cyrillic_IO': 0x06b3,
-    'Ukrainian_IE': 0x06b4,
-    'Ukranian_JE': 0x06b4,
-    'Macedonia_DSE': 0x06b5,
-    'Ukrainian_I': 0x06b6,
-    'Ukranian_I': 0x06b6,
-    'Ukrainian_YI': 0x06b7,
-    'Ukranian_YI': 0x06b7,
-    'Cyrillic_JE': 0x06b8,
-    'Serbian_JE': 0x06b8,
-    'Cyrillic_LJE': 0x06b9,
-    'Serbian_LJE': 0x06b9,
-    'Cyrillic_NJE': 0x06ba,
-    'Serbian_NJE': 0x06ba,
-    'Serbian_TSHE': 0x06bb,
-    'Macedonia_KJE': 0x06bc,
-    'Ukrainian_GHE_WITH_UPTURN': 0x06bd,
-    'Byelorussian_SHORTU': 0x06be,
-    'Cyrillic_DZHE': 0x06bf,
-    'Serbian_DZE': 0x06bf,
-    'Cyrillic_yu': 0x06c0,
-    'Cyrillic_a': 0x06c1,
-    'Cyrillic_be': 0x06c2,
-    'Cyrillic_tse': 0x06c3,
-    'Cyrillic_de': 0x06c4,
-    'Cyrillic_ie': 0x06c5,
-    'Cyrillic_ef': 0x06c6,
-    'Cyrillic_ghe': 0x06c7,
-    'Cyrillic_ha': 0x06c8,
-    'Cyrillic_i': 0x06c9,
-    'Cyrillic_shorti': 0x06ca,
-    'Cyrillic_ka': 0x06cb,
-    'Cyrillic_el': 0x06cc,
-    'Cyrillic_em': 0x06cd,
-    'Cyrillic_en': 0x06ce,
-    'Cyrillic_o': 0x06cf,
-    'Cyrillic_pe': 0x06d0,
-    'Cyrillic_ya': 0x06d1,
-    'Cyrillic_er': 0x06d2,
-    'Cyrillic_es': 0x06d3,
-    'Cyrillic_te': 0x06d4,
-    'Cyrillic_u': 0x06d5,
-    'Cyrillic_zhe': 0x06d6,
-    'Cyrillic_ve': 0x06d7,
-    'Cyrillic_softsign': 0x06d8,
-    'Cyrillic_yeru': 0x06d9,
-    'Cyrillic_ze': 0x06da,
-    'Cyrillic_sha': 0x06db,
-    'Cyrillic_e': 0x06dc,
-    'Cyrillic_shcha': 0x06dd,
-    'Cyrillic_che': 0x06de,
-    'Cyrillic_hardsign': 0x06df,
-    'Cyrillic_YU': 0x06e0,
-    'Cyrillic_A': 0x06e1,
-    'Cyrillic_BE': 0x06e2,
-    'Cyrillic_TSE': 0x06e3,
-    'Cyrillic_DE': 0x06e4,
-    'Cyrillic_IE': 0x06e5,
-    'Cyrillic_EF': 0x06e6,
-    'Cyrillic_GHE': 0x06e7,
-    'Cyrillic_HA': 0x06e8,
-    'Cyrillic_I': 0x06e9,
-    'Cyrillic_SHORTI': 0x06ea,
-    'Cyrillic_KA': 0x06eb,
-    'Cyrillic_EL': 0x06ec,
-    'Cyrillic_EM': 0x06ed,
-    'Cyrillic_EN': 0x06ee,
-    'Cyrillic_O': 0x06ef,
-    'Cyrillic_PE': 0x06f0,
-    'Cyrillic_YA': 0x06f1,
-    'Cyrillic_ER': 0x06f2,
-    'Cyrillic_ES': 0x06f3,
-    'Cyrillic_TE': 0x06f4,
-    'Cyrillic_U': 0x06f5,
-    'Cyrillic_ZHE': 0x06f6,
-    'Cyrillic_VE': 0x06f7,
-    'Cyrillic_SOFTSIGN': 0x06f8,
-    'Cyrillic_YERU': 0x06f9,
-    'Cyrillic_ZE': 0x06fa,
-    'Cyrillic_SHA': 0x06fb,
-    'Cyrillic_E': 0x06fc,
-    'Cyrillic_SHCHA': 0x06fd,
-    'Cyrillic_CHE': 0x06fe,
-    'Cyrillic_HARDSIGN': 0x06ff,
-    'Greek_ALPHAaccent': 0x07a1,
-    'Greek_EPSILONaccent': 0x07a2,
-    'Greek_ETAaccent': 0x07a3,
-    'Greek_IOTAaccent': 0x07a4,
-    'Greek_IOTAdieresis': 0x07a5,
-    'Greek_IOTAdiaeresis': 0x07a5,
-    'Greek_OMICRONaccent': 0x07a7,
-    'Greek_UPSILONaccent': 0x07a8,
-    'Greek_UPSILONdieresis': 0x07a9,
-    'Greek_OMEGAaccent': 0x07ab,
-    'Greek_accentdieresis': 0x07ae,
-    'Greek_horizbar': 0x07af,
-    'Greek_alphaaccent': 0x07b1,
-    'Greek_epsilonaccent': 0x07b2,
-    'Greek_etaaccent': 0x07b3,
-    'Greek_iotaaccent': 0x07b4,
-    'Greek_iotadieresis': 0x07b5,
-    'Greek_iotaaccentdieresis': 0x07b6,
-    'Greek_omicronaccent': 0x07b7,
-    'Greek_upsilonaccent': 0x07b8,
-    'Greek_upsilondieresis': 0x07b9,
-    'Greek_upsilonaccentdieresis': 0x07ba,
-    'Greek_omegaaccent': 0x07bb,
-    'Greek_ALPHA': 0x07c1,
-    'Greek_BETA': 0x07c2,
-    'Greek_GAMMA': 0x07c3,
-    'Greek_DELTA': 0x07c4,
-    'Greek_EPSILON': 0x07c5,
-    'Greek_ZETA': 0x07c6,
-    'Greek_ETA': 0x07c7,
-    'Greek_THETA': 0x07c8,
-    'Greek_IOTA': 0x07c9,
-    'Greek_KAPPA': 0x07ca,
-    'Greek_LAMDA': 0x07cb,
-    'Greek_LAMBDA': 0x07cb,
-    'Greek_MU': 0x07cc,
-    'Greek_NU': 0x07cd,
-    'Greek_XI': 0x07ce,
-    'Greek_OMICRON': 0x07cf,
-    'Greek_PI': 0x07d0,
-    'Greek_RHO': 0x07d1,
-    'Greek_SIGMA': 0x07d2,
-    'Greek_TAU': 0x07d4,
-    'Greek_UPSILON': 0x07d5,
-    'Greek_PHI': 0x07d6,
-    'Greek_CHI': 0x07d7,
-    'Greek_PSI': 0x07d8,
-    'Greek_OMEGA': 0x07d9,
-    'Greek_alpha': 0x07e1,
-    'Greek_beta': 0x07e2,
-    'Greek_gamma': 0x07e3,
-    'Greek_delta': 0x07e4,
-    'Greek_epsilon': 0x07e5,
-    'Greek_zeta': 0x07e6,
-    'Greek_eta': 0x07e7,
-    'Greek_theta': 0x07e8,
-    'Greek_iota': 0x07e9,
-    'Greek_kappa': 0x07ea,
-    'Greek_lamda': 0x07eb,
-    'Greek_lambda': 0x07eb,
-    'Greek_mu': 0x07ec,
-    'Greek_nu': 0x07ed,
-    'Greek_xi': 0x07ee,
-    'Greek_omicron': 0x07ef,
-    'Greek_pi': 0x07f0,
-    'Greek_rho': 0x07f1,
-    'Greek_sigma': 0x07f2,
-    'Greek_finalsmallsigma': 0x07f3,
-    'Greek_tau': 0x07f4,
-    'Greek_upsilon': 0x07f5,
-    'Greek_phi': 0x07f6,
-    'Greek_chi': 0x07f7,
-    'Greek_psi': 0x07f8,
-    'Greek_omega': 0x07f9,
-    'Greek_switch': 0xff7e,
-    'leftradical': 0x08a1,
-    'topleftradical': 0x08a2,
-    'horizconnector': 0x08a3,
-    'topintegral': 0x08a4,
-    'botintegral': 0x08a5,
-    'vertconnector': 0x08a6,
-    'topleftsqbracket': 0x08a7,
-    'botleftsqbracket': 0x08a8,
-    'toprightsqbracket': 0x08a9,
-    'botrightsqbracket': 0x08aa,
-    'topleftparens': 0x08ab,
-    'botleftparens': 0x08ac,
-    'toprightparens': 0x08ad,
-    'botrightparens': 0x08ae,
-    'leftmiddlecurlybrace': 0x08af,
-    'rightmiddlecurlybrace': 0x08b0,
-    'topleftsummation': 0x08b1,
-    'botleftsummation': 0x08b2,
-    'topvertsummationconnector': 0x08b3,
-    'botvertsummationconnector': 0x08b4,
-    'toprightsummation': 0x08b5,
-    'botrightsummation': 0x08b6,
-    'rightmiddlesummation': 0x08b7,
-    'lessthanequal': 0x08bc,
-    'notequal': 0x08bd,
-    'greaterthanequal': 0x08be,
-    'integral': 0x08bf,
-    'therefore': 0x08c0,
-    'variation': 0x08c1,
-    'infinity': 0x08c2,
-    'nabla': 0x08c5,
-    'approximate': 0x08c8,
-    'similarequal': 0x08c9,
-    'ifonlyif': 0x08cd,
-    'implies': 0x08ce,
-    'identical': 0x08cf,
-    'radical': 0x08d6,
-    'includedin': 0x08da,
-    'includes': 0x08db,
-    'intersection': 0x08dc,
-    'union': 0x08dd,
-    'logicaland': 0x08de,
-    'logicalor': 0x08df,
-    'partialderivative': 0x08ef,
-    'function': 0x08f6,
-    'leftarrow': 0x08fb,
-    'uparrow': 0x08fc,
-    'rightarrow': 0x08fd,
-    'downarrow': 0x08fe,
-    'blank': 0x09df,
-    'soliddiamond': 0x09e0,
-    'checkerboard': 0x09e1,
-    'ht': 0x09e2,
-    'ff': 0x09e3,
-    'cr': 0x09e4,
-    'lf': 0x09e5,
-    'nl': 0x09e8,
-    'vt': 0x09e9,
-    'lowrightcorner': 0x09ea,
-    'uprightcorner': 0x09eb,
-    'upleftcorner': 0x09ec,
-    'lowleftcorner': 0x09ed,
-    'crossinglines': 0x09ee,
-    'horizlinescan1': 0x09ef,
-    'horizlinescan3': 0x09f0,
-    'horizlinescan5': 0x09f1,
-    'horizlinescan7': 0x09f2,
-    'horizlinescan9': 0x09f3,
-    'leftt': 0x09f4,
-    'rightt': 0x09f5,
-    'bott': 0x09f6,
-    'topt': 0x09f7,
-    'vertbar': 0x09f8,
-    'emspace': 0x0aa1,
-    'enspace': 0x0aa2,
-    'em3space': 0x0aa3,
-    'em4space': 0x0aa4,
-    'digitspace': 0x0aa5,
-    'punctspace': 0x0aa6,
-    'thinspace': 0x0aa7,
-    'hairspace': 0x0aa8,
-    'emdash': 0x0aa9,
-    'endash': 0x0aaa,
-    'signifblank': 0x0aac,
-    'ellipsis': 0x0aae,
-    'doubbaselinedot': 0x0aaf,
-    'onethird': 0x0ab0,
-    'twothirds': 0x0ab1,
-    'onefifth': 0x0ab2,
-    'twofifths': 0x0ab3,
-    'threefifths': 0x0ab4,
-    'fourfifths': 0x0ab5,
-    'onesixth': 0x0ab6,
-    'fivesixths': 0x0ab7,
-    'careof': 0x0ab8,
-    'figdash': 0x0abb,
-    'leftanglebracket': 0x0abc,
-    'decimalpoint': 0x0abd,
-    'rightanglebracket': 0x0abe,
-    'marker': 0x0abf,
-    'oneeighth': 0x0ac3,
-    'threeeighths': 0x0ac4,
-    'fiveeighths': 0x0ac5,
-    'seveneighths': 0x0ac6,
-    'trademark': 0x0ac9,
-    'signaturemark': 0x0aca,
-    'trademarkincircle': 0x0acb,
-    'leftopentriangle': 0x0acc,
-    'rightopentriangle': 0x0acd,
-    'emopencircle': 0x0ace,
-    'emopenrectangle': 0x0acf,
-    'leftsinglequotemark': 0x0ad0,
-    'rightsinglequotemark': 0x0ad1,
-    'leftdoublequotemark': 0x0ad2,
-    'rightdoublequotemark': 0x0ad3,
-    'prescription': 0x0ad4,
-    'minutes': 0x0ad6,
-    'seconds': 0x0ad7,
-    'latincross': 0x0ad9,
-    'hexagram': 0x0ada,
-    'filledrectbullet': 0x0adb,
-    'filledlefttribullet': 0x0adc,
-    'filledrighttribullet': 0x0add,
-    'emfilledcircle': 0x0ade,
-    'emfilledrect': 0x0adf,
-    'enopencircbullet': 0x0ae0,
-    'enopensquarebullet': 0x0ae1,
-    'openrectbullet': 0x0ae2,
-    'opentribulletup': 0x0ae3,
-    'opentribulletdown': 0x0ae4,
-    'openstar': 0x0ae5,
-    'enfilledcircbullet': 0x0ae6,
-    'enfilledsqbullet': 0x0ae7,
-    'filledtribulletup': 0x0ae8,
-    'filledtribulletdown': 0x0ae9,
-    'leftpointer': 0x0aea,
-    'rightpointer': 0x0aeb,
-    'club': 0x0aec,
-    'diamond': 0x0aed,
-    'heart': 0x0aee,
-    'maltesecross': 0x0af0,
-    'dagger': 0x0af1,
-    'doubledagger': 0x0af2,
-    'checkmark': 0x0af3,
-    'ballotcross': 0x0af4,
-    'musicalsharp': 0x0af5,
-    'musicalflat': 0x0af6,
-    'malesymbol': 0x0af7,
-    'femalesymbol': 0x0af8,
-    'telephone': 0x0af9,
-    'telephonerecorder': 0x0afa,
-    'phonographcopyright': 0x0afb,
-    'caret': 0x0afc,
-    'singlelowquotemark': 0x0afd,
-    'doublelowquotemark': 0x0afe,
-    'cursor': 0x0aff,
-    'leftcaret': 0x0ba3,
-    'rightcaret': 0x0ba6,
-    'downcaret': 0x0ba8,
-    'upcaret': 0x0ba9,
-    'overbar': 0x0bc0,
-    'downtack': 0x0bc2,
-    'upshoe': 0x0bc3,
-    'downstile': 0x0bc4,
-    'underbar': 0x0bc6,
-    'jot': 0x0bca,
-    'quad': 0x0bcc,
-    'uptack': 0x0bce,
-    'circle': 0x0bcf,
-    'upstile': 0x0bd3,
-    'downshoe': 0x0bd6,
-    'rightshoe': 0x0bd8,
-    'leftshoe': 0x0bda,
-    'lefttack': 0x0bdc,
-    'righttack': 0x0bfc,
-    'hebrew_doublelowline': 0x0cdf,
-    'hebrew_aleph': 0x0ce0,
-    'hebrew_bet': 0x0ce1,
-    'hebrew_beth': 0x0ce1,
-    'hebrew_gimel': 0x0ce2,
-    'hebrew_gimmel': 0x0ce2,
-    'hebrew_dalet': 0x0ce3,
-    'hebrew_daleth': 0x0ce3,
-    'hebrew_he': 0x0ce4,
-    'hebrew_waw': 0x0ce5,
-    'hebrew_zain': 0x0ce6,
-    'hebrew_zayin': 0x0ce6,
-    'hebrew_chet': 0x0ce7,
-    'hebrew_het': 0x0ce7,
-    'hebrew_tet': 0x0ce8,
-    'hebrew_teth': 0x0ce8,
-    'hebrew_yod': 0x0ce9,
-    'hebrew_finalkaph': 0x0cea,
-    'hebrew_kaph': 0x0ceb,
-    'hebrew_lamed': 0x0cec,
-    'hebrew_finalmem': 0x0ced,
-    'hebrew_mem': 0x0cee,
-    'hebrew_finalnun': 0x0cef,
-    'hebrew_nun': 0x0cf0,
-    'hebrew_samech': 0x0cf1,
-    'hebrew_samekh': 0x0cf1,
-    'hebrew_ayin': 0x0cf2,
-    'hebrew_finalpe': 0x0cf3,
-    'hebrew_pe': 0x0cf4,
-    'hebrew_finalzade': 0x0cf5,
-    'hebrew_finalzadi': 0x0cf5,
-    'hebrew_zade': 0x0cf6,
-    'hebrew_zadi': 0x0cf6,
-    'hebrew_qoph': 0x0cf7,
-    'hebrew_kuf': 0x0cf7,
-    'hebrew_resh': 0x0cf8,
-    'hebrew_shin': 0x0cf9,
-    'hebrew_taw': 0x0cfa,
-    'hebrew_taf': 0x0cfa,
-    'Hebrew_switch': 0xff7e,
-    'Thai_kokai': 0x0da1,
-    'Thai_khokhai': 0x0da2,
-    'Thai_khokhuat': 0x0da3,
-    'Thai_khokhwai': 0x0da4,
-    'Thai_khokhon': 0x0da5,
-    'Thai_khorakhang': 0x0da6,
-    'Thai_ngongu': 0x0da7,
-    'Thai_chochan': 0x0da8,
-    'Thai_choching': 0x0da9,
-    'Thai_chochang': 0x0daa,
-    'Thai_soso': 0x0dab,
-    'Thai_chochoe': 0x0dac,
-    'Thai_yoying': 0x0dad,
-    'Thai_dochada': 0x0dae,
-    'Thai_topatak': 0x0daf,
-    'Thai_thothan': 0x0db0,
-    'Thai_thonangmontho': 0x0db1,
-    'Thai_thophuthao': 0x0db2,
-    'Thai_nonen': 0x0db3,
-    'Thai_dodek': 0x0db4,
-    'Thai_totao': 0x0db5,
-    'Thai_thothung': 0x0db6,
-    'Thai_thothahan': 0x0db7,
-    'Thai_thothong': 0x0db8,
-    'Thai_nonu': 0x0db9,
-    'Thai_bobaimai': 0x0dba,
-    'Thai_popla': 0x0dbb,
-    'Thai_phophung': 0x0dbc,
-    'Thai_fofa': 0x0dbd,
-    'Thai_phophan': 0x0dbe,
-    'Thai_fofan': 0x0dbf,
-    'Thai_phosamphao': 0x0dc0,
-    'Thai_moma': 0x0dc1,
-    'Thai_yoyak': 0x0dc2,
-    'Thai_rorua': 0x0dc3,
-    'Thai_ru': 0x0dc4,
-    'Thai_loling': 0x0dc5,
-    'Thai_lu': 0x0dc6,
-    'Thai_wowaen': 0x0dc7,
-    'Thai_sosala': 0x0dc8,
-    'Thai_sorusi': 0x0dc9,
-    'Thai_sosua': 0x0dca,
-    'Thai_hohip': 0x0dcb,
-    'Thai_lochula': 0x0dcc,
-    'Thai_oang': 0x0dcd,
-    'Thai_honokhuk': 0x0dce,
-    'Thai_paiyannoi': 0x0dcf,
-    'Thai_saraa': 0x0dd0,
-    'Thai_maihanakat': 0x0dd1,
-    'Thai_saraaa': 0x0dd2,
-    'Thai_saraam': 0x0dd3,
-    'Thai_sarai': 0x0dd4,
-    'Thai_saraii': 0x0dd5,
-    'Thai_saraue': 0x0dd6,
-    'Thai_sarauee': 0x0dd7,
-    'Thai_sarau': 0x0dd8,
-    'Thai_sarauu': 0x0dd9,
-    'Thai_phinthu': 0x0dda,
-    'Thai_maihanakat_maitho': 0x0dde,
-    'Thai_baht': 0x0ddf,
-    'Thai_sarae': 0x0de0,
-    'Thai_saraae': 0x0de1,
-    'Thai_sarao': 0x0de2,
-    'Thai_saraaimaimuan': 0x0de3,
-    'Thai_saraaimaimalai': 0x0de4,
-    'Thai_lakkhangyao': 0x0de5,
-    'Thai_maiyamok': 0x0de6,
-    'Thai_maitaikhu': 0x0de7,
-    'Thai_maiek': 0x0de8,
-    'Thai_maitho': 0x0de9,
-    'Thai_maitri': 0x0dea,
-    'Thai_maichattawa': 0x0deb,
-    'Thai_thanthakhat': 0x0dec,
-    'Thai_nikhahit': 0x0ded,
-    'Thai_leksun': 0x0df0,
-    'Thai_leknung': 0x0df1,
-    'Thai_leksong': 0x0df2,
-    'Thai_leksam': 0x0df3,
-    'Thai_leksi': 0x0df4,
-    'Thai_lekha': 0x0df5,
-    'Thai_lekhok': 0x0df6,
-    'Thai_lekchet': 0x0df7,
-    'Thai_lekpaet': 0x0df8,
-    'Thai_lekkao': 0x0df9,
-    'Hangul': 0xff31,
-    'Hangul_Start': 0xff32,
-    'Hangul_End': 0xff33,
-    'Hangul_Hanja': 0xff34,
-    'Hangul_Jamo': 0xff35,
-    'Hangul_Romaja': 0xff36,
-    'Hangul_Codeinput': 0xff37,
-    'Hangul_Jeonja': 0xff38,
-    'Hangul_Banja': 0xff39,
-    'Hangul_PreHanja': 0xff3a,
-    'Hangul_PostHanja': 0xff3b,
-    'Hangul_SingleCandidate': 0xff3c,
-    'Hangul_MultipleCandidate': 0xff3d,
-    'Hangul_PreviousCandidate': 0xff3e,
-    'Hangul_Special': 0xff3f,
-    'Hangul_switch': 0xff7e,
-    'Hangul_Kiyeog': 0x0ea1,
-    'Hangul_SsangKiyeog': 0x0ea2,
-    'Hangul_KiyeogSios': 0x0ea3,
-    'Hangul_Nieun': 0x0ea4,
-    'Hangul_NieunJieuj': 0x0ea5,
-    'Hangul_NieunHieuh': 0x0ea6,
-    'Hangul_Dikeud': 0x0ea7,
-    'Hangul_SsangDikeud': 0x0ea8,
-    'Hangul_Rieul': 0x0ea9,
-    'Hangul_RieulKiyeog': 0x0eaa,
-    'Hangul_RieulMieum': 0x0eab,
-    'Hangul_RieulPieub': 0x0eac,
-    'Hangul_RieulSios': 0x0ead,
-    'Hangul_RieulTieut': 0x0eae,
-    'Hangul_RieulPhieuf': 0x0eaf,
-    'Hangul_RieulHieuh': 0x0eb0,
-    'Hangul_Mieum': 0x0eb1,
-    'Hangul_Pieub': 0x0eb2,
-    'Hangul_SsangPieub': 0x0eb3,
-    'Hangul_PieubSios': 0x0eb4,
-    'Hangul_Sios': 0x0eb5,
-    'Hangul_SsangSios': 0x0eb6,
-    'Hangul_Ieung': 0x0eb7,
-    'Hangul_Jieuj': 0x0eb8,
-    'Hangul_SsangJieuj': 0x0eb9,
-    'Hangul_Cieuc': 0x0eba,
-    'Hangul_Khieuq': 0x0ebb,
-    'Hangul_Tieut': 0x0ebc,
-    'Hangul_Phieuf': 0x0ebd,
-    'Hangul_Hieuh': 0x0ebe,
-    'Hangul_A': 0x0ebf,
-    'Hangul_AE': 0x0ec0,
-    'Hangul_YA': 0x0ec1,
-    'Hangul_YAE': 0x0ec2,
-    'Hangul_EO': 0x0ec3,
-    'Hangul_E': 0x0ec4,
-    'Hangul_YEO': 0x0ec5,
-    'Hangul_YE': 0x0ec6,
-    'Hangul_O': 0x0ec7,
-    'Hangul_WA': 0x0ec8,
-    'Hangul_WAE': 0x0ec9,
-    'Hangul_OE': 0x0eca,
-    'Hangul_YO': 0x0ecb,
-    'Hangul_U': 0x0ecc,
-    'Hangul_WEO': 0x0ecd,
-    'Hangul_WE': 0x0ece,
-    'Hangul_WI': 0x0ecf,
-    'Hangul_YU': 0x0ed0,
-    'Hangul_EU': 0x0ed1,
-    'Hangul_YI': 0x0ed2,
-    'Hangul_I': 0x0ed3,
-    'Hangul_J_Kiyeog': 0x0ed4,
-    'Hangul_J_SsangKiyeog': 0x0ed5,
-    'Hangul_J_KiyeogSios': 0x0ed6,
-    'Hangul_J_Nieun': 0x0ed7,
-    'Hangul_J_NieunJieuj': 0x0ed8,
-    'Hangul_J_NieunHieuh': 0x0ed9,
-    'Hangul_J_Dikeud': 0x0eda,
-    'Hangul_J_Rieul': 0x0edb,
-    'Hangul_J_RieulKiyeog': 0x0edc,
-    'Hangul_J_RieulMieum': 0x0edd,
-    'Hangul_J_RieulPieub': 0x0ede,
-    'Hangul_J_RieulSios': 0x0edf,
-    'Hangul_J_RieulTieut': 0x0ee0,
-    'Hangul_J_RieulPhieuf': 0x0ee1,
-    'Hangul_J_RieulHieuh': 0x0ee2,
-    'Hangul_J_Mieum': 0x0ee3,
-    'Hangul_J_Pieub': 0x0ee4,
-    'Hangul_J_PieubSios': 0x0ee5,
-    'Hangul_J_Sios': 0x0ee6,
-    'Hangul_J_SsangSios': 0x0ee7,
-    'Hangul_J_Ieung': 0x0ee8,
-    'Hangul_J_Jieuj': 0x0ee9,
-    'Hangul_J_Cieuc': 0x0eea,
-    'Hangul_J_Khieuq': 0x0eeb,
-    'Hangul_J_Tieut': 0x0eec,
-    'Hangul_J_Phieuf': 0x0eed,
-    'Hangul_J_Hieuh': 0x0eee,
-    'Hangul_RieulYeorinHieuh': 0x0eef,
-    'Hangul_SunkyeongeumMieum': 0x0ef0,
-    'Hangul_SunkyeongeumPieub': 0x0ef1,
-    'Hangul_PanSios': 0x0ef2,
-    'Hangul_KkogjiDalrinIeung': 0x0ef3,
-    'Hangul_SunkyeongeumPhieuf': 0x0ef4,
-    'Hangul_YeorinHieuh': 0x0ef5,
-    'Hangul_AraeA': 0x0ef6,
-    'Hangul_AraeAE': 0x0ef7,
-    'Hangul_J_PanSios': 0x0ef8,
-    'Hangul_J_KkogjiDalrinIeung': 0x0ef9,
-    'Hangul_J_YeorinHieuh': 0x0efa,
-    'Korean_Won': 0x0eff,
-    'Armenian_ligature_ew': 0x1000587,
-    'Armenian_full_stop': 0x1000589,
-    'Armenian_verjaket': 0x1000589,
-    'Armenian_separation_mark': 0x100055d,
-    'Armenian_but': 0x100055d,
-    'Armenian_hyphen': 0x100058a,
-    'Armenian_yentamna': 0x100058a,
-    'Armenian_exclam': 0x100055c,
-    'Armenian_amanak': 0x100055c,
-    'Armenian_accent': 0x100055b,
-    'Armenian_shesht': 0x100055b,
-    'Armenian_question': 0x100055e,
-    'Armenian_paruyk': 0x100055e,
-    'Armenian_AYB': 0x1000531,
-    'Armenian_ayb': 0x1000561,
-    'Armenian_BEN': 0x1000532,
-    'Armenian_ben': 0x1000562,
-    'Armenian_GIM': 0x1000533,
-    'Armenian_gim': 0x1000563,
-    'Armenian_DA': 0x1000534,
-    'Armenian_da': 0x1000564,
-    'Armenian_YECH': 0x1000535,
-    'Armenian_yech': 0x1000565,
-    'Armenian_ZA': 0x1000536,
-    'Armenian_za': 0x1000566,
-    'Armenian_E': 0x1000537,
-    'Armenian_e': 0x1000567,
-    'Armenian_AT': 0x1000538,
-    'Armenian_at': 0x1000568,
-    'Armenian_TO': 0x1000539,
-    'Armenian_to': 0x1000569,
-    'Armenian_ZHE': 0x100053a,
-    'Armenian_zhe': 0x100056a,
-    'Armenian_INI': 0x100053b,
-    'Armenian_ini': 0x100056b,
-    'Armenian_LYUN': 0x100053c,
-    'Armenian_lyun': 0x100056c,
-    'Armenian_KHE': 0x100053d,
-    'Armenian_khe': 0x100056d,
-    'Armenian_TSA': 0x100053e,
-    'Armenian_tsa': 0x100056e,
-    'Armenian_KEN': 0x100053f,
-    'Armenian_ken': 0x100056f,
-    'Armenian_HO': 0x1000540,
-    'Armenian_ho': 0x1000570,
-    'Armenian_DZA': 0x1000541,
-    'Armenian_dza': 0x1000571,
-    'Armenian_GHAT': 0x1000542,
-    'Armenian_ghat': 0x1000572,
-    'Armenian_TCHE': 0x1000543,
-    'Armenian_tche': 0x1000573,
-    'Armenian_MEN': 0x1000544,
-    'Armenian_men': 0x1000574,
-    'Armenian_HI': 0x1000545,
-    'Armenian_hi': 0x1000575,
-    'Armenian_NU': 0x1000546,
-    'Armenian_nu': 0x1000576,
-    'Armenian_SHA': 0x1000547,
-    'Armenian_sha': 0x1000577,
-    'Armenian_VO': 0x1000548,
-    'Armenian_vo': 0x1000578,
-    'Armenian_CHA': 0x1000549,
-    'Armenian_cha': 0x1000579,
-    'Armenian_PE': 0x100054a,
-    'Armenian_pe': 0x100057a,
-    'Armenian_JE': 0x100054b,
-    'Armenian_je': 0x100057b,
-    'Armenian_RA': 0x100054c,
-    'Armenian_ra': 0x100057c,
-    'Armenian_SE': 0x100054d,
-    'Armenian_se': 0x100057d,
-    'Armenian_VEV': 0x100054e,
-    'Armenian_vev': 0x100057e,
-    'Armenian_TYUN': 0x100054f,
-    'Armenian_tyun': 0x100057f,
-    'Armenian_RE': 0x1000550,
-    'Armenian_re': 0x1000580,
-    'Armenian_TSO': 0x1000551,
-    'Armenian_tso': 0x1000581,
-    'Armenian_VYUN': 0x1000552,
-    'Armenian_vyun': 0x1000582,
-    'Armenian_PYUR': 0x1000553,
-    'Armenian_pyur': 0x1000583,
-    'Armenian_KE': 0x1000554,
-    'Armenian_ke': 0x1000584,
-    'Armenian_O': 0x1000555,
-    'Armenian_o': 0x1000585,
-    'Armenian_FE': 0x1000556,
-    'Armenian_fe': 0x1000586,
-    'Armenian_apostrophe': 0x100055a,
-    'Georgian_an': 0x10010d0,
-    'Georgian_ban': 0x10010d1,
-    'Georgian_gan': 0x10010d2,
-    'Georgian_don': 0x10010d3,
-    'Georgian_en': 0x10010d4,
-    'Georgian_vin': 0x10010d5,
-    'Georgian_zen': 0x10010d6,
-    'Georgian_tan': 0x10010d7,
-    'Georgian_in': 0x10010d8,
-    'Georgian_kan': 0x10010d9,
-    'Georgian_las': 0x10010da,
-    'Georgian_man': 0x10010db,
-    'Georgian_nar': 0x10010dc,
-    'Georgian_on': 0x10010dd,
-    'Georgian_par': 0x10010de,
-    'Georgian_zhar': 0x10010df,
-    'Georgian_rae': 0x10010e0,
-    'Georgian_san': 0x10010e1,
-    'Georgian_tar': 0x10010e2,
-    'Georgian_un': 0x10010e3,
-    'Georgian_phar': 0x10010e4,
-    'Georgian_khar': 0x10010e5,
-    'Georgian_ghan': 0x10010e6,
-    'Georgian_qar': 0x10010e7,
-    'Georgian_shin': 0x10010e8,
-    'Georgian_chin': 0x10010e9,
-    'Georgian_can': 0x10010ea,
-    'Georgian_jil': 0x10010eb,
-    'Georgian_cil': 0x10010ec,
-    'Georgian_char': 0x10010ed,
-    'Georgian_xan': 0x10010ee,
-    'Georgian_jhan': 0x10010ef,
-    'Georgian_hae': 0x10010f0,
-    'Georgian_he': 0x10010f1,
-    'Georgian_hie': 0x10010f2,
-    'Georgian_we': 0x10010f3,
-    'Georgian_har': 0x10010f4,
-    'Georgian_hoe': 0x10010f5,
-    'Georgian_fi': 0x10010f6,
-    'Xabovedot': 0x1001e8a,
-    'Ibreve': 0x100012c,
-    'Zstroke': 0x10001b5,
-    'Gcaron': 0x10001e6,
-    'Ocaron': 0x10001d1,
-    'Obarred': 0x100019f,
-    'xabovedot': 0x1001e8b,
-    'ibreve': 0x100012d,
-    'zstroke': 0x10001b6,
-    'gcaron': 0x10001e7,
-    'ocaron': 0x10001d2,
-    'obarred': 0x1000275,
-    'SCHWA': 0x100018f,
-    'schwa': 0x1000259,
-    'Lbelowdot': 0x1001e36,
-    'lbelowdot': 0x1001e37,
-    'Abelowdot': 0x1001ea0,
-    'abelowdot': 0x1001ea1,
-    'Ahook': 0x1001ea2,
-    'ahook': 0x1001ea3,
-    'Acircumflexacute': 0x1001ea4,
-    'acircumflexacute': 0x1001ea5,
-    'Acircumflexgrave': 0x1001ea6,
-    'acircumflexgrave': 0x1001ea7,
-    'Acircumflexhook': 0x1001ea8,
-    'acircumflexhook': 0x1001ea9,
-    'Acircumflextilde': 0x1001eaa,
-    'acircumflextilde': 0x1001eab,
-    'Acircumflexbelowdot': 0x1001eac,
-    'acircumflexbelowdot': 0x1001ead,
-    'Abreveacute': 0x1001eae,
-    'abreveacute': 0x1001eaf,
-    'Abrevegrave': 0x1001eb0,
-    'abrevegrave': 0x1001eb1,
-    'Abrevehook': 0x1001eb2,
-    'abrevehook': 0x1001eb3,
-    'Abrevetilde': 0x1001eb4,
-    'abrevetilde': 0x1001eb5,
-    'Abrevebelowdot': 0x1001eb6,
-    'abrevebelowdot': 0x1001eb7,
-    'Ebelowdot': 0x1001eb8,
-    'ebelowdot': 0x1001eb9,
-    'Ehook': 0x1001eba,
-    'ehook': 0x1001ebb,
-    'Etilde': 0x1001ebc,
-    'etilde': 0x1001ebd,
-    'Ecircumflexacute': 0x1001ebe,
-    'ecircumflexacute': 0x1001ebf,
-    'Ecircumflexgrave': 0x1001ec0,
-    'ecircumflexgrave': 0x1001ec1,
-    'Ecircumflexhook': 0x1001ec2,
-    'ecircumflexhook': 0x1001ec3,
-    'Ecircumflextilde': 0x1001ec4,
-    'ecircumflextilde': 0x1001ec5,
-    'Ecircumflexbelowdot': 0x1001ec6,
-    'ecircumflexbelowdot': 0x1001ec7,
-    'Ihook': 0x1001ec8,
-    'ihook': 0x1001ec9,
-    'Ibelowdot': 0x1001eca,
-    'ibelowdot': 0x1001ecb,
-    'Obelowdot': 0x1001ecc,
-    'obelowdot': 0x1001ecd,
-    'Ohook': 0x1001ece,
-    'ohook': 0x1001ecf,
-    'Ocircumflexacute': 0x1001ed0,
-    'ocircumflexacute': 0x1001ed1,
-    'Ocircumflexgrave': 0x1001ed2,
-    'ocircumflexgrave': 0x1001ed3,
-    'Ocircumflexhook': 0x1001ed4,
-    'ocircumflexhook': 0x1001ed5,
-    'Ocircumflextilde': 0x1001ed6,
-    'ocircumflextilde': 0x1001ed7,
-    'Ocircumflexbelowdot': 0x1001ed8,
-    'ocircumflexbelowdot': 0x1001ed9,
-    'Ohornacute': 0x1001eda,
-    'ohornacute': 0x1001edb,
-    'Ohorngrave': 0x1001edc,
-    'ohorngrave': 0x1001edd,
-    'Ohornhook': 0x1001ede,
-    'ohornhook': 0x1001edf,
-    'Ohorntilde': 0x1001ee0,
-    'ohorntilde': 0x1001ee1,
-    'Ohornbelowdot': 0x1001ee2,
-    'ohornbelowdot': 0x1001ee3,
-    'Ubelowdot': 0x1001ee4,
-    'ubelowdot': 0x1001ee5,
-    'Uhook': 0x1001ee6,
-    'uhook': 0x1001ee7,
-    'Uhornacute': 0x1001ee8,
-    'uhornacute': 0x1001ee9,
-    'Uhorngrave': 0x1001eea,
-    'uhorngrave': 0x1001eeb,
-    'Uhornhook': 0x1001eec,
-    'uhornhook': 0x1001eed,
-    'Uhorntilde': 0x1001eee,
-    'uhorntilde': 0x1001eef,
-    'Uhornbelowdot': 0x1001ef0,
-    'uhornbelowdot': 0x1001ef1,
-    'Ybelowdot': 0x1001ef4,
-    'ybelowdot': 0x1001ef5,
-    'Yhook': 0x1001ef6,
-    'yhook': 0x1001ef7,
-    'Ytilde': 0x1001ef8,
-    'ytilde': 0x1001ef9,
-    'Ohorn': 0x10001a0,
-    'ohorn': 0x10001a1,
-    'Uhorn': 0x10001af,
-    'uhorn': 0x10001b0,
-    'EcuSign': 0x10020a0,
-    'ColonSign': 0x10020a1,
-    'CruzeiroSign': 0x10020a2,
-    'FFrancSign': 0x10020a3,
-    'LiraSign': 0x10020a4,
-    'MillSign': 0x10020a5,
-    'NairaSign': 0x10020a6,
-    'PesetaSign': 0x10020a7,
-    'RupeeSign': 0x10020a8,
-    'WonSign': 0x10020a9,
-    'NewSheqelSign': 0x10020aa,
-    'DongSign': 0x10020ab,
-    'EuroSign': 0x20ac,
-    'zerosuperior': 0x1002070,
-    'foursuperior': 0x1002074,
-    'fivesuperior': 0x1002075,
-    'sixsuperior': 0x1002076,
-    'sevensuperior': 0x1002077,
-    'eightsuperior': 0x1002078,
-    'ninesuperior': 0x1002079,
-    'zerosubscript': 0x1002080,
-    'onesubscript': 0x1002081,
-    'twosubscript': 0x1002082,
-    'threesubscript': 0x1002083,
-    'foursubscript': 0x1002084,
-    'fivesubscript': 0x1002085,
-    'sixsubscript': 0x1002086,
-    'sevensubscript': 0x1002087,
-    'eightsubscript': 0x1002088,
-    'ninesubscript': 0x1002089,
-    'partdifferential': 0x1002202,
-    'emptyset': 0x1002205,
-    'elementof': 0x1002208,
-    'notelementof': 0x1002209,
-    'containsas': 0x100220B,
-    'squareroot': 0x100221A,
-    'cuberoot': 0x100221B,
-    'fourthroot': 0x100221C,
-    'dintegral': 0x100222C,
-    'tintegral': 0x100222D,
-    'because': 0x1002235,
-    'approxeq': 0x1002248,
-    'notapproxeq': 0x1002247,
-    'notidentical': 0x1002262,
-    'stricteq': 0x1002263,
-    'braille_dot_1': 0xfff1,
-    'braille_dot_2': 0xfff2,
-    'braille_dot_3': 0xfff3,
-    'braille_dot_4': 0xfff4,
-    'braille_dot_5': 0xfff5,
-    'braille_dot_6': 0xfff6,
-    'braille_dot_7': 0xfff7,
-    'braille_dot_8': 0xfff8,
-    'braille_dot_9': 0xfff9,
-    'braille_dot_10': 0xfffa,
-    'braille_blank': 0x1002800,
-    'braille_dots_1': 0x1002801,
-    'braille_dots_2': 0x1002802,
-    'braille_dots_12': 0x1002803,
-    'braille_dots_3': 0x1002804,
-    'braille_dots_13': 0x1002805,
-    'braille_dots_23': 0x1002806,
-    'braille_dots_123': 0x1002807,
-    'braille_dots_4': 0x1002808,
-    'braille_dots_14': 0x1002809,
-    'braille_dots_24': 0x100280a,
-    'braille_dots_124': 0x100280b,
-    'braille_dots_34': 0x100280c,
-    'braille_dots_134': 0x100280d,
-    'braille_dots_234': 0x100280e,
-    'braille_dots_1234': 0x100280f,
-    'braille_dots_5': 0x1002810,
-    'braille_dots_15': 0x1002811,
-    'braille_dots_25': 0x1002812,
-    'braille_dots_125': 0x1002813,
-    'braille_dots_35': 0x1002814,
-    'braille_dots_135': 0x1002815,
-    'braille_dots_235': 0x1002816,
-    'braille_dots_1235': 0x1002817,
-    'braille_dots_45': 0x1002818,
-    'braille_dots_145': 0x1002819,
-    'braille_dots_245': 0x100281a,
-    'braille_dots_1245': 0x100281b,
-    'braille_dots_345': 0x100281c,
-    'braille_dots_1345': 0x100281d,
-    'braille_dots_2345': 0x100281e,
-    'braille_dots_12345': 0x100281f,
-    'braille_dots_6': 0x1002820,
-    'braille_dots_16': 0x1002821,
-    'braille_dots_26': 0x1002822,
-    'braille_dots_126': 0x1002823,
-    'braille_dots_36': 0x1002824,
-    'braille_dots_136': 0x1002825,
-    'braille_dots_236': 0x1002826,
-    'braille_dots_1236': 0x1002827,
-    'braille_dots_46': 0x1002828,
-    'braille_dots_146': 0x1002829,
-    'braille_dots_246': 0x100282a,
-    'braille_dots_1246': 0x100282b,
-    'braille_dots_346': 0x100282c,
-    'braille_dots_1346': 0x100282d,
-    'braille_dots_2346': 0x100282e,
-    'braille_dots_12346': 0x100282f,
-    'braille_dots_56': 0x1002830,
-    'braille_dots_156': 0x1002831,
-    'braille_dots_256': 0x1002832,
-    'braille_dots_1256': 0x1002833,
-    'braille_dots_356': 0x1002834,
-    'braille_dots_1356': 0x1002835,
-    'braille_dots_2356': 0x1002836,
-    'braille_dots_12356': 0x1002837,
-    'braille_dots_456': 0x1002838,
-    'braille_dots_1456': 0x1002839,
-    'braille_dots_2456': 0x100283a,
-    'braille_dots_12456': 0x100283b,
-    'braille_dots_3456': 0x100283c,
-    'braille_dots_13456': 0x100283d,
-    'braille_dots_23456': 0x100283e,
-    'braille_dots_123456': 0x100283f,
-    'braille_dots_7': 0x1002840,
-    'braille_dots_17': 0x1002841,
-    'braille_dots_27': 0x1002842,
-    'braille_dots_127': 0x1002843,
-    'braille_dots_37': 0x1002844,
-    'braille_dots_137': 0x1002845,
-    'braille_dots_237': 0x1002846,
-    'braille_dots_1237': 0x1002847,
-    'braille_dots_47': 0x1002848,
-    'braille_dots_147': 0x1002849,
-    'braille_dots_247': 0x100284a,
-    'braille_dots_1247': 0x100284b,
-    'braille_dots_347': 0x100284c,
-    'braille_dots_1347': 0x100284d,
-    'braille_dots_2347': 0x100284e,
-    'braille_dots_12347': 0x100284f,
-    'braille_dots_57': 0x1002850,
-    'braille_dots_157': 0x1002851,
-    'braille_dots_257': 0x1002852,
-    'braille_dots_1257': 0x1002853,
-    'braille_dots_357': 0x1002854,
-    'braille_dots_1357': 0x1002855,
-    'braille_dots_2357': 0x1002856,
-    'braille_dots_12357': 0x1002857,
-    'braille_dots_457': 0x1002858,
-    'braille_dots_1457': 0x1002859,
-    'braille_dots_2457': 0x100285a,
-    'braille_dots_12457': 0x100285b,
-    'braille_dots_3457': 0x100285c,
-    'braille_dots_13457': 0x100285d,
-    'braille_dots_23457': 0x100285e,
-    'braille_dots_123457': 0x100285f,
-    'braille_dots_67': 0x1002860,
-    'braille_dots_167': 0x1002861,
-    'braille_dots_267': 0x1002862,
-    'braille_dots_1267': 0x1002863,
-    'braille_dots_367': 0x1002864,
-    'braille_dots_1367': 0x1002865,
-    'braille_dots_2367': 0x1002866,
-    'braille_dots_12367': 0x1002867,
-    'braille_dots_467': 0x1002868,
-    'braille_dots_1467': 0x1002869,
-    'braille_dots_2467': 0x100286a,
-    'braille_dots_12467': 0x100286b,
-    'braille_dots_3467': 0x100286c,
-    'braille_dots_13467': 0x100286d,
-    'braille_dots_23467': 0x100286e,
-    'braille_dots_123467': 0x100286f,
-    'braille_dots_567': 0x1002870,
-    'braille_dots_1567': 0x1002871,
-    'braille_dots_2567': 0x1002872,
-    'braille_dots_12567': 0x1002873,
-    'braille_dots_3567': 0x1002874,
-    'braille_dots_13567': 0x1002875,
-    'braille_dots_23567': 0x1002876,
-    'braille_dots_123567': 0x1002877,
-    'braille_dots_4567': 0x1002878,
-    'braille_dots_14567': 0x1002879,
-    'braille_dots_24567': 0x100287a,
-    'braille_dots_124567': 0x100287b,
-    'braille_dots_34567': 0x100287c,
-    'braille_dots_134567': 0x100287d,
-    'braille_dots_234567': 0x100287e,
-    'braille_dots_1234567': 0x100287f,
-    'braille_dots_8': 0x1002880,
-    'braille_dots_18': 0x1002881,
-    'braille_dots_28': 0x1002882,
-    'braille_dots_128': 0x1002883,
-    'braille_dots_38': 0x1002884,
-    'braille_dots_138': 0x1002885,
-    'braille_dots_238': 0x1002886,
-    'braille_dots_1238': 0x1002887,
-    'braille_dots_48': 0x1002888,
-    'braille_dots_148': 0x1002889,
-    'braille_dots_248': 0x100288a,
-    'braille_dots_1248': 0x100288b,
-    'braille_dots_348': 0x100288c,
-    'braille_dots_1348': 0x100288d,
-    'braille_dots_2348': 0x100288e,
-    'braille_dots_12348': 0x100288f,
-    'braille_dots_58': 0x1002890,
-    'braille_dots_158': 0x1002891,
-    'braille_dots_258': 0x1002892,
-    'braille_dots_1258': 0x1002893,
-    'braille_dots_358': 0x1002894,
-    'braille_dots_1358': 0x1002895,
-    'braille_dots_2358': 0x1002896,
-    'braille_dots_12358': 0x1002897,
-    'braille_dots_458': 0x1002898,
-    'braille_dots_1458': 0x1002899,
-    'braille_dots_2458': 0x100289a,
-    'braille_dots_12458': 0x100289b,
-    'braille_dots_3458': 0x100289c,
-    'braille_dots_13458': 0x100289d,
-    'braille_dots_23458': 0x100289e,
-    'braille_dots_123458': 0x100289f,
-    'braille_dots_68': 0x10028a0,
-    'braille_dots_168': 0x10028a1,
-    'braille_dots_268': 0x10028a2,
-    'braille_dots_1268': 0x10028a3,
-    'braille_dots_368': 0x10028a4,
-    'braille_dots_1368': 0x10028a5,
-    'braille_dots_2368': 0x10028a6,
-    'braille_dots_12368': 0x10028a7,
-    'braille_dots_468': 0x10028a8,
-    'braille_dots_1468': 0x10028a9,
-    'braille_dots_2468': 0x10028aa,
-    'braille_dots_12468': 0x10028ab,
-    'braille_dots_3468': 0x10028ac,
-    'braille_dots_13468': 0x10028ad,
-    'braille_dots_23468': 0x10028ae,
-    'braille_dots_123468': 0x10028af,
-    'braille_dots_568': 0x10028b0,
-    'braille_dots_1568': 0x10028b1,
-    'braille_dots_2568': 0x10028b2,
-    'braille_dots_12568': 0x10028b3,
-    'braille_dots_3568': 0x10028b4,
-    'braille_dots_13568': 0x10028b5,
-    'braille_dots_23568': 0x10028b6,
-    'braille_dots_123568': 0x10028b7,
-    'braille_dots_4568': 0x10028b8,
-    'braille_dots_14568': 0x10028b9,
-    'braille_dots_24568': 0x10028ba,
-    'braille_dots_124568': 0x10028bb,
-    'braille_dots_34568': 0x10028bc,
-    'braille_dots_134568': 0x10028bd,
-    'braille_dots_234568': 0x10028be,
-    'braille_dots_1234568': 0x10028bf,
-    'braille_dots_78': 0x10028c0,
-    'braille_dots_178': 0x10028c1,
-    'braille_dots_278': 0x10028c2,
-    'braille_dots_1278': 0x10028c3,
-    'braille_dots_378': 0x10028c4,
-    'braille_dots_1378': 0x10028c5,
-    'braille_dots_2378': 0x10028c6,
-    'braille_dots_12378': 0x10028c7,
-    'braille_dots_478': 0x10028c8,
-    'braille_dots_1478': 0x10028c9,
-    'braille_dots_2478': 0x10028ca,
-    'braille_dots_12478': 0x10028cb,
-    'braille_dots_3478': 0x10028cc,
-    'braille_dots_13478': 0x10028cd,
-    'braille_dots_23478': 0x10028ce,
-    'braille_dots_123478': 0x10028cf,
-    'braille_dots_578': 0x10028d0,
-    'braille_dots_1578': 0x10028d1,
-    'braille_dots_2578': 0x10028d2,
-    'braille_dots_12578': 0x10028d3,
-    'braille_dots_3578': 0x10028d4,
-    'braille_dots_13578': 0x10028d5,
-    'braille_dots_23578': 0x10028d6,
-    'braille_dots_123578': 0x10028d7,
-    'braille_dots_4578': 0x10028d8,
-    'braille_dots_14578': 0x10028d9,
-    'braille_dots_24578': 0x10028da,
-    'braille_dots_124578': 0x10028db,
-    'braille_dots_34578': 0x10028dc,
-    'braille_dots_134578': 0x10028dd,
-    'braille_dots_234578': 0x10028de,
-    'braille_dots_1234578': 0x10028df,
-    'braille_dots_678': 0x10028e0,
-    'braille_dots_1678': 0x10028e1,
-    'braille_dots_2678': 0x10028e2,
-    'braille_dots_12678': 0x10028e3,
-    'braille_dots_3678': 0x10028e4,
-    'braille_dots_13678': 0x10028e5,
-    'braille_dots_23678': 0x10028e6,
-    'braille_dots_123678': 0x10028e7,
-    'braille_dots_4678': 0x10028e8,
-    'braille_dots_14678': 0x10028e9,
-    'braille_dots_24678': 0x10028ea,
-    'braille_dots_124678': 0x10028eb,
-    'braille_dots_34678': 0x10028ec,
-    'braille_dots_134678': 0x10028ed,
-    'braille_dots_234678': 0x10028ee,
-    'braille_dots_1234678': 0x10028ef,
-    'braille_dots_5678': 0x10028f0,
-    'braille_dots_15678': 0x10028f1,
-    'braille_dots_25678': 0x10028f2,
-    'braille_dots_125678': 0x10028f3,
-    'braille_dots_35678': 0x10028f4,
-    'braille_dots_135678': 0x10028f5,
-    'braille_dots_235678': 0x10028f6,
-    'braille_dots_1235678': 0x10028f7,
-    'braille_dots_45678': 0x10028f8,
-    'braille_dots_145678': 0x10028f9,
-    'braille_dots_245678': 0x10028fa,
-    'braille_dots_1245678': 0x10028fb,
-    'braille_dots_345678': 0x10028fc,
-    'braille_dots_1345678': 0x10028fd,
-    'braille_dots_2345678': 0x10028fe,
-    'braille_dots_12345678': 0x10028ff,
-}
+if sys.version_info[0] >= 3:
+    from collections.abc import Mapping
+else:
+    from collections import Mapping
 
-keysym_strings = defaultdict(list)
-for keysym_string, keysym in keysyms.items():
-    keysym_strings[keysym].append(keysym_string)
+class KeysymTable(object):
+    """
+    A lazily loaded, bidirectional table of keysyms and their names.
+
+    Names are kept sorted alongside an array of their keysyms, and keysyms are
+    kept sorted alongside a list of their names. Keysyms with several names
+    list them in the order they appear in Xlib.
+    """
+    def __init__(self, data):
+        self._data = data
+        self._names = None
+        self._name_keysyms = None
+        self._keysyms = None
+        self._keysym_names = None
+
+    def load(self):
+        """
+        Unpacks the table. This happens automatically on the first lookup.
+
+        :rtype: void
+        """
+        if self._data is None:
+            return
+
+        fields = self._data.split()
+        names = fields[0::2]
+        keysyms = array('L', [int(ks, 16) for ks in fields[1::2]])
+
+        order = sorted(range(len(names)), key=names.__getitem__)
+        self._names = [names[i] for i in order]
+        self._name_keysyms = array('L', [keysyms[i] for i in order])
+        self._keysyms = keysyms
+        self._keysym_names = names
+        self._data = None
+
+    def keysym(self, name):
+        """
+        Returns the keysym for an English string, or None if there isn't one.
+
+        :type name: str
+        :rtype: int
+        """
+        self.load()
+
+        i = bisect_left(self._names, name)
+        if i < len(self._names) and self._names[i] == name:
+            return self._name_keysyms[i]
+        return None
+
+    def names(self, keysym):
+        """
+        Returns a list of all English strings for a keysym. The list is empty
+        if the keysym is unknown.
+
+        :type keysym: int
+        :rtype: [str]
+        """
+        self.load()
+
+        lo = bisect_left(self._keysyms, keysym)
+        hi = bisect_right(self._keysyms, keysym, lo)
+        return self._keysym_names[lo:hi]
+
+    def __len__(self):
+        self.load()
+        return len(self._names)
+
+class _NameMapping(Mapping):
+    """A read-only mapping of English strings to keysyms."""
+    def __init__(self, table):
+        self._table = table
+
+    def __getitem__(self, name):
+        keysym = self._table.keysym(name)
+        if keysym is None:
+            raise KeyError(name)
+        return keysym
+
+    def __iter__(self):
+        self._table.load()
+        return iter(self._table._names)
+
+    def __len__(self):
+        return len(self._table)
+
+class _KeysymMapping(Mapping):
+    """A read-only mapping of keysyms to lists of English strings."""
+    def __init__(self, table):
+        self._table = table
+
+    def __getitem__(self, keysym):
+        names = self._table.names(keysym)
+        if not names:
+            raise KeyError(keysym)
+        return names
+
+    def __iter__(self):
+        self._table.load()
+        seen = None
+        for keysym in self._table._keysyms:
+            if keysym != seen:
+                seen = keysym
+                yield keysym
+
+    def __len__(self):
+        self._table.load()
+        return len(set(self._table._keysyms))
+
+def string_to_keysym(name):
+    """
+    Finds the keysym for an English string representation of a key.
+
+    :param name: English representation of a keysym, i.e., 'BackSpace'.
+    :type name: str
+    :return: A keysym, or None if the name is unknown.
+    :rtype: int
+    """
+    return table.keysym(name)
+
+def keysym_to_strings(keysym):
+    """
+    Finds all English string representations of a keysym.
+
+    :param keysym: An X keysym.
+    :type keysym: int
+    :return: A (possibly empty) list of names.
+    :rtype: [str]
+    """
+    return table.names(keysym)
+
+# One 'name hex_keysym' pair per line, sorted by keysym.
+_DATA = """\
+space 20
+exclam 21
+quotedbl 22
+numbersign 23
+dollar 24
+percent 25
+ampersand 26
+apostrophe 27
+quoteright 27
+parenleft 28
+parenright 29
+asterisk 2a
+plus 2b
+comma 2c
+minus 2d
+period 2e
+slash 2f
+0 30
+1 31
+2 32
+3 33
+4 34
+5 35
+6 36
+7 37
+8 38
+9 39
+colon 3a
+semicolon 3b
+less 3c
+equal 3d
+greater 3e
+question 3f
+at 40
+A 41
+B 42
+C 43
+D 44
+E 45
+F 46
+G 47
+H 48
+I 49
+J 4a
+K 4b
+L 4c
+M 4d
+N 4e
+O 4f
+P 50
+Q 51
+R 52
+S 53
+T 54
+U 55
+V 56
+W 57
+X 58
+Y 59
+Z 5a
+bracketleft 5b
+backslash 5c
+bracketright 5d
+asciicircum 5e
+underscore 5f
+grave 60
+quoteleft 60
+a 61
+b 62
+c 63
+d 64
+e 65
+f 66
+g 67
+h 68
+i 69
+j 6a
+k 6b
+l 6c
+m 6d
+n 6e
+o 6f
+p 70
+q 71
+r 72
+s 73
+t 74
+u 75
+v 76
+w 77
+x 78
+y 79
+z 7a
+braceleft 7b
+bar 7c
+braceright 7d
+asciitilde 7e
+nobreakspace a0
+exclamdown a1
+cent a2
+sterling a3
+currency a4
+yen a5
+brokenbar a6
+section a7
+diaeresis a8
+copyright a9
+ordfeminine aa
+guillemotleft ab
+notsign ac
+hyphen ad
+registered ae
+macron af
+degree b0
+plusminus b1
+twosuperior b2
+threesuperior b3
+acute b4
+mu b5
+paragraph b6
+periodcentered b7
+cedilla b8
+onesuperior b9
+masculine ba
+guillemotright bb
+onequarter bc
+onehalf bd
+threequarters be
+questiondown bf
+Agrave c0
+Aacute c1
+Acircumflex c2
+Atilde c3
+Adiaeresis c4
+Aring c5
+AE c6
+Ccedilla c7
+Egrave c8
+Eacute c9
+Ecircumflex ca
+Ediaeresis cb
+Igrave cc
+Iacute cd
+Icircumflex ce
+Idiaeresis cf
+ETH d0
+Eth d0
+Ntilde d1
+Ograve d2
+Oacute d3
+Ocircumflex d4
+Otilde d5
+Odiaeresis d6
+multiply d7
+Oslash d8
+Ooblique d8
+Ugrave d9
+Uacute da
+Ucircumflex db
+Udiaeresis dc
+Yacute dd
+THORN de
+Thorn de
+ssharp df
+agrave e0
+aacute e1
+acircumflex e2
+atilde e3
+adiaeresis e4
+aring e5
+ae e6
+ccedilla e7
+egrave e8
+eacute e9
+ecircumflex ea
+ediaeresis eb
+igrave ec
+iacute ed
+icircumflex ee
+idiaeresis ef
+eth f0
+ntilde f1
+ograve f2
+oacute f3
+ocircumflex f4
+otilde f5
+odiaeresis f6
+division f7
+oslash f8
+ooblique f8
+ugrave f9
+uacute fa
+ucircumflex fb
+udiaeresis fc
+yacute fd
+thorn fe
+ydiaeresis ff
+Aogonek 1a1
+breve 1a2
+Lstroke 1a3
+Lcaron 1a5
+Sacute 1a6
+Scaron 1a9
+Scedilla 1aa
+Tcaron 1ab
+Zacute 1ac
+Zcaron 1ae
+Zabovedot 1af
+aogonek 1b1
+ogonek 1b2
+lstroke 1b3
+lcaron 1b5
+sacute 1b6
+caron 1b7
+scaron 1b9
+scedilla 1ba
+tcaron 1bb
+zacute 1bc
+doubleacute 1bd
+zcaron 1be
+zabovedot 1bf
+Racute 1c0
+Abreve 1c3
+Lacute 1c5
+Cacute 1c6
+Ccaron 1c8
+Eogonek 1ca
+Ecaron 1cc
+Dcaron 1cf
+Dstroke 1d0
+Nacute 1d1
+Ncaron 1d2
+Odoubleacute 1d5
+Rcaron 1d8
+Uring 1d9
+Udoubleacute 1db
+Tcedilla 1de
+racute 1e0
+abreve 1e3
+lacute 1e5
+cacute 1e6
+ccaron 1e8
+eogonek 1ea
+ecaron 1ec
+dcaron 1ef
+dstroke 1f0
+nacute 1f1
+ncaron 1f2
+odoubleacute 1f5
+rcaron 1f8
+uring 1f9
+udoubleacute 1fb
+tcedilla 1fe
+abovedot 1ff
+Hstroke 2a1
+Hcircumflex 2a6
+Iabovedot 2a9
+Gbreve 2ab
+Jcircumflex 2ac
+hstroke 2b1
+hcircumflex 2b6
+idotless 2b9
+gbreve 2bb
+jcircumflex 2bc
+Cabovedot 2c5
+Ccircumflex 2c6
+Gabovedot 2d5
+Gcircumflex 2d8
+Ubreve 2dd
+Scircumflex 2de
+cabovedot 2e5
+ccircumflex 2e6
+gabovedot 2f5
+gcircumflex 2f8
+ubreve 2fd
+scircumflex 2fe
+kra 3a2
+kappa 3a2
+Rcedilla 3a3
+Itilde 3a5
+Lcedilla 3a6
+Emacron 3aa
+Gcedilla 3ab
+Tslash 3ac
+rcedilla 3b3
+itilde 3b5
+lcedilla 3b6
+emacron 3ba
+gcedilla 3bb
+tslash 3bc
+ENG 3bd
+eng 3bf
+Amacron 3c0
+Iogonek 3c7
+Eabovedot 3cc
+Imacron 3cf
+Ncedilla 3d1
+Omacron 3d2
+Kcedilla 3d3
+Uogonek 3d9
+Utilde 3dd
+Umacron 3de
+amacron 3e0
+iogonek 3e7
+eabovedot 3ec
+imacron 3ef
+ncedilla 3f1
+omacron 3f2
+kcedilla 3f3
+uogonek 3f9
+utilde 3fd
+umacron 3fe
+overline 47e
+kana_fullstop 4a1
+kana_openingbracket 4a2
+kana_closingbracket 4a3
+kana_comma 4a4
+kana_conjunctive 4a5
+kana_middledot 4a5
+kana_WO 4a6
+kana_a 4a7
+kana_i 4a8
+kana_u 4a9
+kana_e 4aa
+kana_o 4ab
+kana_ya 4ac
+kana_yu 4ad
+kana_yo 4ae
+kana_tsu 4af
+kana_tu 4af
+prolongedsound 4b0
+kana_A 4b1
+kana_I 4b2
+kana_U 4b3
+kana_E 4b4
+kana_O 4b5
+kana_KA 4b6
+kana_KI 4b7
+kana_KU 4b8
+kana_KE 4b9
+kana_KO 4ba
+kana_SA 4bb
+kana_SHI 4bc
+kana_SU 4bd
+kana_SE 4be
+kana_SO 4bf
+kana_TA 4c0
+kana_CHI 4c1
+kana_TI 4c1
+kana_TSU 4c2
+kana_TU 4c2
+kana_TE 4c3
+kana_TO 4c4
+kana_NA 4c5
+kana_NI 4c6
+kana_NU 4c7
+kana_NE 4c8
+kana_NO 4c9
+kana_HA 4ca
+kana_HI 4cb
+kana_FU 4cc
+kana_HU 4cc
+kana_HE 4cd
+kana_HO 4ce
+kana_MA 4cf
+kana_MI 4d0
+kana_MU 4d1
+kana_ME 4d2
+kana_MO 4d3
+kana_YA 4d4
+kana_YU 4d5
+kana_YO 4d6
+kana_RA 4d7
+kana_RI 4d8
+kana_RU 4d9
+kana_RE 4da
+kana_RO 4db
+kana_WA 4dc
+kana_N 4dd
+voicedsound 4de
+semivoicedsound 4df
+Arabic_comma 5ac
+Arabic_semicolon 5bb
+Arabic_question_mark 5bf
+Arabic_hamza 5c1
+Arabic_maddaonalef 5c2
+Arabic_hamzaonalef 5c3
+Arabic_hamzaonwaw 5c4
+Arabic_hamzaunderalef 5c5
+Arabic_hamzaonyeh 5c6
+Arabic_alef 5c7
+Arabic_beh 5c8
+Arabic_tehmarbuta 5c9
+Arabic_teh 5ca
+Arabic_theh 5cb
+Arabic_jeem 5cc
+Arabic_hah 5cd
+Arabic_khah 5ce
+Arabic_dal 5cf
+Arabic_thal 5d0
+Arabic_ra 5d1
+Arabic_zain 5d2
+Arabic_seen 5d3
+Arabic_sheen 5d4
+Arabic_sad 5d5
+Arabic_dad 5d6
+Arabic_tah 5d7
+Arabic_zah 5d8
+Arabic_ain 5d9
+Arabic_ghain 5da
+Arabic_tatweel 5e0
+Arabic_feh 5e1
+Arabic_qaf 5e2
+Arabic_kaf 5e3
+Arabic_lam 5e4
+Arabic_meem 5e5
+Arabic_noon 5e6
+Arabic_ha 5e7
+Arabic_heh 5e7
+Arabic_waw 5e8
+Arabic_alefmaksura 5e9
+Arabic_yeh 5ea
+Arabic_fathatan 5eb
+Arabic_dammatan 5ec
+Arabic_kasratan 5ed
+Arabic_fatha 5ee
+Arabic_damma 5ef
+Arabic_kasra 5f0
+Arabic_shadda 5f1
+Arabic_sukun 5f2
+Serbian_dje 6a1
+Macedonia_gje 6a2
+Cyrillic_io 6a3
+Ukrainian_ie 6a4
+Ukranian_je 6a4
+Macedonia_dse 6a5
+Ukrainian_i 6a6
+Ukranian_i 6a6
+Ukrainian_yi 6a7
+Ukranian_yi 6a7
+Cyrillic_je 6a8
+Serbian_je 6a8
+Cyrillic_lje 6a9
+Serbian_lje 6a9
+Cyrillic_nje 6aa
+Serbian_nje 6aa
+Serbian_tshe 6ab
+Macedonia_kje 6ac
+Ukrainian_ghe_with_upturn 6ad
+Byelorussian_shortu 6ae
+Cyrillic_dzhe 6af
+Serbian_dze 6af
+numerosign 6b0
+Serbian_DJE 6b1
+Macedonia_GJE 6b2
+Cyrillic_IO 6b3
+Ukrainian_IE 6b4
+Ukranian_JE 6b4
+Macedonia_DSE 6b5
+Ukrainian_I 6b6
+Ukranian_I 6b6
+Ukrainian_YI 6b7
+Ukranian_YI 6b7
+Cyrillic_JE 6b8
+Serbian_JE 6b8
+Cyrillic_LJE 6b9
+Serbian_LJE 6b9
+Cyrillic_NJE 6ba
+Serbian_NJE 6ba
+Serbian_TSHE 6bb
+Macedonia_KJE 6bc
+Ukrainian_GHE_WITH_UPTURN 6bd
+Byelorussian_SHORTU 6be
+Cyrillic_DZHE 6bf
+Serbian_DZE 6bf
+Cyrillic_yu 6c0
+Cyrillic_a 6c1
+Cyrillic_be 6c2
+Cyrillic_tse 6c3
+Cyrillic_de 6c4
+Cyrillic_ie 6c5
+Cyrillic_ef 6c6
+Cyrillic_ghe 6c7
+Cyrillic_ha 6c8
+Cyrillic_i 6c9
+Cyrillic_shorti 6ca
+Cyrillic_ka 6cb
+Cyrillic_el 6cc
+Cyrillic_em 6cd
+Cyrillic_en 6ce
+Cyrillic_o 6cf
+Cyrillic_pe 6d0
+Cyrillic_ya 6d1
+Cyrillic_er 6d2
+Cyrillic_es 6d3
+Cyrillic_te 6d4
+Cyrillic_u 6d5
+Cyrillic_zhe 6d6
+Cyrillic_ve 6d7
+Cyrillic_softsign 6d8
+Cyrillic_yeru 6d9
+Cyrillic_ze 6da
+Cyrillic_sha 6db
+Cyrillic_e 6dc
+Cyrillic_shcha 6dd
+Cyrillic_che 6de
+Cyrillic_hardsign 6df
+Cyrillic_YU 6e0
+Cyrillic_A 6e1
+Cyrillic_BE 6e2
+Cyrillic_TSE 6e3
+Cyrillic_DE 6e4
+Cyrillic_IE 6e5
+Cyrillic_EF 6e6
+Cyrillic_GHE 6e7
+Cyrillic_HA 6e8
+Cyrillic_I 6e9
+Cyrillic_SHORTI 6ea
+Cyrillic_KA 6eb
+Cyrillic_EL 6ec
+Cyrillic_EM 6ed
+Cyrillic_EN 6ee
+Cyrillic_O 6ef
+Cyrillic_PE 6f0
+Cyrillic_YA 6f1
+Cyrillic_ER 6f2
+Cyrillic_ES 6f3
+Cyrillic_TE 6f4
+Cyrillic_U 6f5
+Cyrillic_ZHE 6f6
+Cyrillic_VE 6f7
+Cyrillic_SOFTSIGN 6f8
+Cyrillic_YERU 6f9
+Cyrillic_ZE 6fa
+Cyrillic_SHA 6fb
+Cyrillic_E 6fc
+Cyrillic_SHCHA 6fd
+Cyrillic_CHE 6fe
+Cyrillic_HARDSIGN 6ff
+Greek_ALPHAaccent 7a1
+Greek_EPSILONaccent 7a2
+Greek_ETAaccent 7a3
+Greek_IOTAaccent 7a4
+Greek_IOTAdieresis 7a5
+Greek_IOTAdiaeresis 7a5
+Greek_OMICRONaccent 7a7
+Greek_UPSILONaccent 7a8
+Greek_UPSILONdieresis 7a9
+Greek_OMEGAaccent 7ab
+Greek_accentdieresis 7ae
+Greek_horizbar 7af
+Greek_alphaaccent 7b1
+Greek_epsilonaccent 7b2
+Greek_etaaccent 7b3
+Greek_iotaaccent 7b4
+Greek_iotadieresis 7b5
+Greek_iotaaccentdieresis 7b6
+Greek_omicronaccent 7b7
+Greek_upsilonaccent 7b8
+Greek_upsilondieresis 7b9
+Greek_upsilonaccentdieresis 7ba
+Greek_omegaaccent 7bb
+Greek_ALPHA 7c1
+Greek_BETA 7c2
+Greek_GAMMA 7c3
+Greek_DELTA 7c4
+Greek_EPSILON 7c5
+Greek_ZETA 7c6
+Greek_ETA 7c7
+Greek_THETA 7c8
+Greek_IOTA 7c9
+Greek_KAPPA 7ca
+Greek_LAMDA 7cb
+Greek_LAMBDA 7cb
+Greek_MU 7cc
+Greek_NU 7cd
+Greek_XI 7ce
+Greek_OMICRON 7cf
+Greek_PI 7d0
+Greek_RHO 7d1
+Greek_SIGMA 7d2
+Greek_TAU 7d4
+Greek_UPSILON 7d5
+Greek_PHI 7d6
+Greek_CHI 7d7
+Greek_PSI 7d8
+Greek_OMEGA 7d9
+Greek_alpha 7e1
+Greek_beta 7e2
+Greek_gamma 7e3
+Greek_delta 7e4
+Greek_epsilon 7e5
+Greek_zeta 7e6
+Greek_eta 7e7
+Greek_theta 7e8
+Greek_iota 7e9
+Greek_kappa 7ea
+Greek_lamda 7eb
+Greek_lambda 7eb
+Greek_mu 7ec
+Greek_nu 7ed
+Greek_xi 7ee
+Greek_omicron 7ef
+Greek_pi 7f0
+Greek_rho 7f1
+Greek_sigma 7f2
+Greek_finalsmallsigma 7f3
+Greek_tau 7f4
+Greek_upsilon 7f5
+Greek_phi 7f6
+Greek_chi 7f7
+Greek_psi 7f8
+Greek_omega 7f9
+leftradical 8a1
+topleftradical 8a2
+horizconnector 8a3
+topintegral 8a4
+botintegral 8a5
+vertconnector 8a6
+topleftsqbracket 8a7
+botleftsqbracket 8a8
+toprightsqbracket 8a9
+botrightsqbracket 8aa
+topleftparens 8ab
+botleftparens 8ac
+toprightparens 8ad
+botrightparens 8ae
+leftmiddlecurlybrace 8af
+rightmiddlecurlybrace 8b0
+topleftsummation 8b1
+botleftsummation 8b2
+topvertsummationconnector 8b3
+botvertsummationconnector 8b4
+toprightsummation 8b5
+botrightsummation 8b6
+rightmiddlesummation 8b7
+lessthanequal 8bc
+notequal 8bd
+greaterthanequal 8be
+integral 8bf
+therefore 8c0
+variation 8c1
+infinity 8c2
+nabla 8c5
+approximate 8c8
+similarequal 8c9
+ifonlyif 8cd
+implies 8ce
+identical 8cf
+radical 8d6
+includedin 8da
+includes 8db
+intersection 8dc
+union 8dd
+logicaland 8de
+logicalor 8df
+partialderivative 8ef
+function 8f6
+leftarrow 8fb
+uparrow 8fc
+rightarrow 8fd
+downarrow 8fe
+blank 9df
+soliddiamond 9e0
+checkerboard 9e1
+ht 9e2
+ff 9e3
+cr 9e4
+lf 9e5
+nl 9e8
+vt 9e9
+lowrightcorner 9ea
+uprightcorner 9eb
+upleftcorner 9ec
+lowleftcorner 9ed
+crossinglines 9ee
+horizlinescan1 9ef
+horizlinescan3 9f0
+horizlinescan5 9f1
+horizlinescan7 9f2
+horizlinescan9 9f3
+leftt 9f4
+rightt 9f5
+bott 9f6
+topt 9f7
+vertbar 9f8
+emspace aa1
+enspace aa2
+em3space aa3
+em4space aa4
+digitspace aa5
+punctspace aa6
+thinspace aa7
+hairspace aa8
+emdash aa9
+endash aaa
+signifblank aac
+ellipsis aae
+doubbaselinedot aaf
+onethird ab0
+twothirds ab1
+onefifth ab2
+twofifths ab3
+threefifths ab4
+fourfifths ab5
+onesixth ab6
+fivesixths ab7
+careof ab8
+figdash abb
+leftanglebracket abc
+decimalpoint abd
+rightanglebracket abe
+marker abf
+oneeighth ac3
+threeeighths ac4
+fiveeighths ac5
+seveneighths ac6
+trademark ac9
+signaturemark aca
+trademarkincircle acb
+leftopentriangle acc
+rightopentriangle acd
+emopencircle ace
+emopenrectangle acf
+leftsinglequotemark ad0
+rightsinglequotemark ad1
+leftdoublequotemark ad2
+rightdoublequotemark ad3
+prescription ad4
+minutes ad6
+seconds ad7
+latincross ad9
+hexagram ada
+filledrectbullet adb
+filledlefttribullet adc
+filledrighttribullet add
+emfilledcircle ade
+emfilledrect adf
+enopencircbullet ae0
+enopensquarebullet ae1
+openrectbullet ae2
+opentribulletup ae3
+opentribulletdown ae4
+openstar ae5
+enfilledcircbullet ae6
+enfilledsqbullet ae7
+filledtribulletup ae8
+filledtribulletdown ae9
+leftpointer aea
+rightpointer aeb
+club aec
+diamond aed
+heart aee
+maltesecross af0
+dagger af1
+doubledagger af2
+checkmark af3
+ballotcross af4
+musicalsharp af5
+musicalflat af6
+malesymbol af7
+femalesymbol af8
+telephone af9
+telephonerecorder afa
+phonographcopyright afb
+caret afc
+singlelowquotemark afd
+doublelowquotemark afe
+cursor aff
+leftcaret ba3
+rightcaret ba6
+downcaret ba8
+upcaret ba9
+overbar bc0
+downtack bc2
+upshoe bc3
+downstile bc4
+underbar bc6
+jot bca
+quad bcc
+uptack bce
+circle bcf
+upstile bd3
+downshoe bd6
+rightshoe bd8
+leftshoe bda
+lefttack bdc
+righttack bfc
+hebrew_doublelowline cdf
+hebrew_aleph ce0
+hebrew_bet ce1
+hebrew_beth ce1
+hebrew_gimel ce2
+hebrew_gimmel ce2
+hebrew_dalet ce3
+hebrew_daleth ce3
+hebrew_he ce4
+hebrew_waw ce5
+hebrew_zain ce6
+hebrew_zayin ce6
+hebrew_chet ce7
+hebrew_het ce7
+hebrew_tet ce8
+hebrew_teth ce8
+hebrew_yod ce9
+hebrew_finalkaph cea
+hebrew_kaph ceb
+hebrew_lamed cec
+hebrew_finalmem ced
+hebrew_mem cee
+hebrew_finalnun cef
+hebrew_nun cf0
+hebrew_samech cf1
+hebrew_samekh cf1
+hebrew_ayin cf2
+hebrew_finalpe cf3
+hebrew_pe cf4
+hebrew_finalzade cf5
+hebrew_finalzadi cf5
+hebrew_zade cf6
+hebrew_zadi cf6
+hebrew_qoph cf7
+hebrew_kuf cf7
+hebrew_resh cf8
+hebrew_shin cf9
+hebrew_taw cfa
+hebrew_taf cfa
+Thai_kokai da1
+Thai_khokhai da2
+Thai_khokhuat da3
+Thai_khokhwai da4
+Thai_khokhon da5
+Thai_khorakhang da6
+Thai_ngongu da7
+Thai_chochan da8
+Thai_choching da9
+Thai_chochang daa
+Thai_soso dab
+Thai_chochoe dac
+Thai_yoying dad
+Thai_dochada dae
+Thai_topatak daf
+Thai_thothan db0
+Thai_thonangmontho db1
+Thai_thophuthao db2
+Thai_nonen db3
+Thai_dodek db4
+Thai_totao db5
+Thai_thothung db6
+Thai_thothahan db7
+Thai_thothong db8
+Thai_nonu db9
+Thai_bobaimai dba
+Thai_popla dbb
+Thai_phophung dbc
+Thai_fofa dbd
+Thai_phophan dbe
+Thai_fofan dbf
+Thai_phosamphao dc0
+Thai_moma dc1
+Thai_yoyak dc2
+Thai_rorua dc3
+Thai_ru dc4
+Thai_loling dc5
+Thai_lu dc6
+Thai_wowaen dc7
+Thai_sosala dc8
+Thai_sorusi dc9
+Thai_sosua dca
+Thai_hohip dcb
+Thai_lochula dcc
+Thai_oang dcd
+Thai_honokhuk dce
+Thai_paiyannoi dcf
+Thai_saraa dd0
+Thai_maihanakat dd1
+Thai_saraaa dd2
+Thai_saraam dd3
+Thai_sarai dd4
+Thai_saraii dd5
+Thai_saraue dd6
+Thai_sarauee dd7
+Thai_sarau dd8
+Thai_sarauu dd9
+Thai_phinthu dda
+Thai_maihanakat_maitho dde
+Thai_baht ddf
+Thai_sarae de0
+Thai_saraae de1
+Thai_sarao de2
+Thai_saraaimaimuan de3
+Thai_saraaimaimalai de4
+Thai_lakkhangyao de5
+Thai_maiyamok de6
+Thai_maitaikhu de7
+Thai_maiek de8
+Thai_maitho de9
+Thai_maitri dea
+Thai_maichattawa deb
+Thai_thanthakhat dec
+Thai_nikhahit ded
+Thai_leksun df0
+Thai_leknung df1
+Thai_leksong df2
+Thai_leksam df3
+Thai_leksi df4
+Thai_lekha df5
+Thai_lekhok df6
+Thai_lekchet df7
+Thai_lekpaet df8
+Thai_lekkao df9
+Hangul_Kiyeog ea1
+Hangul_SsangKiyeog ea2
+Hangul_KiyeogSios ea3
+Hangul_Nieun ea4
+Hangul_NieunJieuj ea5
+Hangul_NieunHieuh ea6
+Hangul_Dikeud ea7
+Hangul_SsangDikeud ea8
+Hangul_Rieul ea9
+Hangul_RieulKiyeog eaa
+Hangul_RieulMieum eab
+Hangul_RieulPieub eac
+Hangul_RieulSios ead
+Hangul_RieulTieut eae
+Hangul_RieulPhieuf eaf
+Hangul_RieulHieuh eb0
+Hangul_Mieum eb1
+Hangul_Pieub eb2
+Hangul_SsangPieub eb3
+Hangul_PieubSios eb4
+Hangul_Sios eb5
+Hangul_SsangSios eb6
+Hangul_Ieung eb7
+Hangul_Jieuj eb8
+Hangul_SsangJieuj eb9
+Hangul_Cieuc eba
+Hangul_Khieuq ebb
+Hangul_Tieut ebc
+Hangul_Phieuf ebd
+Hangul_Hieuh ebe
+Hangul_A ebf
+Hangul_AE ec0
+Hangul_YA ec1
+Hangul_YAE ec2
+Hangul_EO ec3
+Hangul_E ec4
+Hangul_YEO ec5
+Hangul_YE ec6
+Hangul_O ec7
+Hangul_WA ec8
+Hangul_WAE ec9
+Hangul_OE eca
+Hangul_YO ecb
+Hangul_U ecc
+Hangul_WEO ecd
+Hangul_WE ece
+Hangul_WI ecf
+Hangul_YU ed0
+Hangul_EU ed1
+Hangul_YI ed2
+Hangul_I ed3
+Hangul_J_Kiyeog ed4
+Hangul_J_SsangKiyeog ed5
+Hangul_J_KiyeogSios ed6
+Hangul_J_Nieun ed7
+Hangul_J_NieunJieuj ed8
+Hangul_J_NieunHieuh ed9
+Hangul_J_Dikeud eda
+Hangul_J_Rieul edb
+Hangul_J_RieulKiyeog edc
+Hangul_J_RieulMieum edd
+Hangul_J_RieulPieub ede
+Hangul_J_RieulSios edf
+Hangul_J_RieulTieut ee0
+Hangul_J_RieulPhieuf ee1
+Hangul_J_RieulHieuh ee2
+Hangul_J_Mieum ee3
+Hangul_J_Pieub ee4
+Hangul_J_PieubSios ee5
+Hangul_J_Sios ee6
+Hangul_J_SsangSios ee7
+Hangul_J_Ieung ee8
+Hangul_J_Jieuj ee9
+Hangul_J_Cieuc eea
+Hangul_J_Khieuq eeb
+Hangul_J_Tieut eec
+Hangul_J_Phieuf eed
+Hangul_J_Hieuh eee
+Hangul_RieulYeorinHieuh eef
+Hangul_SunkyeongeumMieum ef0
+Hangul_SunkyeongeumPieub ef1
+Hangul_PanSios ef2
+Hangul_KkogjiDalrinIeung ef3
+Hangul_SunkyeongeumPhieuf ef4
+Hangul_YeorinHieuh ef5
+Hangul_AraeA ef6
+Hangul_AraeAE ef7
+Hangul_J_PanSios ef8
+Hangul_J_KkogjiDalrinIeung ef9
+Hangul_J_YeorinHieuh efa
+Korean_Won eff
+OE 13bc
+oe 13bd
+Ydiaeresis 13be
+EuroSign 20ac
+3270_Duplicate fd01
+3270_FieldMark fd02
+3270_Right2 fd03
+3270_Left2 fd04
+3270_BackTab fd05
+3270_EraseEOF fd06
+3270_EraseInput fd07
+3270_Reset fd08
+3270_Quit fd09
+3270_PA1 fd0a
+3270_PA2 fd0b
+3270_PA3 fd0c
+3270_Test fd0d
+3270_Attn fd0e
+3270_CursorBlink fd0f
+3270_AltCursor fd10
+3270_KeyClick fd11
+3270_Jump fd12
+3270_Ident fd13
+3270_Rule fd14
+3270_Copy fd15
+3270_Play fd16
+3270_Setup fd17
+3270_Record fd18
+3270_ChangeScreen fd19
+3270_DeleteWord fd1a
+3270_ExSelect fd1b
+3270_CursorSelect fd1c
+3270_PrintScreen fd1d
+3270_Enter fd1e
+ISO_Lock fe01
+ISO_Level2_Latch fe02
+ISO_Level3_Shift fe03
+ISO_Level3_Latch fe04
+ISO_Level3_Lock fe05
+ISO_Group_Latch fe06
+ISO_Group_Lock fe07
+ISO_Next_Group fe08
+ISO_Next_Group_Lock fe09
+ISO_Prev_Group fe0a
+ISO_Prev_Group_Lock fe0b
+ISO_First_Group fe0c
+ISO_First_Group_Lock fe0d
+ISO_Last_Group fe0e
+ISO_Last_Group_Lock fe0f
+ISO_Level5_Shift fe11
+ISO_Level5_Latch fe12
+ISO_Level5_Lock fe13
+ISO_Left_Tab fe20
+ISO_Move_Line_Up fe21
+ISO_Move_Line_Down fe22
+ISO_Partial_Line_Up fe23
+ISO_Partial_Line_Down fe24
+ISO_Partial_Space_Left fe25
+ISO_Partial_Space_Right fe26
+ISO_Set_Margin_Left fe27
+ISO_Set_Margin_Right fe28
+ISO_Release_Margin_Left fe29
+ISO_Release_Margin_Right fe2a
+ISO_Release_Both_Margins fe2b
+ISO_Fast_Cursor_Left fe2c
+ISO_Fast_Cursor_Right fe2d
+ISO_Fast_Cursor_Up fe2e
+ISO_Fast_Cursor_Down fe2f
+ISO_Continuous_Underline fe30
+ISO_Discontinuous_Underline fe31
+ISO_Emphasize fe32
+ISO_Center_Object fe33
+ISO_Enter fe34
+dead_grave fe50
+dead_acute fe51
+dead_circumflex fe52
+dead_tilde fe53
+dead_perispomeni fe53
+dead_macron fe54
+dead_breve fe55
+dead_abovedot fe56
+dead_diaeresis fe57
+dead_abovering fe58
+dead_doubleacute fe59
+dead_caron fe5a
+dead_cedilla fe5b
+dead_ogonek fe5c
+dead_iota fe5d
+dead_voiced_sound fe5e
+dead_semivoiced_sound fe5f
+dead_belowdot fe60
+dead_hook fe61
+dead_horn fe62
+dead_stroke fe63
+dead_abovecomma fe64
+dead_psili fe64
+dead_abovereversedcomma fe65
+dead_dasia fe65
+dead_doublegrave fe66
+dead_belowring fe67
+dead_belowmacron fe68
+dead_belowcircumflex fe69
+dead_belowtilde fe6a
+dead_belowbreve fe6b
+dead_belowdiaeresis fe6c
+dead_invertedbreve fe6d
+dead_belowcomma fe6e
+dead_currency fe6f
+AccessX_Enable fe70
+AccessX_Feedback_Enable fe71
+RepeatKeys_Enable fe72
+SlowKeys_Enable fe73
+BounceKeys_Enable fe74
+StickyKeys_Enable fe75
+MouseKeys_Enable fe76
+MouseKeys_Accel_Enable fe77
+Overlay1_Enable fe78
+Overlay2_Enable fe79
+AudibleBell_Enable fe7a
+dead_a fe80
+dead_A fe81
+dead_e fe82
+dead_E fe83
+dead_i fe84
+dead_I fe85
+dead_o fe86
+dead_O fe87
+dead_u fe88
+dead_U fe89
+dead_small_schwa fe8a
+dead_capital_schwa fe8b
+First_Virtual_Screen fed0
+Prev_Virtual_Screen fed1
+Next_Virtual_Screen fed2
+Last_Virtual_Screen fed4
+Terminate_Server fed5
+Pointer_Left fee0
+Pointer_Right fee1
+Pointer_Up fee2
+Pointer_Down fee3
+Pointer_UpLeft fee4
+Pointer_UpRight fee5
+Pointer_DownLeft fee6
+Pointer_DownRight fee7
+Pointer_Button_Dflt fee8
+Pointer_Button1 fee9
+Pointer_Button2 feea
+Pointer_Button3 feeb
+Pointer_Button4 feec
+Pointer_Button5 feed
+Pointer_DblClick_Dflt feee
+Pointer_DblClick1 feef
+Pointer_DblClick2 fef0
+Pointer_DblClick3 fef1
+Pointer_DblClick4 fef2
+Pointer_DblClick5 fef3
+Pointer_Drag_Dflt fef4
+Pointer_Drag1 fef5
+Pointer_Drag2 fef6
+Pointer_Drag3 fef7
+Pointer_Drag4 fef8
+Pointer_EnableKeys fef9
+Pointer_Accelerate fefa
+Pointer_DfltBtnNext fefb
+Pointer_DfltBtnPrev fefc
+Pointer_Drag5 fefd
+BackSpace ff08
+Tab ff09
+Linefeed ff0a
+Clear ff0b
+Return ff0d
+Pause ff13
+Scroll_Lock ff14
+Sys_Req ff15
+Escape ff1b
+Multi_key ff20
+Kanji ff21
+Muhenkan ff22
+Henkan_Mode ff23
+Henkan ff23
+Romaji ff24
+Hiragana ff25
+Katakana ff26
+Hiragana_Katakana ff27
+Zenkaku ff28
+Hankaku ff29
+Zenkaku_Hankaku ff2a
+Touroku ff2b
+Massyo ff2c
+Kana_Lock ff2d
+Kana_Shift ff2e
+Eisu_Shift ff2f
+Eisu_toggle ff30
+Hangul ff31
+Hangul_Start ff32
+Hangul_End ff33
+Hangul_Hanja ff34
+Hangul_Jamo ff35
+Hangul_Romaja ff36
+Codeinput ff37
+Kanji_Bangou ff37
+Hangul_Codeinput ff37
+Hangul_Jeonja ff38
+Hangul_Banja ff39
+Hangul_PreHanja ff3a
+Hangul_PostHanja ff3b
+SingleCandidate ff3c
+Hangul_SingleCandidate ff3c
+MultipleCandidate ff3d
+Zen_Koho ff3d
+Hangul_MultipleCandidate ff3d
+PreviousCandidate ff3e
+Mae_Koho ff3e
+Hangul_PreviousCandidate ff3e
+Hangul_Special ff3f
+Home ff50
+Left ff51
+Up ff52
+Right ff53
+Down ff54
+Prior ff55
+Page_Up ff55
+Next ff56
+Page_Down ff56
+End ff57
+Begin ff58
+Select ff60
+Print ff61
+Execute ff62
+Insert ff63
+Undo ff65
+Redo ff66
+Menu ff67
+Find ff68
+Cancel ff69
+Help ff6a
+Break ff6b
+Mode_switch ff7e
+script_switch ff7e
+ISO_Group_Shift ff7e
+kana_switch ff7e
+Arabic_switch ff7e
+Greek_switch ff7e
+Hebrew_switch ff7e
+Hangul_switch ff7e
+Num_Lock ff7f
+KP_Space ff80
+KP_Tab ff89
+KP_Enter ff8d
+KP_F1 ff91
+KP_F2 ff92
+KP_F3 ff93
+KP_F4 ff94
+KP_Home ff95
+KP_Left ff96
+KP_Up ff97
+KP_Right ff98
+KP_Down ff99
+KP_Prior ff9a
+KP_Page_Up ff9a
+KP_Next ff9b
+KP_Page_Down ff9b
+KP_End ff9c
+KP_Begin ff9d
+KP_Insert ff9e
+KP_Delete ff9f
+KP_Multiply ffaa
+KP_Add ffab
+KP_Separator ffac
+KP_Subtract ffad
+KP_Decimal ffae
+KP_Divide ffaf
+KP_0 ffb0
+KP_1 ffb1
+KP_2 ffb2
+KP_3 ffb3
+KP_4 ffb4
+KP_5 ffb5
+KP_6 ffb6
+KP_7 ffb7
+KP_8 ffb8
+KP_9 ffb9
+KP_Equal ffbd
+F1 ffbe
+F2 ffbf
+F3 ffc0
+F4 ffc1
+F5 ffc2
+F6 ffc3
+F7 ffc4
+F8 ffc5
+F9 ffc6
+F10 ffc7
+F11 ffc8
+L1 ffc8
+F12 ffc9
+L2 ffc9
+F13 ffca
+L3 ffca
+F14 ffcb
+L4 ffcb
+F15 ffcc
+L5 ffcc
+F16 ffcd
+L6 ffcd
+F17 ffce
+L7 ffce
+F18 ffcf
+L8 ffcf
+F19 ffd0
+L9 ffd0
+F20 ffd1
+L10 ffd1
+F21 ffd2
+R1 ffd2
+F22 ffd3
+R2 ffd3
+F23 ffd4
+R3 ffd4
+F24 ffd5
+R4 ffd5
+F25 ffd6
+R5 ffd6
+F26 ffd7
+R6 ffd7
+F27 ffd8
+R7 ffd8
+F28 ffd9
+R8 ffd9
+F29 ffda
+R9 ffda
+F30 ffdb
+R10 ffdb
+F31 ffdc
+R11 ffdc
+F32 ffdd
+R12 ffdd
+F33 ffde
+R13 ffde
+F34 ffdf
+R14 ffdf
+F35 ffe0
+R15 ffe0
+Shift_L ffe1
+Shift_R ffe2
+Control_L ffe3
+Control_R ffe4
+Caps_Lock ffe5
+Shift_Lock ffe6
+Meta_L ffe7
+Meta_R ffe8
+Alt_L ffe9
+Alt_R ffea
+Super_L ffeb
+Super_R ffec
+Hyper_L ffed
+Hyper_R ffee
+braille_dot_1 fff1
+braille_dot_2 fff2
+braille_dot_3 fff3
+braille_dot_4 fff4
+braille_dot_5 fff5
+braille_dot_6 fff6
+braille_dot_7 fff7
+braille_dot_8 fff8
+braille_dot_9 fff9
+braille_dot_10 fffa
+Delete ffff
+VoidSymbol ffffff
+Ibreve 100012c
+ibreve 100012d
+Wcircumflex 1000174
+wcircumflex 1000175
+Ycircumflex 1000176
+ycircumflex 1000177
+SCHWA 100018f
+Obarred 100019f
+Ohorn 10001a0
+ohorn 10001a1
+Uhorn 10001af
+uhorn 10001b0
+Zstroke 10001b5
+zstroke 10001b6
+Ocaron 10001d1
+ocaron 10001d2
+Gcaron 10001e6
+gcaron 10001e7
+schwa 1000259
+obarred 1000275
+Cyrillic_GHE_bar 1000492
+Cyrillic_ghe_bar 1000493
+Cyrillic_ZHE_descender 1000496
+Cyrillic_zhe_descender 1000497
+Cyrillic_KA_descender 100049a
+Cyrillic_ka_descender 100049b
+Cyrillic_KA_vertstroke 100049c
+Cyrillic_ka_vertstroke 100049d
+Cyrillic_EN_descender 10004a2
+Cyrillic_en_descender 10004a3
+Cyrillic_U_straight 10004ae
+Cyrillic_u_straight 10004af
+Cyrillic_U_straight_bar 10004b0
+Cyrillic_u_straight_bar 10004b1
+Cyrillic_HA_descender 10004b2
+Cyrillic_ha_descender 10004b3
+Cyrillic_CHE_descender 10004b6
+Cyrillic_che_descender 10004b7
+Cyrillic_CHE_vertstroke 10004b8
+Cyrillic_che_vertstroke 10004b9
+Cyrillic_SHHA 10004ba
+Cyrillic_shha 10004bb
+Cyrillic_SCHWA 10004d8
+Cyrillic_schwa 10004d9
+Cyrillic_I_macron 10004e2
+Cyrillic_i_macron 10004e3
+Cyrillic_O_bar 10004e8
+Cyrillic_o_bar 10004e9
+Cyrillic_U_macron 10004ee
+Cyrillic_u_macron 10004ef
+Armenian_AYB 1000531
+Armenian_BEN 1000532
+Armenian_GIM 1000533
+Armenian_DA 1000534
+Armenian_YECH 1000535
+Armenian_ZA 1000536
+Armenian_E 1000537
+Armenian_AT 1000538
+Armenian_TO 1000539
+Armenian_ZHE 100053a
+Armenian_INI 100053b
+Armenian_LYUN 100053c
+Armenian_KHE 100053d
+Armenian_TSA 100053e
+Armenian_KEN 100053f
+Armenian_HO 1000540
+Armenian_DZA 1000541
+Armenian_GHAT 1000542
+Armenian_TCHE 1000543
+Armenian_MEN 1000544
+Armenian_HI 1000545
+Armenian_NU 1000546
+Armenian_SHA 1000547
+Armenian_VO 1000548
+Armenian_CHA 1000549
+Armenian_PE 100054a
+Armenian_JE 100054b
+Armenian_RA 100054c
+Armenian_SE 100054d
+Armenian_VEV 100054e
+Armenian_TYUN 100054f
+Armenian_RE 1000550
+Armenian_TSO 1000551
+Armenian_VYUN 1000552
+Armenian_PYUR 1000553
+Armenian_KE 1000554
+Armenian_O 1000555
+Armenian_FE 1000556
+Armenian_apostrophe 100055a
+Armenian_accent 100055b
+Armenian_shesht 100055b
+Armenian_exclam 100055c
+Armenian_amanak 100055c
+Armenian_separation_mark 100055d
+Armenian_but 100055d
+Armenian_question 100055e
+Armenian_paruyk 100055e
+Armenian_ayb 1000561
+Armenian_ben 1000562
+Armenian_gim 1000563
+Armenian_da 1000564
+Armenian_yech 1000565
+Armenian_za 1000566
+Armenian_e 1000567
+Armenian_at 1000568
+Armenian_to 1000569
+Armenian_zhe 100056a
+Armenian_ini 100056b
+Armenian_lyun 100056c
+Armenian_khe 100056d
+Armenian_tsa 100056e
+Armenian_ken 100056f
+Armenian_ho 1000570
+Armenian_dza 1000571
+Armenian_ghat 1000572
+Armenian_tche 1000573
+Armenian_men 1000574
+Armenian_hi 1000575
+Armenian_nu 1000576
+Armenian_sha 1000577
+Armenian_vo 1000578
+Armenian_cha 1000579
+Armenian_pe 100057a
+Armenian_je 100057b
+Armenian_ra 100057c
+Armenian_se 100057d
+Armenian_vev 100057e
+Armenian_tyun 100057f
+Armenian_re 1000580
+Armenian_tso 1000581
+Armenian_vyun 1000582
+Armenian_pyur 1000583
+Armenian_ke 1000584
+Armenian_o 1000585
+Armenian_fe 1000586
+Armenian_ligature_ew 1000587
+Armenian_full_stop 1000589
+Armenian_verjaket 1000589
+Armenian_hyphen 100058a
+Armenian_yentamna 100058a
+Arabic_madda_above 1000653
+Arabic_hamza_above 1000654
+Arabic_hamza_below 1000655
+Arabic_0 1000660
+Arabic_1 1000661
+Arabic_2 1000662
+Arabic_3 1000663
+Arabic_4 1000664
+Arabic_5 1000665
+Arabic_6 1000666
+Arabic_7 1000667
+Arabic_8 1000668
+Arabic_9 1000669
+Arabic_percent 100066a
+Arabic_superscript_alef 1000670
+Arabic_tteh 1000679
+Arabic_peh 100067e
+Arabic_tcheh 1000686
+Arabic_ddal 1000688
+Arabic_rreh 1000691
+Arabic_jeh 1000698
+Arabic_veh 10006a4
+Arabic_keheh 10006a9
+Arabic_gaf 10006af
+Arabic_noon_ghunna 10006ba
+Arabic_heh_doachashmee 10006be
+Arabic_heh_goal 10006c1
+Farsi_yeh 10006cc
+Arabic_farsi_yeh 10006cc
+Arabic_yeh_baree 10006d2
+Arabic_fullstop 10006d4
+Farsi_0 10006f0
+Farsi_1 10006f1
+Farsi_2 10006f2
+Farsi_3 10006f3
+Farsi_4 10006f4
+Farsi_5 10006f5
+Farsi_6 10006f6
+Farsi_7 10006f7
+Farsi_8 10006f8
+Farsi_9 10006f9
+Georgian_an 10010d0
+Georgian_ban 10010d1
+Georgian_gan 10010d2
+Georgian_don 10010d3
+Georgian_en 10010d4
+Georgian_vin 10010d5
+Georgian_zen 10010d6
+Georgian_tan 10010d7
+Georgian_in 10010d8
+Georgian_kan 10010d9
+Georgian_las 10010da
+Georgian_man 10010db
+Georgian_nar 10010dc
+Georgian_on 10010dd
+Georgian_par 10010de
+Georgian_zhar 10010df
+Georgian_rae 10010e0
+Georgian_san 10010e1
+Georgian_tar 10010e2
+Georgian_un 10010e3
+Georgian_phar 10010e4
+Georgian_khar 10010e5
+Georgian_ghan 10010e6
+Georgian_qar 10010e7
+Georgian_shin 10010e8
+Georgian_chin 10010e9
+Georgian_can 10010ea
+Georgian_jil 10010eb
+Georgian_cil 10010ec
+Georgian_char 10010ed
+Georgian_xan 10010ee
+Georgian_jhan 10010ef
+Georgian_hae 10010f0
+Georgian_he 10010f1
+Georgian_hie 10010f2
+Georgian_we 10010f3
+Georgian_har 10010f4
+Georgian_hoe 10010f5
+Georgian_fi 10010f6
+Babovedot 1001e02
+babovedot 1001e03
+Dabovedot 1001e0a
+dabovedot 1001e0b
+Fabovedot 1001e1e
+fabovedot 1001e1f
+Lbelowdot 1001e36
+lbelowdot 1001e37
+Mabovedot 1001e40
+mabovedot 1001e41
+Pabovedot 1001e56
+pabovedot 1001e57
+Sabovedot 1001e60
+sabovedot 1001e61
+Tabovedot 1001e6a
+tabovedot 1001e6b
+Wgrave 1001e80
+wgrave 1001e81
+Wacute 1001e82
+wacute 1001e83
+Wdiaeresis 1001e84
+wdiaeresis 1001e85
+Xabovedot 1001e8a
+xabovedot 1001e8b
+Abelowdot 1001ea0
+abelowdot 1001ea1
+Ahook 1001ea2
+ahook 1001ea3
+Acircumflexacute 1001ea4
+acircumflexacute 1001ea5
+Acircumflexgrave 1001ea6
+acircumflexgrave 1001ea7
+Acircumflexhook 1001ea8
+acircumflexhook 1001ea9
+Acircumflextilde 1001eaa
+acircumflextilde 1001eab
+Acircumflexbelowdot 1001eac
+acircumflexbelowdot 1001ead
+Abreveacute 1001eae
+abreveacute 1001eaf
+Abrevegrave 1001eb0
+abrevegrave 1001eb1
+Abrevehook 1001eb2
+abrevehook 1001eb3
+Abrevetilde 1001eb4
+abrevetilde 1001eb5
+Abrevebelowdot 1001eb6
+abrevebelowdot 1001eb7
+Ebelowdot 1001eb8
+ebelowdot 1001eb9
+Ehook 1001eba
+ehook 1001ebb
+Etilde 1001ebc
+etilde 1001ebd
+Ecircumflexacute 1001ebe
+ecircumflexacute 1001ebf
+Ecircumflexgrave 1001ec0
+ecircumflexgrave 1001ec1
+Ecircumflexhook 1001ec2
+ecircumflexhook 1001ec3
+Ecircumflextilde 1001ec4
+ecircumflextilde 1001ec5
+Ecircumflexbelowdot 1001ec6
+ecircumflexbelowdot 1001ec7
+Ihook 1001ec8
+ihook 1001ec9
+Ibelowdot 1001eca
+ibelowdot 1001ecb
+Obelowdot 1001ecc
+obelowdot 1001ecd
+Ohook 1001ece
+ohook 1001ecf
+Ocircumflexacute 1001ed0
+ocircumflexacute 1001ed1
+Ocircumflexgrave 1001ed2
+ocircumflexgrave 1001ed3
+Ocircumflexhook 1001ed4
+ocircumflexhook 1001ed5
+Ocircumflextilde 1001ed6
+ocircumflextilde 1001ed7
+Ocircumflexbelowdot 1001ed8
+ocircumflexbelowdot 1001ed9
+Ohornacute 1001eda
+ohornacute 1001edb
+Ohorngrave 1001edc
+ohorngrave 1001edd
+Ohornhook 1001ede
+ohornhook 1001edf
+Ohorntilde 1001ee0
+ohorntilde 1001ee1
+Ohornbelowdot 1001ee2
+ohornbelowdot 1001ee3
+Ubelowdot 1001ee4
+ubelowdot 1001ee5
+Uhook 1001ee6
+uhook 1001ee7
+Uhornacute 1001ee8
+uhornacute 1001ee9
+Uhorngrave 1001eea
+uhorngrave 1001eeb
+Uhornhook 1001eec
+uhornhook 1001eed
+Uhorntilde 1001eee
+uhorntilde 1001eef
+Uhornbelowdot 1001ef0
+uhornbelowdot 1001ef1
+Ygrave 1001ef2
+ygrave 1001ef3
+Ybelowdot 1001ef4
+ybelowdot 1001ef5
+Yhook 1001ef6
+yhook 1001ef7
+Ytilde 1001ef8
+ytilde 1001ef9
+zerosuperior 1002070
+foursuperior 1002074
+fivesuperior 1002075
+sixsuperior 1002076
+sevensuperior 1002077
+eightsuperior 1002078
+ninesuperior 1002079
+zerosubscript 1002080
+onesubscript 1002081
+twosubscript 1002082
+threesubscript 1002083
+foursubscript 1002084
+fivesubscript 1002085
+sixsubscript 1002086
+sevensubscript 1002087
+eightsubscript 1002088
+ninesubscript 1002089
+EcuSign 10020a0
+ColonSign 10020a1
+CruzeiroSign 10020a2
+FFrancSign 10020a3
+LiraSign 10020a4
+MillSign 10020a5
+NairaSign 10020a6
+PesetaSign 10020a7
+RupeeSign 10020a8
+WonSign 10020a9
+NewSheqelSign 10020aa
+DongSign 10020ab
+partdifferential 1002202
+emptyset 1002205
+elementof 1002208
+notelementof 1002209
+containsas 100220b
+squareroot 100221a
+cuberoot 100221b
+fourthroot 100221c
+dintegral 100222c
+tintegral 100222d
+because 1002235
+notapproxeq 1002247
+approxeq 1002248
+notidentical 1002262
+stricteq 1002263
+braille_blank 1002800
+braille_dots_1 1002801
+braille_dots_2 1002802
+braille_dots_12 1002803
+braille_dots_3 1002804
+braille_dots_13 1002805
+braille_dots_23 1002806
+braille_dots_123 1002807
+braille_dots_4 1002808
+braille_dots_14 1002809
+braille_dots_24 100280a
+braille_dots_124 100280b
+braille_dots_34 100280c
+braille_dots_134 100280d
+braille_dots_234 100280e
+braille_dots_1234 100280f
+braille_dots_5 1002810
+braille_dots_15 1002811
+braille_dots_25 1002812
+braille_dots_125 1002813
+braille_dots_35 1002814
+braille_dots_135 1002815
+braille_dots_235 1002816
+braille_dots_1235 1002817
+braille_dots_45 1002818
+braille_dots_145 1002819
+braille_dots_245 100281a
+braille_dots_1245 100281b
+braille_dots_345 100281c
+braille_dots_1345 100281d
+braille_dots_2345 100281e
+braille_dots_12345 100281f
+braille_dots_6 1002820
+braille_dots_16 1002821
+braille_dots_26 1002822
+braille_dots_126 1002823
+braille_dots_36 1002824
+braille_dots_136 1002825
+braille_dots_236 1002826
+braille_dots_1236 1002827
+braille_dots_46 1002828
+braille_dots_146 1002829
+braille_dots_246 100282a
+braille_dots_1246 100282b
+braille_dots_346 100282c
+braille_dots_1346 100282d
+braille_dots_2346 100282e
+braille_dots_12346 100282f
+braille_dots_56 1002830
+braille_dots_156 1002831
+braille_dots_256 1002832
+braille_dots_1256 1002833
+braille_dots_356 1002834
+braille_dots_1356 1002835
+braille_dots_2356 1002836
+braille_dots_12356 1002837
+braille_dots_456 1002838
+braille_dots_1456 1002839
+braille_dots_2456 100283a
+braille_dots_12456 100283b
+braille_dots_3456 100283c
+braille_dots_13456 100283d
+braille_dots_23456 100283e
+braille_dots_123456 100283f
+braille_dots_7 1002840
+braille_dots_17 1002841
+braille_dots_27 1002842
+braille_dots_127 1002843
+braille_dots_37 1002844
+braille_dots_137 1002845
+braille_dots_237 1002846
+braille_dots_1237 1002847
+braille_dots_47 1002848
+braille_dots_147 1002849
+braille_dots_247 100284a
+braille_dots_1247 100284b
+braille_dots_347 100284c
+braille_dots_1347 100284d
+braille_dots_2347 100284e
+braille_dots_12347 100284f
+braille_dots_57 1002850
+braille_dots_157 1002851
+braille_dots_257 1002852
+braille_dots_1257 1002853
+braille_dots_357 1002854
+braille_dots_1357 1002855
+braille_dots_2357 1002856
+braille_dots_12357 1002857
+braille_dots_457 1002858
+braille_dots_1457 1002859
+braille_dots_2457 100285a
+braille_dots_12457 100285b
+braille_dots_3457 100285c
+braille_dots_13457 100285d
+braille_dots_23457 100285e
+braille_dots_123457 100285f
+braille_dots_67 1002860
+braille_dots_167 1002861
+braille_dots_267 1002862
+braille_dots_1267 1002863
+braille_dots_367 1002864
+braille_dots_1367 1002865
+braille_dots_2367 1002866
+braille_dots_12367 1002867
+braille_dots_467 1002868
+braille_dots_1467 1002869
+braille_dots_2467 100286a
+braille_dots_12467 100286b
+braille_dots_3467 100286c
+braille_dots_13467 100286d
+braille_dots_23467 100286e
+braille_dots_123467 100286f
+braille_dots_567 1002870
+braille_dots_1567 1002871
+braille_dots_2567 1002872
+braille_dots_12567 1002873
+braille_dots_3567 1002874
+braille_dots_13567 1002875
+braille_dots_23567 1002876
+braille_dots_123567 1002877
+braille_dots_4567 1002878
+braille_dots_14567 1002879
+braille_dots_24567 100287a
+braille_dots_124567 100287b
+braille_dots_34567 100287c
+braille_dots_134567 100287d
+braille_dots_234567 100287e
+braille_dots_1234567 100287f
+braille_dots_8 1002880
+braille_dots_18 1002881
+braille_dots_28 1002882
+braille_dots_128 1002883
+braille_dots_38 1002884
+braille_dots_138 1002885
+braille_dots_238 1002886
+braille_dots_1238 1002887
+braille_dots_48 1002888
+braille_dots_148 1002889
+braille_dots_248 100288a
+braille_dots_1248 100288b
+braille_dots_348 100288c
+braille_dots_1348 100288d
+braille_dots_2348 100288e
+braille_dots_12348 100288f
+braille_dots_58 1002890
+braille_dots_158 1002891
+braille_dots_258 1002892
+braille_dots_1258 1002893
+braille_dots_358 1002894
+braille_dots_1358 1002895
+braille_dots_2358 1002896
+braille_dots_12358 1002897
+braille_dots_458 1002898
+braille_dots_1458 1002899
+braille_dots_2458 100289a
+braille_dots_12458 100289b
+braille_dots_3458 100289c
+braille_dots_13458 100289d
+braille_dots_23458 100289e
+braille_dots_123458 100289f
+braille_dots_68 10028a0
+braille_dots_168 10028a1
+braille_dots_268 10028a2
+braille_dots_1268 10028a3
+braille_dots_368 10028a4
+braille_dots_1368 10028a5
+braille_dots_2368 10028a6
+braille_dots_12368 10028a7
+braille_dots_468 10028a8
+braille_dots_1468 10028a9
+braille_dots_2468 10028aa
+braille_dots_12468 10028ab
+braille_dots_3468 10028ac
+braille_dots_13468 10028ad
+braille_dots_23468 10028ae
+braille_dots_123468 10028af
+braille_dots_568 10028b0
+braille_dots_1568 10028b1
+braille_dots_2568 10028b2
+braille_dots_12568 10028b3
+braille_dots_3568 10028b4
+braille_dots_13568 10028b5
+braille_dots_23568 10028b6
+braille_dots_123568 10028b7
+braille_dots_4568 10028b8
+braille_dots_14568 10028b9
+braille_dots_24568 10028ba
+braille_dots_124568 10028bb
+braille_dots_34568 10028bc
+braille_dots_134568 10028bd
+braille_dots_234568 10028be
+braille_dots_1234568 10028bf
+braille_dots_78 10028c0
+braille_dots_178 10028c1
+braille_dots_278 10028c2
+braille_dots_1278 10028c3
+braille_dots_378 10028c4
+braille_dots_1378 10028c5
+braille_dots_2378 10028c6
+braille_dots_12378 10028c7
+braille_dots_478 10028c8
+braille_dots_1478 10028c9
+braille_dots_2478 10028ca
+braille_dots_12478 10028cb
+braille_dots_3478 10028cc
+braille_dots_13478 10028cd
+braille_dots_23478 10028ce
+braille_dots_123478 10028cf
+braille_dots_578 10028d0
+braille_dots_1578 10028d1
+braille_dots_2578 10028d2
+braille_dots_12578 10028d3
+braille_dots_3578 10028d4
+braille_dots_13578 10028d5
+braille_dots_23578 10028d6
+braille_dots_123578 10028d7
+braille_dots_4578 10028d8
+braille_dots_14578 10028d9
+braille_dots_24578 10028da
+braille_dots_124578 10028db
+braille_dots_34578 10028dc
+braille_dots_134578 10028dd
+braille_dots_234578 10028de
+braille_dots_1234578 10028df
+braille_dots_678 10028e0
+braille_dots_1678 10028e1
+braille_dots_2678 10028e2
+braille_dots_12678 10028e3
+braille_dots_3678 10028e4
+braille_dots_13678 10028e5
+braille_dots_23678 10028e6
+braille_dots_123678 10028e7
+braille_dots_4678 10028e8
+braille_dots_14678 10028e9
+braille_dots_24678 10028ea
+braille_dots_124678 10028eb
+braille_dots_34678 10028ec
+braille_dots_134678 10028ed
+braille_dots_234678 10028ee
+braille_dots_1234678 10028ef
+braille_dots_5678 10028f0
+braille_dots_15678 10028f1
+braille_dots_25678 10028f2
+braille_dots_125678 10028f3
+braille_dots_35678 10028f4
+braille_dots_135678 10028f5
+braille_dots_235678 10028f6
+braille_dots_1235678 10028f7
+braille_dots_45678 10028f8
+braille_dots_145678 10028f9
+braille_dots_245678 10028fa
+braille_dots_1245678 10028fb
+braille_dots_345678 10028fc
+braille_dots_1345678 10028fd
+braille_dots_2345678 10028fe
+braille_dots_12345678 10028ff
+"""
+
+table = KeysymTable(_DATA)
+keysyms = _NameMapping(table)
+keysym_strings = _KeysymMapping(table)
@@ -5,18 +5,50 @@ This is basically the companion module of 'keybind.py'. The good news is that
 we don't have to deal with the complexity of X's keysym table. The bad news is
 that mice binding and dragging comes with its own hairball of complexity.
 
-TODO: Mouse bindings that hook into the event dipatcher like the keybind
-      module. Also, functions that abstract the process of using the mouse
-      to drag something.
+The two functions of interest here are 'bind_global_mouse' and 'bind_mouse'.
+Like their keybind counterparts, they automatically hook into the event
+dispatcher in event.py.
+
+Dragging something with the mouse is abstracted by 'start_drag'. It grabs the
+pointer and hands your callback only the latest pointer position, at most
+once per frame of the fastest monitor. So a drag that moves a window sends at most
+one request per tick, no matter how fast the pointer generates motion events.
+A position held back by the rate limit is delivered when the tick ends, even
+if the pointer has stopped moving.
+For example, from a ButtonPress callback:
+
+ ::
+
+    def begin_move(e):
+        x, y, _, _ = window.get_geometry(client)
+        dx, dy = e.root_x - x, e.root_y - y
+
+        def move(px, py):
+            ewmh.request_moveresize_window(client, x=px - dx, y=py - dy)
+
+        mousebind.start_drag(xpybutil.root, move)
+
+Click-to-focus, where a click both focuses a window and (usually) still
+reaches it, is provided by 'bind_click_to_focus'.
 """
+from array import array
 from collections import defaultdict
+import struct
+import threading
 
-from xpybutil.compat import xproto
+from xpybutil.compat import xcb_Exception, xproto
 
-from xpybutil import conn, root
+from xpybutil import conn, root, event, keybind, util, xinerama
 
-__mousebinds = defaultdict(list)
+__mousebinds = defaultdict(list) # (window, cleaned state, button) -> handlers
 __mousegrabs = defaultdict(int) # Mouse grab key -> number of grabs
+__drag = None # State of the drag in progress, if any
+
+DRAG_RATE = 60 # Drag updates per second if no refresh rate is known
+CLICK_TIMEOUT = 1.0 # Seconds the pointer may stay frozen by a click grab
+
+# A signed array type wide enough for 32 bit timestamps and 16 bit coordinates.
+__timecoord_type = 'l' if array('l').itemsize >= 8 else 'd'
 
 EM = xproto.EventMask
 GM = xproto.GrabMode
@@ -27,6 +59,10 @@ TRIVIAL_MODS = [
     xproto.ModMask.Lock | xproto.ModMask._2
 ]
 
+# Keeps only the non-trivial modifiers of a button event's state. (Button
+# events also carry masks for the buttons held down, which we ignore.)
+__mods_mask = 0xff & ~(xproto.ModMask.Lock | xproto.ModMask._2)
+
 def parse_buttonstring(button_string):
     """
     A utility function to turn strings like 'Mod1-Shift-3' into a pair
@@ -68,6 +104,46 @@ def grab_pointer(grab_win, confine, cursor):
                                  confine, cursor,
                                  xproto.Time.CurrentTime).reply()
 
+def get_motion_events(window, start=0, stop=xproto.Time.CurrentTime):
+    """
+    Fetches the pointer motion history that the X server kept between the
+    timestamps ``start`` and ``stop``, for motion within ``window``. This is
+    a single request, so it is far cheaper to analyze a gesture or a drag
+    after the fact with this than to handle every MotionNotify event.
+
+    The history is decoded in one pass into a flat array of
+    ``(time, x, y)`` triples, where x and y are relative to ``window``:
+
+     ::
+
+        history = get_motion_events(root, start_time)
+        for i in range(0, len(history), 3):
+            t, x, y = history[i:i + 3]
+
+    N.B. Servers are not required to keep a motion history at all, in which
+    case the array is empty. (See the ``motion_buffer_size`` of the setup.)
+
+    :param window: A window identifier.
+    :type window: int
+    :param start: The earliest timestamp to include.
+    :param stop: The latest timestamp to include.
+    :return: A flat array of times and coordinates.
+    :rtype: array.array
+    """
+    events = conn.core.GetMotionEvents(window, start, stop).reply().events
+    n = len(events)
+
+    if hasattr(events, 'buf'):
+        raw = bytes(events.buf())
+        if len(raw) == 8 * n: # CARD32 time, INT16 x, INT16 y
+            return array(__timecoord_type, struct.unpack('=' + 'Ihh' * n, raw))
+
+    history = array(__timecoord_type)
+    for tc in events:
+        history.extend((tc.time, tc.x, tc.y))
+
+    return history
+
 def ungrab_pointer():
     """
     This will release a grab initiated by ``grab_pointer``.
@@ -76,6 +152,97 @@ def ungrab_pointer():
     """
     conn.core.UngrabPointerChecked(xproto.Time.CurrentTime).check()
 
+def start_drag(grab_win, motion_cb, end_cb=None, cursor=0, rate=None):
+    """
+    Starts dragging with the mouse. This is typically called from a
+    ButtonPress callback, and the drag lasts until any button is released or
+    Escape is pressed. The pointer (and, if possible, the keyboard) is
+    grabbed for the duration of the drag.
+
+    ``motion_cb`` is called with the root coordinates of the pointer, but at
+    most ``rate`` times per second. By default, that's the highest refresh
+    rate of any monitor reported by ``xinerama.get_topology``, or
+    ``DRAG_RATE`` if it isn't known.
+    Motion events that are already superseded by a newer one in the queue
+    are skipped entirely. xpybutil flushes the connection after every call,
+    so anything ``motion_cb`` sends goes out immediately.
+
+    When the drag stops, ``end_cb`` is called with the last root coordinates
+    of the pointer and whether the drag was cancelled with Escape. If it
+    wasn't cancelled, ``motion_cb`` is always called with the final position
+    first.
+
+    N.B. This requires ``event.main()`` (or your own loop calling
+    ``event.read`` and dispatching) to be running.
+
+    :param grab_win: A window identifier to report pointer events to.
+    :type grab_win: int
+    :param motion_cb: A function taking the pointer's root x and y.
+    :type motion_cb: function
+    :param end_cb: A function taking the pointer's root x and y, and a bool
+                   that is True if the drag was cancelled.
+    :type end_cb: function
+    :param cursor: A cursor identifier to show during the drag.
+    :param rate: The maximum number of ``motion_cb`` calls per second.
+                 (The highest monitor refresh rate if None.)
+    :type rate: float
+    :return: True if the drag started, False otherwise. (i.e., another drag
+             is in progress, or somebody else has the pointer grabbed.)
+    :rtype: bool
+    """
+    global __drag
+
+    if __drag is not None:
+        return False
+
+    GS = xproto.GrabStatus
+    if grab_pointer(grab_win, 0, cursor).status != GS.Success:
+        return False
+    keyboard = keybind.grab_keyboard(grab_win).status == GS.Success
+
+    if rate is None:
+        rate = __refresh_rate()
+
+    __drag = {
+        'motion': motion_cb,
+        'end': end_cb,
+        'keyboard': keyboard,
+        'interval': int(1000 / rate), # X timestamps are in milliseconds
+        'last_time': None,
+        'last_pos': None,
+        'pos': None,
+        'pending': None, # 'event.call_later' handle of the delayed update
+    }
+
+    for event_name, cb in (('MotionNotify', __drag_motion),
+                           ('ButtonRelease', __drag_release),
+                           ('KeyPress', __drag_key)):
+        if not event.is_connected(event_name, grab_win, cb):
+            event.connect(event_name, grab_win, cb)
+
+    return True
+
+def is_dragging():
+    """
+    Returns whether a drag started with ``start_drag`` is in progress.
+
+    :rtype: bool
+    """
+    return __drag is not None
+
+def stop_drag(cancelled=True):
+    """
+    Stops the drag in progress, if any, as if Escape was pressed (or, if
+    ``cancelled`` is False, as if the button was released).
+
+    :param cancelled: Whether the drag is stopped as cancelled.
+    :type cancelled: bool
+    :rtype: void
+    """
+    if __drag is not None:
+        pos = __drag['pos'] or __drag['last_pos'] or (0, 0)
+        __end_drag(pos[0], pos[1], cancelled)
+
 def grab_button(wid, modifiers, button, propagate=False):
     """
     Grabs a mouse button for a particular window and a modifiers/key value.
@@ -110,16 +277,15 @@ def grab_button(wid, modifiers, button, propagate=False):
     """
     mask = EM.ButtonPress | EM.ButtonRelease | EM.ButtonMotion
 
-    try:
-        for mod in TRIVIAL_MODS:
-            conn.core.GrabButtonChecked(True, wid, mask,
-                                        GM.Sync if propagate else GM.Async,
-                                        GM.Async, 0, 0,
-                                        button, modifiers | mod).check()
-
-        return True
-    except xproto.BadAccess:
-        return False
+    # Send every grab before checking any of them, so that this costs a single
+    # round trip instead of one per trivial modifier.
+    cookies = [conn.core.GrabButtonChecked(True, wid, mask,
+                                           GM.Sync if propagate else GM.Async,
+                                           GM.Async, 0, 0,
+                                           button, modifiers | mod)
+               for mod in TRIVIAL_MODS]
+
+    return __check_all(cookies)
 
 def ungrab_button(wid, modifiers, button):
     """
@@ -137,13 +303,10 @@ def ungrab_button(wid, modifiers, button):
     :type button: int
     :rtype: bool
     """
-    try:
-        for mod in TRIVIAL_MODS:
-            conn.core.UngrabButtonChecked(button, wid, modifiers | mod).check()
+    cookies = [conn.core.UngrabButtonChecked(button, wid, modifiers | mod)
+               for mod in TRIVIAL_MODS]
 
-        return True
-    except xproto.BadAccess:
-        return False
+    return __check_all(cookies)
 
 def bind_global_mouse(event_type, key_string, cb):
     """
@@ -155,7 +318,8 @@ def bind_global_mouse(event_type, key_string, cb):
                        Namely, a list of zero or more modifiers separated by
                        '-', followed by a single button digit.
     :type key_string: str
-    :param cb: A first class function with no parameters.
+    :param cb: A first class function with no parameters, or with a single
+               parameter that receives the Button{Press,Release} event.
     :type cb: function
     :return: True if the binding was successful, False otherwise.
     :rtype: bool
@@ -163,5 +327,303 @@ def bind_global_mouse(event_type, key_string, cb):
     return bind_mouse(event_type, root, key_string, cb)
 
 def bind_mouse(event_type, wid, button_string, cb):
-    raise NotImplemented
+    """
+    Binds a function ``cb`` to a particular button press ``button_string`` on
+    a window ``wid``. Whether it's a button release or button press binding is
+    determined by ``event_type``.
+
+    ``bind_mouse`` will automatically hook into the ``event`` module's
+    dispatcher, so that if you're using ``event.main()`` for your main loop,
+    everything will be taken care of for you.
+
+    :param event_type: Either 'ButtonPress' or 'ButtonRelease'.
+    :type event_type: str
+    :param wid: The window to bind the button grab to.
+    :type wid: int
+    :param button_string: A string of the form 'Mod1-Control-3'.
+                          Namely, a list of zero or more modifiers separated
+                          by '-', followed by a single button digit.
+    :type button_string: str
+    :param cb: A first class function with no parameters, or with a single
+               parameter that receives the Button{Press,Release} event.
+    :type cb: function
+    :return: True if the binding was successful, False otherwise.
+    :rtype: bool
+    """
+    assert event_type in ('ButtonPress', 'ButtonRelease')
+
+    mods, button = parse_buttonstring(button_string)
+    if not button:
+        return False
+
+    key = (wid, mods, button)
+    if not __mousegrabs[key] and not grab_button(wid, mods, button):
+        return False
+
+    etype = getattr(xproto, '%sEvent' % event_type)
+    __mousebinds[key].append((etype, util.event_callback(cb)))
+    __mousegrabs[key] += 1
+
+    if not event.is_connected(event_type, wid, __run_mousebind_callbacks):
+        event.connect(event_type, wid, __run_mousebind_callbacks)
+
+    return True
+
+def bind_click_to_focus(wid, button_string='1', consume=None,
+                        raise_window=True, timeout=CLICK_TIMEOUT):
+    """
+    Makes clicking on ``wid`` focus it (and raise it, if ``raise_window`` is
+    True). This is done with a synchronous button grab, which freezes the
+    pointer until xpybutil decides what to do with the click. If
+    ``consume`` is given, it is called with the ButtonPress event and should
+    return True if the click should be swallowed. Otherwise, the click is
+    replayed to the window, as if it had never been grabbed.
+
+    The focus, raise and AllowEvents requests are all sent unchecked and
+    flushed together, so handling a click costs no round trips.
+
+    If ``consume`` takes longer than ``timeout`` seconds, the pointer is
+    unfrozen anyway from a watchdog thread so that the whole desktop doesn't
+    lock up. (The click is then consumed.) Without ``consume``, no thread is
+    involved.
+
+    :param wid: A window identifier.
+    :type wid: int
+    :param button_string: A string of the form 'Mod1-Control-3'.
+    :type button_string: str
+    :param consume: A function that takes the ButtonPress event and returns
+                    whether the click should be swallowed.
+    :type consume: function
+    :param raise_window: Whether to raise ``wid`` on a click.
+    :type raise_window: bool
+    :param timeout: Seconds before a frozen pointer is forcibly released.
+    :type timeout: float
+    :return: True if the binding was successful, False otherwise.
+    :rtype: bool
+    """
+    mods, button = parse_buttonstring(button_string)
+    if not button:
+        return False
+
+    key = (wid, mods, button)
+    if __mousegrabs[key] or not grab_button(wid, mods, button, propagate=True):
+        return False
+
+    def cb(e):
+        __click_to_focus(e, consume, raise_window, timeout)
+
+    __mousebinds[key].append((xproto.ButtonPressEvent, cb))
+    __mousegrabs[key] += 1
+
+    if not event.is_connected('ButtonPress', wid, __run_mousebind_callbacks):
+        event.connect('ButtonPress', wid, __run_mousebind_callbacks)
+
+    return True
+
+def __click_to_focus(e, consume, raise_window, timeout):
+    """
+    A private function that decides the fate of a click that froze the
+    pointer, then focuses (and raises) the window and unfreezes the pointer
+    in a single flush.
+
+    :param e: A ButtonPress event from a synchronous grab.
+    :type e: xcb.xproto.ButtonPressEvent
+    :rtype: void
+    """
+    # Only a 'consume' callback can keep us from unfreezing the pointer
+    # right away, so only then is a watchdog needed.
+    watchdog = None
+    if consume is not None:
+        watchdog = threading.Timer(timeout, __release_frozen_pointer)
+        watchdog.daemon = True
+        watchdog.start()
+
+    consumed = True
+    try:
+        consumed = consume is not None and consume(e)
+    finally:
+        if watchdog is not None:
+            watchdog.cancel()
+
+        conn.core.SetInputFocus(xproto.InputFocus.PointerRoot, e.event, e.time)
+        if raise_window:
+            conn.core.ConfigureWindow(e.event, xproto.ConfigWindow.StackMode,
+                                      [xproto.StackMode.Above])
+
+        if consumed:
+            event.allow_events(xproto.Allow.AsyncPointer, e.time)
+        else:
+            event.allow_events(xproto.Allow.ReplayPointer, e.time)
+        conn.flush()
+
+def __release_frozen_pointer():
+    """
+    A private function, run by the watchdog of ``__click_to_focus``, that
+    unfreezes the pointer.
+
+    :rtype: void
+    """
+    event.allow_events(xproto.Allow.AsyncPointer)
+    conn.flush()
+
+def __run_mousebind_callbacks(e):
+    """
+    A private function that intercepts all button press/release events, and
+    runs their corresponding callback functions. Only the non-trivial
+    modifiers of the event's state are used to find the right callbacks.
+
+    Callbacks are called in the order that they have been added. (FIFO.)
+
+    :param e: A Button{Press,Release} event.
+    :type e: xcb.xproto.Button{Press,Release}Event
+    :rtype: void
+    """
+    handlers = __mousebinds.get((e.event, e.state & __mods_mask, e.detail))
+    if handlers:
+        for etype, cb in handlers:
+            if isinstance(e, etype):
+                cb(e)
+
+def __drag_motion(e):
+    """
+    A private function that coalesces pointer motion during a drag and passes
+    the latest position along at most once per tick.
+
+    :param e: A MotionNotify event.
+    :type e: xcb.xproto.MotionNotifyEvent
+    :rtype: void
+    """
+    d = __drag
+    if d is None:
+        return
+
+    d['pos'] = (e.root_x, e.root_y)
+
+    nxt = event.peek_next()
+    if isinstance(nxt, xproto.MotionNotifyEvent) and nxt.event == e.event:
+        return
+    if d['last_time'] is not None:
+        elapsed = (e.time - d['last_time']) & 0xffffffff
+        if elapsed < d['interval']:
+            # Deliver this position when the tick ends, unless a newer
+            # motion event does first.
+            if d['pending'] is None:
+                wait = d['interval'] - elapsed
+                tick_end = (e.time + wait) & 0xffffffff
+                d['pending'] = event.call_later(
+                    wait / 1000.0, lambda: __drag_tick(d, tick_end))
+            return
+
+    d['last_time'] = e.time
+    __drag_update(d)
+
+def __drag_release(e):
+    """
+    A private function that finishes a drag when a button is released.
+
+    :param e: A ButtonRelease event.
+    :type e: xcb.xproto.ButtonReleaseEvent
+    :rtype: void
+    """
+    if __drag is not None:
+        __end_drag(e.root_x, e.root_y, False)
+
+def __drag_key(e):
+    """
+    A private function that cancels a drag when Escape is pressed.
+
+    :param e: A KeyPress event.
+    :type e: xcb.xproto.KeyPressEvent
+    :rtype: void
+    """
+    if __drag is not None and keybind.get_keysym(e.detail) == 0xff1b: # Escape
+        __end_drag(e.root_x, e.root_y, True)
+
+def __drag_tick(d, time):
+    """
+    A private function, scheduled by ``__drag_motion``, that delivers a
+    position that was held back by the rate limit once the tick is over.
+
+    :param time: The X timestamp at which the tick ended.
+    :rtype: void
+    """
+    d['pending'] = None
+    if __drag is d:
+        d['last_time'] = time
+        __drag_update(d)
+
+def __drag_update(d):
+    """
+    A private function that hands the latest pointer position to the drag's
+    motion callback, unless it already has it, and flushes whatever the
+    callback sent.
+
+    :rtype: void
+    """
+    if d['pending'] is not None:
+        event.cancel_call(d['pending'])
+        d['pending'] = None
+    if d['pos'] is not None and d['pos'] != d['last_pos']:
+        d['last_pos'] = d['pos']
+        d['motion'](*d['pos'])
+        conn.flush()
+
+def __end_drag(x, y, cancelled):
+    """
+    A private function that releases the grabs of the drag in progress and
+    runs its end callback.
+
+    :rtype: void
+    """
+    global __drag
+
+    d, __drag = __drag, None
+    if d['pending'] is not None:
+        event.cancel_call(d['pending'])
+
+    conn.core.UngrabPointer(xproto.Time.CurrentTime)
+    if d['keyboard']:
+        conn.core.UngrabKeyboard(xproto.Time.CurrentTime)
+
+    if not cancelled:
+        d['pos'] = (x, y)
+        __drag_update(d)
+    if d['end'] is not None:
+        d['end'](x, y, cancelled)
+
+    conn.flush()
+
+def __refresh_rate():
+    """
+    A private function that finds the highest refresh rate of any monitor.
+    The topology is cached by ``xinerama``, so this usually doesn't cost a
+    round trip.
+
+    :return: The refresh rate in Hz, or DRAG_RATE if it isn't known.
+    :rtype: float
+    """
+    try:
+        rates = [mon.refresh for mon in xinerama.get_topology()]
+    except xcb_Exception:
+        rates = []
+
+    return max(rates + [0]) or DRAG_RATE
+
+def __check_all(cookies):
+    """
+    A private function that checks every cookie of a batch of grab requests,
+    even after one has failed, so that no error is left behind.
+
+    :param cookies: A list of void cookies from checked requests.
+    :return: True if none of the requests failed with BadAccess.
+    :rtype: bool
+    """
+    ok = True
+    for cookie in cookies:
+        try:
+            cookie.check()
+        except xproto.BadAccess:
+            ok = False
+
+    return ok
 
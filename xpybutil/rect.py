@@ -3,10 +3,32 @@ This module has a few utility functions that perform math on rectangles.
 
 For example, finding the area of intersection of two rectangles with
 ``rect_intersect_area``, or getting the rectangle of a monitor after accounting
-for struts with ``monitor_rects``.
+for struts with ``monitor_rects``. A ``WorkareaTracker`` keeps those
+rectangles up to date from events instead.
+
+To ask questions of many rectangles at once (i.e., which windows overlap a
+region, or which window is nearest to a point), put them in a
+``RectIndex``.
+
+A ``Region`` is an arbitrary set of pixels made out of rectangles, which
+supports union, intersection and subtraction. (i.e., the free space on a
+monitor is its workarea minus the windows on it.)
+
+The functions ``intersect_areas``, ``best_monitors``, ``clip_rects`` and
+``subtract_rect`` work on many rectangles at once. If NumPy is installed,
+they take and return N x 4 arrays and do their work in vectorized form.
+Otherwise, they fall back to pure Python and return lists.
 """
+from bisect import bisect_right
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from xpybutil.compat import xproto
 
+from xpybutil import conn, root, event
 import xpybutil.ewmh as ewmh
 import xpybutil.window as window
 
@@ -53,64 +75,894 @@ def get_monitor_area(search, monitors):
 
     return mon
 
+def intersect_areas(rects1, rects2):
+    """
+    Computes the area of intersection of every rectangle in 'rects1' with
+    every rectangle in 'rects2'. (The bulk version of
+    ``rect_intersect_area``.)
+
+    :param rects1: N rectangles, as a list of 4-tuples or an N x 4 array.
+    :param rects2: M rectangles, as a list of 4-tuples or an M x 4 array.
+    :return: An N x M matrix of areas, where entry (i, j) is the area of
+             intersection of ``rects1[i]`` and ``rects2[j]``.
+    :rtype: numpy.ndarray or [[int]]
+    """
+    if numpy is not None:
+        a, b = __as_array(rects1), __as_array(rects2)
+        ax, ay = a[:, 0, None], a[:, 1, None]
+        bx, by = b[None, :, 0], b[None, :, 1]
+        iw = (numpy.minimum(ax + a[:, 2, None], bx + b[None, :, 2])
+              - numpy.maximum(ax, bx))
+        ih = (numpy.minimum(ay + a[:, 3, None], by + b[None, :, 3])
+              - numpy.maximum(ay, by))
+        return numpy.maximum(iw, 0) * numpy.maximum(ih, 0)
+
+    rects2 = [tuple(r) for r in rects2]
+    return [[rect_intersect_area(tuple(r1), r2) for r2 in rects2]
+            for r1 in rects1]
+
+def best_monitors(rects, monitors):
+    """
+    Finds the monitor with the most overlap with each rectangle. (The bulk
+    version of ``get_monitor_area``.) Ties go to the first monitor.
+
+    :param rects: N rectangles, as a list of 4-tuples or an N x 4 array.
+    :param monitors: M monitor rectangles, as a list of 4-tuples or an
+                     M x 4 array.
+    :return: N monitor indices, with -1 for rectangles that don't overlap
+             any monitor.
+    :rtype: numpy.ndarray or [int]
+    """
+    areas = intersect_areas(rects, monitors)
+    if numpy is not None:
+        if areas.shape[1] == 0:
+            return numpy.full(areas.shape[0], -1, dtype=numpy.int64)
+        best = areas.argmax(axis=1)
+        best[areas.max(axis=1) == 0] = -1
+        return best
+
+    best = []
+    for row in areas:
+        i, area = -1, 0
+        for j, a in enumerate(row):
+            if a > area:
+                i, area = j, a
+        best.append(i)
+    return best
+
+def clip_rects(rects, areas):
+    """
+    Clips each rectangle to an area (i.e., the workarea of its monitor).
+    A rectangle entirely outside of its area ends up with a width and/or
+    height of zero.
+
+    :param rects: N rectangles, as a list of 4-tuples or an N x 4 array.
+    :param areas: Either N rectangles (one for each rectangle in 'rects') or
+                  a single 4-tuple to clip every rectangle to.
+    :return: N clipped rectangles.
+    :rtype: numpy.ndarray or [(top_left_x, top_left_y, width, height)]
+    """
+    if numpy is not None:
+        r, a = __as_array(rects), __as_array(areas)
+        x = numpy.maximum(r[:, 0], a[:, 0])
+        y = numpy.maximum(r[:, 1], a[:, 1])
+        x2 = numpy.minimum(r[:, 0] + r[:, 2], a[:, 0] + a[:, 2])
+        y2 = numpy.minimum(r[:, 1] + r[:, 3], a[:, 1] + a[:, 3])
+        return numpy.stack([x, y, numpy.maximum(x2 - x, 0),
+                            numpy.maximum(y2 - y, 0)], axis=1)
+
+    rects = [tuple(r) for r in rects]
+    if len(areas) == 4 and not hasattr(areas[0], '__len__'):
+        areas = [tuple(areas)] * len(rects)
+
+    clipped = []
+    for (rx, ry, rw, rh), (ax, ay, aw, ah) in zip(rects, areas):
+        x, y = max(rx, ax), max(ry, ay)
+        x2, y2 = min(rx + rw, ax + aw), min(ry + rh, ay + ah)
+        clipped.append((x, y, max(x2 - x, 0), max(y2 - y, 0)))
+    return clipped
+
+def subtract_rect(rects, hole):
+    """
+    Subtracts a rectangle from each of many rectangles. What's left of each
+    rectangle is split into (at most) four rectangles: a band above the
+    hole, a band below it, and pieces to its left and right. Rectangles that
+    don't overlap the hole are left as they are, in a single piece.
+
+    :param rects: N rectangles, as a list of 4-tuples or an N x 4 array.
+    :param hole: Either a single 4-tuple to subtract from every rectangle,
+                 or N rectangles (one for each rectangle in 'rects').
+    :return: A pair of the remaining pieces and, for each piece, the index
+             of the rectangle in 'rects' it came from. Pieces of the same
+             rectangle are disjoint.
+    :rtype: (numpy.ndarray, numpy.ndarray) or
+            ([(top_left_x, top_left_y, width, height)], [int])
+    """
+    if numpy is not None:
+        r, h = __as_array(rects), __as_array(hole)
+        rx, ry, rw, rh, hx, hy, hw, hh = numpy.broadcast_arrays(
+            r[:, 0], r[:, 1], r[:, 2], r[:, 3],
+            h[:, 0], h[:, 1], h[:, 2], h[:, 3])
+        rx2, ry2 = rx + rw, ry + rh
+
+        # Clamp the hole to each rectangle first.
+        ix, iy = numpy.maximum(hx, rx), numpy.maximum(hy, ry)
+        ix2 = numpy.minimum(hx + hw, rx2)
+        iy2 = numpy.minimum(hy + hh, ry2)
+        overlap = (ix < ix2) & (iy < iy2)
+
+        pieces = numpy.stack([
+            numpy.stack([rx, ry, rw, numpy.where(overlap, iy - ry, rh)],
+                        axis=1),
+            numpy.stack([rx, iy2, rw, ry2 - iy2], axis=1),
+            numpy.stack([rx, iy, ix - rx, iy2 - iy], axis=1),
+            numpy.stack([ix2, iy, rx2 - ix2, iy2 - iy], axis=1),
+        ], axis=1)
+        whole = numpy.zeros((len(rx), 4), dtype=bool)
+        whole[:, 0] = True
+        owners = numpy.repeat(numpy.arange(len(rx)), 4)
+        keep = (overlap[:, None] | whole).reshape(-1)
+        pieces = pieces.reshape(-1, 4)
+        keep &= (pieces[:, 2] > 0) & (pieces[:, 3] > 0)
+        return pieces[keep], owners[keep]
+
+    rects = [tuple(r) for r in rects]
+    if len(hole) == 4 and not hasattr(hole[0], '__len__'):
+        hole = [tuple(hole)] * len(rects)
+
+    pieces, owners = [], []
+    for i, ((rx, ry, rw, rh), (hx, hy, hw, hh)) in enumerate(zip(rects, hole)):
+        rx2, ry2 = rx + rw, ry + rh
+        ix, iy = max(hx, rx), max(hy, ry)
+        ix2, iy2 = min(hx + hw, rx2), min(hy + hh, ry2)
+        if ix < ix2 and iy < iy2:
+            candidates = ((rx, ry, rw, iy - ry),
+                          (rx, iy2, rw, ry2 - iy2),
+                          (rx, iy, ix - rx, iy2 - iy),
+                          (ix2, iy, rx2 - ix2, iy2 - iy))
+        else:
+            candidates = ((rx, ry, rw, rh),)
+        for piece in candidates:
+            if piece[2] > 0 and piece[3] > 0:
+                pieces.append(piece)
+                owners.append(i)
+    return pieces, owners
+
+class RectIndex(object):
+    """
+    A spatial index of rectangles (i.e., windows or monitors) that answers
+    point, overlap and nearest neighbor queries without looking at every
+    rectangle. Rectangles are bucketed into a uniform grid of square cells,
+    so queries only look at the rectangles in the cells they touch.
+
+    Each rectangle is stored under a key of your choosing, typically a
+    window identifier or a monitor index:
+
+      ::
+
+        index = rect.RectIndex()
+        for wid in clients:
+          index.insert(wid, window.get_geometry(wid))
+        under_pointer = index.at_point(px, py)
+
+    The cell size should be about the size of a typical rectangle. Very
+    large rectangles (compared to the cell size) make updates slower, and
+    very small ones make queries slower.
+    """
+    def __init__(self, cell_size=256):
+        """
+        :param cell_size: The width and height of each grid cell.
+        :type cell_size: int
+        """
+        assert cell_size > 0
+        self.cell_size = cell_size
+        self.__rects = {} # key -> rect
+        self.__grid = {} # (column, row) -> set of keys
+
+    def __len__(self):
+        return len(self.__rects)
+
+    def __contains__(self, key):
+        return key in self.__rects
+
+    def __iter__(self):
+        return iter(self.__rects)
+
+    def rect(self, key):
+        """
+        :return: The rectangle stored under 'key'.
+        :rtype: (top_left_x, top_left_y, width, height)
+        """
+        return self.__rects[key]
+
+    def insert(self, key, rect):
+        """
+        Adds a rectangle to the index. If 'key' is already in the index, its
+        rectangle is replaced.
+
+        :param key: Any hashable value identifying the rectangle.
+        :param rect: A 4-tuple representing a rectangle.
+        :rtype: void
+        """
+        if key in self.__rects:
+            self.remove(key)
+        rect = tuple(rect)
+        self.__rects[key] = rect
+        for cell in self.__cells(rect):
+            self.__grid.setdefault(cell, set()).add(key)
+
+    def move(self, key, rect):
+        """
+        Changes the rectangle stored under 'key'. Only the grid cells that
+        the rectangle leaves or enters are touched.
+
+        :param key: A key already in the index.
+        :param rect: A 4-tuple representing the new rectangle.
+        :rtype: void
+        """
+        rect = tuple(rect)
+        old = set(self.__cells(self.__rects[key]))
+        new = set(self.__cells(rect))
+        self.__rects[key] = rect
+        for cell in old - new:
+            self.__discard(cell, key)
+        for cell in new - old:
+            self.__grid.setdefault(cell, set()).add(key)
+
+    def remove(self, key):
+        """
+        Removes a rectangle from the index.
+
+        :param key: A key already in the index.
+        :rtype: void
+        """
+        for cell in self.__cells(self.__rects.pop(key)):
+            self.__discard(cell, key)
+
+    def at_point(self, x, y):
+        """
+        :return: The keys of all rectangles containing the point (x, y).
+        :rtype: [key]
+        """
+        cs = self.cell_size
+        found = []
+        for key in self.__grid.get((x // cs, y // cs), ()):
+            rx, ry, rw, rh = self.__rects[key]
+            if rx <= x < rx + rw and ry <= y < ry + rh:
+                found.append(key)
+        return found
+
+    def overlapping(self, rect):
+        """
+        :param rect: A 4-tuple representing a rectangle.
+        :return: The keys of all rectangles that overlap 'rect'. (Rectangles
+                 that merely touch it don't count.)
+        :rtype: [key]
+        """
+        seen, found = set(), []
+        for cell in self.__cells(rect):
+            for key in self.__grid.get(cell, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                if rect_intersect_area(self.__rects[key], rect) > 0:
+                    found.append(key)
+        return found
+
+    def max_overlap(self, rect):
+        """
+        The indexed version of ``get_monitor_area``.
+
+        :param rect: A 4-tuple representing a rectangle.
+        :return: The key of the rectangle with the most overlap with 'rect',
+                 or None if nothing overlaps it.
+        """
+        best, best_area = None, 0
+        for key in self.overlapping(rect):
+            area = rect_intersect_area(self.__rects[key], rect)
+            if area > best_area:
+                best, best_area = key, area
+        return best
+
+    def nearest(self, x, y, exclude=()):
+        """
+        Finds the rectangle closest to the point (x, y). A rectangle that
+        contains the point has a distance of zero. Cells are searched in
+        growing rings around the point, so this only looks at far away
+        rectangles if there is nothing close by.
+
+        :param exclude: Keys to ignore (i.e., the window that has focus).
+        :return: The key of the closest rectangle, or None if there is none.
+        """
+        exclude = set(exclude)
+        remaining = len(self.__rects) - len(exclude & set(self.__rects))
+        cs = self.cell_size
+        col, row = x // cs, y // cs
+
+        best, best_d2 = None, None
+        seen = set()
+        ring = 0
+        while len(seen) < remaining:
+            if best is not None and best_d2 <= ((ring - 1) * cs) ** 2:
+                break
+            for cell in self.__ring(col, row, ring):
+                for key in self.__grid.get(cell, ()):
+                    if key in seen or key in exclude:
+                        continue
+                    seen.add(key)
+                    d2 = self.__distance2(self.__rects[key], x, y)
+                    if best is None or d2 < best_d2:
+                        best, best_d2 = key, d2
+            ring += 1
+        return best
+
+    def __cells(self, rect):
+        x, y, w, h = rect
+        cs = self.cell_size
+        for col in range(x // cs, (x + max(w, 1) - 1) // cs + 1):
+            for row in range(y // cs, (y + max(h, 1) - 1) // cs + 1):
+                yield col, row
+
+    def __discard(self, cell, key):
+        keys = self.__grid[cell]
+        keys.discard(key)
+        if not keys:
+            del self.__grid[cell]
+
+    @staticmethod
+    def __ring(col, row, ring):
+        if ring == 0:
+            yield col, row
+            return
+        for c in range(col - ring, col + ring + 1):
+            yield c, row - ring
+            yield c, row + ring
+        for r in range(row - ring + 1, row + ring):
+            yield col - ring, r
+            yield col + ring, r
+
+    @staticmethod
+    def __distance2(rect, x, y):
+        rx, ry, rw, rh = rect
+        dx = max(rx - x, 0, x - (rx + rw - 1))
+        dy = max(ry - y, 0, y - (ry + rh - 1))
+        return dx * dx + dy * dy
+
+class Region(object):
+    """
+    A set of pixels, stored as a list of disjoint horizontal bands in the
+    style of X regions: each band covers a range of rows and holds the
+    sorted, disjoint ranges of columns covered on those rows. Adjacent bands
+    that cover the same columns are merged, so two regions covering the same
+    pixels are always stored the same way.
+
+    Regions are immutable. Union, intersection and subtraction (also
+    available as the ``|``, ``&`` and ``-`` operators) return new regions
+    and take time proportional to the number of bands and columns involved,
+    not the number of pixels:
+
+      ::
+
+        free = rect.Region([workarea]) - rect.Region(window_rects)
+        x, y, w, h = free.largest_rect()
+    """
+    def __init__(self, rects=()):
+        """
+        :param rects: A list of 4-tuples representing rectangles. They may
+                      overlap. Empty rectangles are ignored.
+        """
+        regions = [[(y, y + h, (x, x + w))] for x, y, w, h in rects
+                   if w > 0 and h > 0]
+        while len(regions) > 1:
+            merged = [Region.__combine(a, b, Region.__union)
+                      for a, b in zip(regions[::2], regions[1::2])]
+            if len(regions) % 2:
+                merged.append(regions[-1])
+            regions = merged
+        self.__bands = regions[0] if regions else []
+
+    def __eq__(self, other):
+        return isinstance(other, Region) and self.__bands == other.__bands
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __bool__(self):
+        return bool(self.__bands)
+    __nonzero__ = __bool__
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __and__(self, other):
+        return self.intersect(other)
+
+    def __sub__(self, other):
+        return self.subtract(other)
+
+    def union(self, other):
+        """
+        :param other: A Region or a list of 4-tuples representing rectangles.
+        :return: The pixels in either region.
+        :rtype: Region
+        """
+        return self.__apply(other, Region.__union)
+
+    def intersect(self, other):
+        """
+        :param other: A Region or a list of 4-tuples representing rectangles.
+        :return: The pixels in both regions.
+        :rtype: Region
+        """
+        return self.__apply(other, Region.__intersection)
+
+    def subtract(self, other):
+        """
+        :param other: A Region or a list of 4-tuples representing rectangles.
+        :return: The pixels in this region that aren't in 'other'.
+        :rtype: Region
+        """
+        return self.__apply(other, Region.__difference)
+
+    def rects(self):
+        """
+        :return: Disjoint rectangles covering the region, top to bottom and
+                 then left to right.
+        :rtype: [(top_left_x, top_left_y, width, height)]
+        """
+        return [(spans[i], y1, spans[i + 1] - spans[i], y2 - y1)
+                for y1, y2, spans in self.__bands
+                for i in range(0, len(spans), 2)]
+
+    def area(self):
+        """
+        :return: The number of pixels in the region.
+        :rtype: int
+        """
+        return sum((y2 - y1) * (spans[i + 1] - spans[i])
+                   for y1, y2, spans in self.__bands
+                   for i in range(0, len(spans), 2))
+
+    def bounds(self):
+        """
+        :return: The smallest rectangle containing the region, or None if
+                 the region is empty.
+        :rtype: (top_left_x, top_left_y, width, height)
+        """
+        if not self.__bands:
+            return None
+        x1 = min(spans[0] for _, _, spans in self.__bands)
+        x2 = max(spans[-1] for _, _, spans in self.__bands)
+        y1, y2 = self.__bands[0][0], self.__bands[-1][1]
+        return x1, y1, x2 - x1, y2 - y1
+
+    def contains_point(self, x, y):
+        """
+        :return: Whether the pixel at (x, y) is in the region.
+        :rtype: bool
+        """
+        i = bisect_right(self.__bands, (y, float('inf'))) - 1
+        if i < 0 or y >= self.__bands[i][1]:
+            return False
+        return bisect_right(self.__bands[i][2], x) % 2 == 1
+
+    def largest_rect(self):
+        """
+        Finds the largest rectangle (by area) that fits entirely inside the
+        region. (i.e., the best spot to place a new window in free space.)
+
+        Each band is treated as a row of a histogram whose columns are the
+        distinct column boundaries of the region, weighted by their widths,
+        and the largest rectangle under that histogram is found with a
+        stack. This takes time proportional to the number of bands times the
+        number of distinct columns.
+
+        :return: The largest rectangle, or None if the region is empty.
+        :rtype: (top_left_x, top_left_y, width, height)
+        """
+        xs = sorted(set(x for _, _, spans in self.__bands for x in spans))
+        column = dict((x, i) for i, x in enumerate(xs))
+        n = len(xs) - 1
+
+        best, best_area = None, 0
+        heights, last_y2 = [0] * n, None
+        for y1, y2, spans in self.__bands:
+            covered = [False] * n
+            for i in range(0, len(spans), 2):
+                for k in range(column[spans[i]], column[spans[i + 1]]):
+                    covered[k] = True
+            contiguous = y1 == last_y2
+            heights = [(heights[k] if contiguous else 0) + y2 - y1
+                       if covered[k] else 0
+                       for k in range(n)]
+            last_y2 = y2
+
+            stack = [] # (first column, height), increasing heights
+            for k in range(n + 1):
+                h = heights[k] if k < n else 0
+                start = k
+                while stack and stack[-1][1] >= h:
+                    start, sh = stack.pop()
+                    area = sh * (xs[k] - xs[start])
+                    if area > best_area:
+                        best_area = area
+                        best = (xs[start], y2 - sh, xs[k] - xs[start], sh)
+                stack.append((start, h))
+
+        return best
+
+    def __apply(self, other, op):
+        if not isinstance(other, Region):
+            other = Region(other)
+        region = Region()
+        region.__bands = Region.__combine(self.__bands, other.__bands, op)
+        return region
+
+    @staticmethod
+    def __union(a, b):
+        return a or b
+
+    @staticmethod
+    def __intersection(a, b):
+        return a and b
+
+    @staticmethod
+    def __difference(a, b):
+        return a and not b
+
+    @staticmethod
+    def __combine(a, b, op):
+        """
+        Combines two lists of bands row range by row range, where 'op'
+        decides whether a pixel covered (or not) by each is in the result.
+        """
+        ys = sorted(set(y for y1, y2, _ in a + b for y in (y1, y2)))
+        bands = []
+        i = j = 0
+        for y1, y2 in zip(ys, ys[1:]):
+            while i < len(a) and a[i][1] <= y1:
+                i += 1
+            while j < len(b) and b[j][1] <= y1:
+                j += 1
+            spans_a = a[i][2] if i < len(a) and a[i][0] <= y1 else ()
+            spans_b = b[j][2] if j < len(b) and b[j][0] <= y1 else ()
+            spans = Region.__combine_spans(spans_a, spans_b, op)
+            if not spans:
+                continue
+            if bands and bands[-1][1] == y1 and bands[-1][2] == spans:
+                bands[-1] = (bands[-1][0], y2, spans)
+            else:
+                bands.append((y1, y2, spans))
+        return bands
+
+    @staticmethod
+    def __combine_spans(a, b, op):
+        """
+        Combines two sorted lists of column boundaries. Walking the
+        boundaries left to right toggles whether we're inside each list.
+        """
+        spans = []
+        i = j = 0
+        in_a = in_b = inside = False
+        while i < len(a) or j < len(b):
+            if j == len(b) or (i < len(a) and a[i] <= b[j]):
+                x = a[i]
+            else:
+                x = b[j]
+            if i < len(a) and a[i] == x:
+                in_a = not in_a
+                i += 1
+            if j < len(b) and b[j] == x:
+                in_b = not in_b
+                j += 1
+            if op(in_a, in_b) != inside:
+                inside = not inside
+                spans.append(x)
+        return tuple(spans)
+
 def monitor_rects(monitors):
     """
     Takes a list of monitors returned by ``xinerama.get_monitors`` and returns
     a new list of rectangles, in the same order, of monitor areas that account
     for all struts set by all windows. Duplicate struts are ignored.
 
+    The geometry and struts of every client are fetched with pipelined
+    requests, so this costs a handful of round trips no matter how many
+    clients there are. (If you need the result often, use a
+    ``WorkareaTracker`` instead.)
+
     :param monitors: A list of 4-tuples representing monitor rectangles.
     :return: A list of 4-tuples representing monitor rectangles after
              subtracting strut areas.
     :rtype: [(top_left_x, top_left_y, width, height)]
     """
-    mons = monitors # alias
-    wa = mons[:]
+    wa = list(monitors)
 
-    clients = ewmh.get_client_list().reply()
+    clients = ewmh.get_client_list().reply() or []
 
-    log = [] # Identical struts should be ignored
+    seen = set() # Identical struts should be ignored
 
-    for c in clients:
-        try:
-            cx, cy, cw, ch = window.get_geometry(c)
-        except xproto.BadWindow:
+    for client_struts in get_client_struts(clients):
+        if client_struts is None:
             continue
+        geom, struts = client_struts
+
+        for i, area in enumerate(wa):
+            if rect_intersect_area(area, geom) > 0:
+                key = (geom, tuple(sorted(struts.items())))
+                if key not in seen:
+                    seen.add(key)
+                    wa[i] = apply_strut(area, geom, struts)
+                break
+
+    return wa
+
+def get_client_struts(clients):
+    """
+    Fetches the geometry (including decorations) and struts of many clients
+    with pipelined requests. _NET_WM_STRUT_PARTIAL is preferred over
+    _NET_WM_STRUT when a client sets both.
+
+    :param clients: A list of window identifiers.
+    :return: A list, in the same order as ``clients``, of ``(geometry,
+             struts)`` pairs, where ``struts`` is a strut dictionary. The
+             entry is None for clients without struts or that no longer
+             exist.
+    :rtype: [((top_left_x, top_left_y, width, height), dict)]
+    """
+    clients = list(clients)
+    partials = [ewmh.get_wm_strut_partial(c) for c in clients]
+    fulls = [ewmh.get_wm_strut(c) for c in clients]
+    geoms = window.get_geometries(clients)
+
+    result = []
+    for geom, partial, full in zip(geoms, partials, fulls):
+        struts = __strut_reply(partial) or __strut_reply(full)
+        if geom is None or struts is None:
+            result.append(None)
+        else:
+            result.append((geom[0], struts))
+
+    return result
+
+def apply_strut(area, client, struts):
+    """
+    Shrinks the usable area of a monitor by the space reserved by a client's
+    struts. If the struts are all zero, the client itself is cut off the edge
+    of the area it sits on.
+
+    :param area: A 4-tuple representing the usable area of a monitor.
+    :param client: A 4-tuple representing the geometry of the client that
+                   set the struts.
+    :param struts: A strut dictionary, as returned by ``ewmh.get_wm_strut``
+                   or ``ewmh.get_wm_strut_partial``.
+    :return: The new usable area of the monitor.
+    :rtype: (top_left_x, top_left_y, width, height)
+    """
+    x, y, w, h = area
+    cx, cy, cw, ch = client
+    if any(struts.values()):
+        if struts['left'] or struts['right']:
+            if struts['left']:
+                x += cw
+            w -= cw
+        if struts['top'] or struts['bottom']:
+            if struts['top']:
+                y += ch
+            h -= ch
+    else:
+        # x/y shouldn't be zero
+        if cx > 0 and w == cx + cw:
+            w -= cw
+        elif cy > 0 and h == cy + ch:
+            h -= ch
+        elif cx > 0 and x == cx:
+            x += cw
+            w -= cw
+        elif cy > 0 and y == cy:
+            y += ch
+            h -= ch
 
-        for i, (x, y, w, h) in enumerate(wa):
-            if rect_intersect_area((x, y, w, h), (cx, cy, cw, ch)) > 0:
-                struts = ewmh.get_wm_strut_partial(c).reply()
-                if not struts:
-                    struts = ewmh.get_wm_strut(c).reply()
+    return x, y, w, h
 
-                key = (cx, cy, cw, ch, struts)
-                if key in log:
+class WorkareaTracker(object):
+    """
+    Keeps the usable area of each monitor (as computed by ``monitor_rects``)
+    up to date as docks and panels come and go or change their struts. Only
+    the clients that changed are queried again, and only the monitors they
+    sit on are recomputed.
+
+    The tracker selects PropertyChange on the root window and
+    PropertyChange and StructureNotify on every client (in addition to
+    whatever is already selected), and the event dispatcher must be running:
+
+      ::
+
+        def relayout(i, workarea):
+          ...
+
+        tracker = rect.WorkareaTracker(xinerama.get_monitors(), relayout)
+        x, y, w, h = tracker.workareas()[0]
+
+    Each strut is attributed to the first monitor it overlaps, as in
+    ``monitor_rects``. Clients that are unmapped don't reserve any space.
+    Struts are read again when a client is mapped, but moving a dock
+    without changing its struts isn't noticed.
+    """
+    def __init__(self, monitors, callback=None):
+        """
+        :param monitors: A list of 4-tuples representing monitor rectangles.
+        :param callback: Called as ``callback(i, workarea)`` whenever the
+                         usable area of the i'th monitor changes.
+        """
+        self.callback = callback
+        self.__monitors = list(monitors)
+        self.__workareas = list(self.__monitors)
+        self.__clients = [] # _NET_CLIENT_LIST order
+        self.__struts = {} # client -> (geometry, struts, monitor index)
+        self.__unmapped = set()
+
+        self.__client_list_atom = ewmh.atom('_NET_CLIENT_LIST')
+        self.__strut_atoms = (ewmh.atom('_NET_WM_STRUT'),
+                              ewmh.atom('_NET_WM_STRUT_PARTIAL'))
+
+        self.__hooks = [('PropertyNotify', self.__property),
+                        ('MapNotify', self.__map),
+                        ('UnmapNotify', self.__unmap),
+                        ('DestroyNotify', self.__destroy)]
+        for event_name, cb in self.__hooks:
+            event.add_hook(event_name, cb)
+        window.listen_many([root], 'PropertyChange', additive=True)
+
+        self.__update_clients(notify=False)
+
+    def close(self):
+        """
+        Stops tracking events. The tracker shouldn't be used afterwards.
+
+        :rtype: void
+        """
+        for event_name, cb in self.__hooks:
+            event.remove_hook(event_name, cb)
+        self.__hooks = []
+
+    def workareas(self):
+        """
+        :return: The usable area of each monitor, in the same order as the
+                 monitors.
+        :rtype: [(top_left_x, top_left_y, width, height)]
+        """
+        return list(self.__workareas)
+
+    def set_monitors(self, monitors):
+        """
+        Replaces the monitors (i.e., after the screen configuration changes)
+        and recomputes every usable area. If the number of monitors is the
+        same, the callback is called for every monitor whose usable area
+        differs from before. Otherwise, it's called for every monitor.
+
+        :param monitors: A list of 4-tuples representing monitor rectangles.
+        :rtype: void
+        """
+        self.__monitors = list(monitors)
+        for client, (geom, struts, _) in list(self.__struts.items()):
+            self.__struts[client] = (geom, struts, self.__monitor_of(geom))
+        if len(self.__workareas) != len(self.__monitors):
+            self.__workareas = [None] * len(self.__monitors)
+        self.__recompute(range(len(self.__monitors)))
+
+    def __monitor_of(self, geom):
+        for i, mon in enumerate(self.__monitors):
+            if rect_intersect_area(mon, geom) > 0:
+                return i
+        return None
+
+    def __recompute(self, indices, notify=True):
+        for i in set(indices):
+            if i is None:
+                continue
+            area, seen = self.__monitors[i], set()
+            for client in self.__clients:
+                if client not in self.__struts or client in self.__unmapped:
                     continue
-                log.append(key)
-
-                if struts and not all([v == 0 for v in struts.itervalues()]):
-                    if struts['left'] or struts['right']:
-                        if struts['left']:
-                            x += cw
-                        w -= cw
-                    if struts['top'] or struts['bottom']:
-                        if struts['top']:
-                            y += ch
-                        h -= ch
-                elif struts:
-                    # x/y shouldn't be zero
-                    if cx > 0 and w == cx + cw:
-                        w -= cw
-                    elif cy > 0 and h == cy + ch:
-                        h -= ch
-                    elif cx > 0 and x == cx:
-                        x += cw
-                        w -= cw
-                    elif cy > 0 and y == cy:
-                        y += ch
-                        h -= ch
-
-                wa[i] = (x, y, w, h)
+                geom, struts, mon = self.__struts[client]
+                key = (geom, tuple(sorted(struts.items())))
+                if mon == i and key not in seen:
+                    seen.add(key)
+                    area = apply_strut(area, geom, struts)
 
-    return wa
+            if area != self.__workareas[i]:
+                self.__workareas[i] = area
+                if notify and self.callback is not None:
+                    self.callback(i, area)
+
+    def __refresh(self, clients, notify=True):
+        """
+        Reads the struts of the given clients again and recomputes the
+        monitors that they were and are now on.
+        """
+        touched = []
+        for client, cs in zip(clients, get_client_struts(clients)):
+            if client in self.__struts:
+                touched.append(self.__struts.pop(client)[2])
+            if cs is not None:
+                mon = self.__monitor_of(cs[0])
+                self.__struts[client] = (cs[0], cs[1], mon)
+                touched.append(mon)
+        self.__recompute(touched, notify)
+
+    def __update_clients(self, notify=True):
+        clients = ewmh.get_client_list().reply() or []
+        known = set(self.__clients)
+        added = [c for c in clients if c not in known]
+        current = set(clients)
+
+        self.__clients = clients
+        touched = [self.__struts.pop(c)[2] for c in list(self.__struts)
+                   if c not in current]
+        self.__unmapped &= current
+
+        gone = window.listen_many(added, 'PropertyChange', 'StructureNotify',
+                                  additive=True)
+        if gone:
+            gone = set(gone)
+            added = [c for c in added if c not in gone]
+
+        # Ask for the map state only now that StructureNotify is selected,
+        # so that a client mapped in the meantime isn't missed.
+        cookies = [conn.core.GetWindowAttributes(c) for c in added]
+        for c, cookie in zip(list(added), cookies):
+            try:
+                if cookie.reply().map_state != xproto.MapState.Viewable:
+                    self.__unmapped.add(c)
+            except xproto.BadWindow:
+                added.remove(c)
+        self.__recompute(touched, notify)
+        self.__refresh(added, notify)
+
+    def __property(self, e):
+        if e.window == root:
+            if e.atom == self.__client_list_atom:
+                self.__update_clients()
+        elif e.atom in self.__strut_atoms and e.window in self.__clients:
+            self.__refresh([e.window])
+
+    def __map(self, e):
+        if e.window in self.__unmapped:
+            self.__unmapped.discard(e.window)
+            self.__refresh([e.window])
+
+    def __unmap(self, e):
+        if e.window in self.__struts and e.window not in self.__unmapped:
+            self.__unmapped.add(e.window)
+            self.__recompute([self.__struts[e.window][2]])
 
+    def __destroy(self, e):
+        if e.window in self.__struts:
+            self.__unmapped.discard(e.window)
+            self.__recompute([self.__struts.pop(e.window)[2]])
+
+def __as_array(rects):
+    """
+    Private function that turns a list of 4-tuples (or a single 4-tuple)
+    into an N x 4 NumPy array of integers.
+
+    :rtype: numpy.ndarray
+    """
+    return numpy.asarray(rects, dtype=numpy.int64).reshape(-1, 4)
+
+def __strut_reply(cookie):
+    """
+    Private function that reads a strut property, treating a client that no
+    longer exists as one without struts.
+
+    :type cookie: ewmh.StrutCookie or ewmh.StrutPartialCookie
+    :return: A strut dictionary, or None.
+    :rtype: dict
+    """
+    try:
+        return cookie.reply()
+    except xproto.BadWindow:
+        return None
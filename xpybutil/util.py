@@ -3,6 +3,7 @@ A vast assortment of utility functions. The ones of interest to
 you are probably 'get_atom' and 'get_atom_name'. The rest are
 heavily used throughout the rest of xpybutil.
 """
+import inspect
 import struct
 import sys
 
@@ -137,6 +138,22 @@ def get_property_unchecked(window, atom):
                                           xproto.GetPropertyType.Any, 0,
                                           2 ** 32 - 1)
 
+def event_callback(cb):
+    """
+    Resolves the calling convention of a user supplied callback once, so that
+    dispatchers don't have to guess on every event. Callbacks bound through
+    'keybind' or 'mousebind' may either accept the event as their only
+    argument or accept no arguments at all.
+
+    :param cb: A first class function with zero or one parameters.
+    :type cb: function
+    :return: A function that always accepts a single event argument.
+    :rtype: function
+    """
+    if __accepts_argument(cb):
+        return cb
+    return lambda e: cb()
+
 def build_atom_cache(atoms):
     """
     Quickly builds a cache of ATOM names to ATOM identifiers (and the reverse).
@@ -181,9 +198,10 @@ def get_atom(atom_name, only_if_exists=False):
     """
     global __atom_cache
 
-    a = __atom_cache.setdefault(atom_name,
-                                __get_atom_cookie(atom_name,
-                                                  only_if_exists).reply())
+    if atom_name not in __atom_cache:
+        __atom_cache[atom_name] = __get_atom_cookie(atom_name,
+                                                    only_if_exists).reply()
+    a = __atom_cache[atom_name]
     if isinstance(a, AtomCookie):
         a = a.reply()
 
@@ -203,13 +221,39 @@ def get_atom_name(atom):
     """
     global __atom_nm_cache
 
-    a = __atom_nm_cache.setdefault(atom, __get_atom_name_cookie(atom).reply())
+    if atom not in __atom_nm_cache:
+        __atom_nm_cache[atom] = __get_atom_name_cookie(atom).reply()
+    a = __atom_nm_cache[atom]
 
     if isinstance(a, AtomNameCookie):
         a = a.reply()
 
     return a
 
+def __accepts_argument(cb):
+    """
+    Private function that reports whether ``cb`` can be called with a single
+    positional argument. If we can't tell (i.e., some builtins), assume it can.
+
+    :type cb: function
+    :rtype: bool
+    """
+    if hasattr(inspect, 'signature'):
+        try:
+            inspect.signature(cb).bind(None)
+            return True
+        except TypeError:
+            return False
+        except ValueError:
+            return True
+
+    try:
+        spec = inspect.getargspec(cb)
+    except TypeError:
+        return True
+    nargs = len(spec.args) - (1 if inspect.ismethod(cb) else 0)
+    return nargs >= 1 or spec.varargs is not None
+
 def __get_atom_cookie(atom_name, only_if_exists=False):
     """
     Private function that issues the xpyb call to intern an atom.
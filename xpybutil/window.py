@@ -30,12 +30,37 @@ window changed, you could do something like:
 The idea here is to tell X that you want events that fall under
 the 'PropertyChange' category. Then you bind 'func' to the
 particular event 'PropertyNotify'.
+
+Use 'listen_many' to select events on many windows at once (e.g., every
+client), or to add to the events already selected on a window.
+
+Finding a window's frame costs a round trip. If you're running the event
+dispatcher, call 'cache_frames' once and frames will only be looked up the
+first time they're needed.
+
+Functions that take a 'window_manager' detect the running window manager
+themselves if you don't pass one. (See 'get_window_manager'.) The answer is
+cached; call 'watch_window_manager' if a different window manager may take
+over while you're running.
+
+To look at the entire window hierarchy at once, use 'snapshot_tree'. It
+costs one round trip per level of the tree rather than one per window.
+If you're running the event dispatcher and need to ask about top-level
+windows often, a 'WindowModel' answers from memory instead. (Pass one to
+'window_at' to find the window under a point without a round trip.)
 """
+from array import array
+
 from xpybutil.compat import xproto
 
-from xpybutil import conn
+from xpybutil import conn, root, event
 import xpybutil.ewmh as ewmh
 
+__parents = None # window -> parent, once 'cache_frames' is called
+__extents = None # frame -> (dw, dh, fw, fh), once 'cache_frames' is called
+__window_manager = None # detected by 'get_window_manager'
+__wm_check_atom = None
+
 class WindowManagers(object):
     """
     A list of window managers that xpybutil is aware of.
@@ -50,6 +75,591 @@ class WindowManagers(object):
     Openbox = 1
     KWin = 2
 
+def get_window_manager():
+    """
+    Detects the running window manager by following _NET_SUPPORTING_WM_CHECK
+    on the root window and reading the _NET_WM_NAME of the window it points
+    to. The result is cached for the rest of the session, unless you've
+    called ``watch_window_manager``.
+
+    :return: A class variable from Window.WindowManagers
+    :rtype: int
+    """
+    global __window_manager
+
+    if __window_manager is not None:
+        return __window_manager
+
+    __window_manager = WindowManagers.Unknown
+    try:
+        wid = ewmh.get_supporting_wm_check(root).reply()
+        name = ewmh.get_wm_name(wid).reply() if wid else None
+    except xproto.BadWindow:
+        name = None
+
+    if isinstance(name, list): # Split on null bytes
+        name = name[0] if name else None
+    if name:
+        name = name.lower()
+        if 'kwin' in name:
+            __window_manager = WindowManagers.KWin
+        elif 'openbox' in name:
+            __window_manager = WindowManagers.Openbox
+
+    return __window_manager
+
+def watch_window_manager():
+    """
+    Makes ``get_window_manager`` detect the window manager again whenever
+    _NET_SUPPORTING_WM_CHECK changes on the root window. (i.e., when a new
+    window manager takes over.)
+
+    PropertyChange is added to the events selected on the root window, and
+    the cache is refreshed from the PropertyNotify events seen by the
+    ``event`` dispatcher. Thus, you must be running the dispatcher.
+
+    :rtype: void
+    """
+    global __wm_check_atom
+
+    if __wm_check_atom is None:
+        __wm_check_atom = ewmh.atom('_NET_SUPPORTING_WM_CHECK')
+        event.add_hook('PropertyNotify', __check_window_manager)
+        listen_many([root], 'PropertyChange', additive=True)
+
+class WindowTree(object):
+    """
+    A snapshot of the window hierarchy, as returned by ``snapshot_tree``.
+
+    Windows are stored in breadth-first order in flat arrays, so that the
+    children of any window are contiguous. A window's position in that order
+    is its *index*; the methods below take window identifiers, though.
+
+    Geometry and attributes are only available if they were asked for when
+    the snapshot was taken. Windows that were destroyed while the snapshot
+    was being taken are still in the tree, but have no geometry or
+    attributes.
+    """
+    def __init__(self):
+        self.windows = array('I') # window identifiers, breadth-first
+        self.parents = array('i') # index of the parent (-1 for the root)
+        self.first_child = array('i') # index of the first child
+        self.child_counts = array('i')
+        self.geometries = None # (x, y, width, height, border_width) each
+        self.map_states = None
+        self.override_redirects = None
+        self.gone = set() # indices of windows destroyed during the snapshot
+        self.__index = None
+
+    def __len__(self):
+        return len(self.windows)
+
+    def __contains__(self, window):
+        return window in self.__indices()
+
+    def __iter__(self):
+        return iter(self.windows)
+
+    def index(self, window):
+        """
+        :param window: Window identifier.
+        :return: The breadth-first position of the window in this snapshot.
+        :rtype: int
+        """
+        return self.__indices()[window]
+
+    def parent(self, window):
+        """
+        :param window: Window identifier.
+        :return: The parent of the window, or None for the root window.
+        :rtype: int
+        """
+        p = self.parents[self.index(window)]
+        return self.windows[p] if p >= 0 else None
+
+    def children(self, window):
+        """
+        :param window: Window identifier.
+        :return: The children of the window, in stacking order (bottom-most
+                 first).
+        :rtype: [int]
+        """
+        i = self.index(window)
+        first = self.first_child[i]
+        return self.windows[first:first + self.child_counts[i]].tolist()
+
+    def geometry(self, window):
+        """
+        :param window: Window identifier.
+        :return: X rectangle of the window relative to its parent, or None if
+                 geometry wasn't fetched for it or the window no longer
+                 exists.
+        :rtype: (x, y, width, height)
+        """
+        i = self.index(window)
+        if i in self.gone or i * 5 >= len(self.geometries or ()):
+            return None
+        return tuple(self.geometries[i * 5:i * 5 + 4])
+
+    def border_width(self, window):
+        """
+        :param window: Window identifier.
+        :return: The border width of the window, or None if geometry wasn't
+                 fetched for it or the window no longer exists.
+        :rtype: int
+        """
+        i = self.index(window)
+        if i in self.gone or i * 5 >= len(self.geometries or ()):
+            return None
+        return self.geometries[i * 5 + 4]
+
+    def map_state(self, window):
+        """
+        :param window: Window identifier.
+        :return: A class variable from xcb.xproto.MapState, or None if
+                 attributes weren't fetched for it or the window no longer
+                 exists.
+        :rtype: int
+        """
+        i = self.index(window)
+        if i in self.gone or i >= len(self.map_states or ()):
+            return None
+        return self.map_states[i]
+
+    def override_redirect(self, window):
+        """
+        :param window: Window identifier.
+        :return: Whether the window is override redirect, or None if
+                 attributes weren't fetched for it or the window no longer
+                 exists.
+        :rtype: bool
+        """
+        i = self.index(window)
+        if i in self.gone or i >= len(self.override_redirects or ()):
+            return None
+        return bool(self.override_redirects[i])
+
+    def __indices(self):
+        if self.__index is None:
+            self.__index = dict((w, i) for i, w in enumerate(self.windows))
+        return self.__index
+
+def snapshot_tree(window=None, attributes=False, geometry=False, depth=None,
+                  detail_depth=None):
+    """
+    Walks the window hierarchy rooted at 'window' breadth-first and returns
+    a ``WindowTree``. The QueryTree requests for each level of the tree are
+    all sent before any of their replies are read, so the walk costs one
+    round trip per level rather than one per window.
+
+    If 'attributes' or 'geometry' is set, a GetWindowAttributes and/or a
+    GetGeometry request is pipelined along with each QueryTree request, so
+    that the map state, override redirect flag and geometry of every window
+    are available without any extra round trips. Use 'detail_depth' if you
+    only need them near the top of the tree.
+
+    :param window: Window identifier of the top of the tree. Defaults to the
+                   root window.
+    :param attributes: Whether to fetch the attributes of every window.
+    :type attributes: bool
+    :param geometry: Whether to fetch the geometry of every window.
+    :type geometry: bool
+    :param depth: How many levels below 'window' to walk. (All of them if
+                  None.) Windows on the last level have no children.
+    :type depth: int
+    :param detail_depth: How many levels below 'window' to fetch attributes
+                         and geometry for. (All of them if None.)
+    :type detail_depth: int
+    :rtype: WindowTree
+    """
+    tree = WindowTree()
+    if attributes:
+        tree.map_states = array('B')
+        tree.override_redirects = array('B')
+    if geometry:
+        tree.geometries = array('i')
+
+    tree.windows.append(root if window is None else window)
+    tree.parents.append(-1)
+
+    start, level_num = 0, 0
+    while start < len(tree.windows):
+        stop = len(tree.windows)
+        level = tree.windows[start:stop]
+        if depth is not None and level_num >= depth:
+            trees = [None] * len(level)
+        else:
+            trees = [conn.core.QueryTree(w) for w in level]
+        details = detail_depth is None or level_num <= detail_depth
+        attrs = ([conn.core.GetWindowAttributes(w) for w in level]
+                 if attributes and details else None)
+        geoms = ([conn.core.GetGeometry(w) for w in level]
+                 if geometry and details else None)
+
+        for j, cookie in enumerate(trees):
+            i = start + j
+            children = []
+            if cookie is not None:
+                try:
+                    children = cookie.reply().children
+                except xproto.BadWindow:
+                    tree.gone.add(i)
+
+            tree.first_child.append(len(tree.windows))
+            tree.child_counts.append(len(children))
+            tree.windows.extend(children)
+            tree.parents.extend([i] * len(children))
+
+            if attrs is not None:
+                try:
+                    reply = attrs[j].reply()
+                    state, redirect = reply.map_state, reply.override_redirect
+                except xproto.BadWindow:
+                    state, redirect = 0, 0
+                    tree.gone.add(i)
+                tree.map_states.append(state)
+                tree.override_redirects.append(redirect)
+            if geoms is not None:
+                try:
+                    g = geoms[j].reply()
+                    tree.geometries.extend([g.x, g.y, g.width, g.height,
+                                            g.border_width])
+                except (xproto.BadWindow, xproto.BadDrawable):
+                    tree.geometries.extend([0] * 5)
+                    tree.gone.add(i)
+        start = stop
+        level_num += 1
+
+    return tree
+
+class WindowModel(object):
+    """
+    An in-memory model of the top-level windows (i.e., the children of the
+    root window), kept up to date from the Create, Destroy, Configure, Map,
+    Unmap, Reparent and Circulate notifications seen by the ``event``
+    dispatcher. Once it's in sync, the geometry, map state and stacking
+    order of top-level windows are answered without any round trips.
+
+    The model also remembers the parent of each window that has been
+    reparented away from the root window. (i.e., into a frame by the window
+    manager.)
+
+    Creating a model adds SubstructureNotify to the events selected on the
+    root window, and the event dispatcher must be running:
+
+      ::
+
+        model = window.WindowModel()
+        ...
+        if model.is_mapped(wid):
+          x, y, w, h = model.geometry(wid)
+
+    The model syncs with ``snapshot_tree`` the first time it is asked
+    anything, and again whenever an event doesn't fit what it knows (i.e.,
+    an event was missed) or a sync fails. (i.e., with an X error.) Call
+    ``resync`` if you know it's out of date for some other reason.
+    """
+    def __init__(self, window=None):
+        """
+        :param window: The root window whose children are tracked. Defaults
+                       to the root window of the default screen.
+        """
+        self.root = root if window is None else window
+        self.__stack = [] # top-level windows, bottom-most first
+        self.__windows = {} # window -> [x, y, width, height, border, mapped, o_r]
+        self.__parents = {} # window -> parent, for non top-level windows
+        self.__stale = True
+
+        self.__hooks = [('CreateNotify', self.__create),
+                        ('DestroyNotify', self.__destroy),
+                        ('ConfigureNotify', self.__configure),
+                        ('MapNotify', self.__map),
+                        ('UnmapNotify', self.__unmap),
+                        ('ReparentNotify', self.__reparent),
+                        ('CirculateNotify', self.__circulate)]
+        for event_name, cb in self.__hooks:
+            event.add_hook(event_name, cb)
+        listen_many([self.root], 'SubstructureNotify', additive=True)
+
+    def close(self):
+        """
+        Stops tracking events. The model shouldn't be used afterwards.
+
+        :rtype: void
+        """
+        for event_name, cb in self.__hooks:
+            event.remove_hook(event_name, cb)
+        self.__hooks = []
+
+    def resync(self):
+        """
+        Throws away everything the model knows. It will sync with the X
+        server again the next time it is asked anything.
+
+        :rtype: void
+        """
+        self.__stale = True
+
+    def is_stale(self):
+        """
+        :return: Whether the model will sync with the X server the next time
+                 it is asked anything.
+        :rtype: bool
+        """
+        return self.__stale
+
+    def stacking_order(self):
+        """
+        :return: The top-level windows, bottom-most first.
+        :rtype: [int]
+        """
+        self.__sync()
+        return list(self.__stack)
+
+    def stacking_position(self, window):
+        """
+        :param window: Window identifier.
+        :return: The position of a top-level window in the stacking order
+                 (0 is the bottom-most window), or None if it isn't a
+                 top-level window.
+        :rtype: int
+        """
+        self.__sync()
+        if window not in self.__windows:
+            return None
+        return self.__stack.index(window)
+
+    def geometry(self, window):
+        """
+        :param window: Window identifier.
+        :return: X rectangle of a top-level window (not including its
+                 border), or None if it isn't a top-level window.
+        :rtype: (x, y, width, height)
+        """
+        self.__sync()
+        if window not in self.__windows:
+            return None
+        return tuple(self.__windows[window][:4])
+
+    def is_mapped(self, window):
+        """
+        :param window: Window identifier.
+        :return: Whether a top-level window is mapped, or None if it isn't a
+                 top-level window.
+        :rtype: bool
+        """
+        self.__sync()
+        if window not in self.__windows:
+            return None
+        return self.__windows[window][5]
+
+    def override_redirect(self, window):
+        """
+        :param window: Window identifier.
+        :return: Whether a top-level window is override redirect, or None if
+                 it isn't a top-level window.
+        :rtype: bool
+        """
+        self.__sync()
+        if window not in self.__windows:
+            return None
+        return self.__windows[window][6]
+
+    def parent(self, window):
+        """
+        :param window: Window identifier.
+        :return: The parent of a top-level window (i.e., the root window), or
+                 of a window that was reparented away from it. None if the
+                 window is unknown.
+        :rtype: int
+        """
+        self.__sync()
+        if window in self.__windows:
+            return self.root
+        return self.__parents.get(window)
+
+    def window_at(self, x, y):
+        """
+        Finds the top-most mapped top-level window (including its border)
+        that contains a point in root window coordinates.
+
+        :param x: X coordinate relative to the root window.
+        :param y: Y coordinate relative to the root window.
+        :return: Window identifier, or None if there's no such window.
+        :rtype: int
+        """
+        self.__sync()
+        for w in reversed(self.__stack):
+            wx, wy, width, height, border, mapped, _ = self.__windows[w]
+            if (mapped and wx <= x < wx + width + 2 * border
+                    and wy <= y < wy + height + 2 * border):
+                return w
+        return None
+
+    def __sync(self):
+        if not self.__stale:
+            return
+
+        # Only the top-level windows need their attributes and geometry; the
+        # level below is only walked to learn who their children are.
+        self.__stack, self.__windows, self.__parents = [], {}, {}
+        tree = snapshot_tree(self.root, attributes=True, geometry=True,
+                             depth=2, detail_depth=1)
+        if tree.index(self.root) in tree.gone:
+            return # try again next time
+        for w in tree.children(self.root):
+            if tree.index(w) in tree.gone:
+                continue
+            x, y, width, height = tree.geometry(w)
+            mapped = tree.map_state(w) != xproto.MapState.Unmapped
+            self.__stack.append(w)
+            self.__windows[w] = [x, y, width, height, tree.border_width(w),
+                                 mapped, tree.override_redirect(w)]
+            for child in tree.children(w):
+                self.__parents[child] = w
+        self.__stale = False
+
+    def __add(self, window, x, y, width, height, border, override_redirect):
+        if window in self.__windows:
+            self.__stack.remove(window)
+        self.__stack.append(window)
+        self.__windows[window] = [x, y, width, height, border, False,
+                                  bool(override_redirect)]
+        self.__parents.pop(window, None)
+
+    def __remove(self, window):
+        if window in self.__windows:
+            del self.__windows[window]
+            self.__stack.remove(window)
+
+    def __create(self, e):
+        if e.parent != self.root or self.__stale:
+            return
+        self.__add(e.window, e.x, e.y, e.width, e.height, e.border_width,
+                   e.override_redirect)
+
+    def __destroy(self, e):
+        if e.event != self.root or self.__stale:
+            return
+        self.__remove(e.window)
+        self.__parents.pop(e.window, None)
+        for w in [w for w, p in self.__parents.items() if p == e.window]:
+            del self.__parents[w]
+
+    def __configure(self, e):
+        if e.event != self.root or self.__stale:
+            return
+        info = self.__windows.get(e.window)
+        if info is None or (e.above_sibling and
+                            e.above_sibling not in self.__windows):
+            self.__stale = True
+            return
+
+        info[:5] = [e.x, e.y, e.width, e.height, e.border_width]
+        self.__stack.remove(e.window)
+        if e.above_sibling:
+            i = self.__stack.index(e.above_sibling) + 1
+        else:
+            i = 0
+        self.__stack.insert(i, e.window)
+
+    def __map(self, e):
+        self.__set_mapped(e, True)
+
+    def __unmap(self, e):
+        self.__set_mapped(e, False)
+
+    def __set_mapped(self, e, mapped):
+        if e.event != self.root or self.__stale:
+            return
+        if e.window not in self.__windows:
+            self.__stale = True
+            return
+        self.__windows[e.window][5] = mapped
+
+    def __reparent(self, e):
+        if e.event != self.root or self.__stale:
+            return
+        if e.parent == self.root:
+            # We don't learn the size of the window, so ask again.
+            self.__stale = True
+        else:
+            self.__remove(e.window)
+            self.__parents[e.window] = e.parent
+
+    def __circulate(self, e):
+        if e.event != self.root or self.__stale:
+            return
+        if e.window not in self.__windows:
+            self.__stale = True
+            return
+        self.__stack.remove(e.window)
+        if e.place == xproto.Place.OnTop:
+            self.__stack.append(e.window)
+        else:
+            self.__stack.insert(0, e.window)
+
+def translate_many(pairs):
+    """
+    Translates coordinates between many pairs of windows at once, with
+    pipelined TranslateCoordinates requests. For example, to find where a
+    few windows are in root window coordinates:
+
+      ::
+
+        window.translate_many([(wid, xpybutil.root) for wid in wids])
+
+    :param pairs: A list of ``(src_window, dst_window)`` tuples, which
+                  translate the origin of ``src_window``, or
+                  ``(src_window, dst_window, x, y)`` tuples, which translate
+                  the point ``(x, y)`` relative to ``src_window``.
+    :return: A list, in the same order as ``pairs``, of ``(x, y, child)``
+             where ``(x, y)`` is relative to ``dst_window`` and ``child`` is
+             the child of ``dst_window`` containing the point (or 0). If
+             either window no longer exists or they're on different
+             screens, the entry is None.
+    :rtype: [(int, int, int)]
+    """
+    cookies = []
+    for pair in pairs:
+        src, dst = pair[:2]
+        x, y = pair[2:] or (0, 0)
+        cookies.append(conn.core.TranslateCoordinates(src, dst, x, y))
+
+    translated = []
+    for cookie in cookies:
+        try:
+            reply = cookie.reply()
+        except xproto.BadWindow:
+            reply = None
+        if reply is None or not reply.same_screen:
+            translated.append(None)
+        else:
+            translated.append((reply.dst_x, reply.dst_y, reply.child))
+
+    return translated
+
+def window_at(x, y, model=None):
+    """
+    Finds the top-level window (typically a client's frame) under a point.
+
+    If a ``WindowModel`` that is in sync is given, the answer comes from
+    memory. Otherwise, the X server is asked. (A stale model isn't synced
+    here, since that costs more round trips than asking directly.)
+
+    :param x: X coordinate relative to the root window.
+    :param y: Y coordinate relative to the root window.
+    :param model: An optional ``WindowModel`` of the root window.
+    :type model: WindowModel
+    :return: Window identifier, or None if there's no window at the point.
+    :rtype: int
+    """
+    if model is not None and not model.is_stale():
+        return model.window_at(x, y)
+
+    child = conn.core.TranslateCoordinates(root, root, x, y).reply().child
+    return child or None
+
 def listen(window, *event_mask_names):
     """
     Makes X report events for the masks provided.
@@ -66,23 +676,106 @@ def listen(window, *event_mask_names):
     :type event_mask_names: List of xcb.xproto.EventMask class variable names
     :rtype: void
     """
-    masks = 0
-    for mask_name in event_mask_names:
-        assert hasattr(xproto.EventMask, mask_name)
-        masks |= getattr(xproto.EventMask, mask_name)
+    masks = __event_mask(event_mask_names)
 
     conn.core.ChangeWindowAttributesChecked(window, xproto.CW.EventMask,
                                             [masks]).check()
 
+def listen_many(windows, *event_mask_names, **kwargs):
+    """
+    Makes X report events for the masks provided on many windows at once.
+    All of the requests are sent before any of them is checked, so this
+    costs a single round trip no matter how many windows there are.
+
+    Windows that were destroyed in the meantime are skipped and returned
+    rather than raising an error.
+
+    :param windows: A list of window identifiers.
+    :param event_mask_names: List of mask names.
+    :type event_mask_names: List of xcb.xproto.EventMask class variable names
+    :param additive: If True, the masks are added to the events already
+                     selected on each window rather than replacing them.
+                     This costs one more round trip. (Keyword only.)
+    :type additive: bool
+    :return: The windows that no longer exist.
+    :rtype: [int]
+    """
+    additive = kwargs.pop('additive', False)
+    assert not kwargs, 'Unexpected keyword arguments: %s' % ', '.join(kwargs)
+
+    windows = list(windows)
+    masks = __event_mask(event_mask_names)
+
+    gone = []
+    if additive:
+        cookies = [conn.core.GetWindowAttributes(w) for w in windows]
+        selected = {}
+        for w, cookie in zip(windows, cookies):
+            try:
+                selected[w] = cookie.reply().your_event_mask | masks
+            except xproto.BadWindow:
+                gone.append(w)
+    else:
+        selected = dict((w, masks) for w in windows)
+
+    cookies = [(w, conn.core.ChangeWindowAttributesChecked(
+                        w, xproto.CW.EventMask, [selected[w]]))
+               for w in windows if w in selected]
+    for w, cookie in cookies:
+        try:
+            cookie.check()
+        except xproto.BadWindow:
+            gone.append(w)
+
+    return [w for w in windows if w in gone]
+
+def cache_frames():
+    """
+    Makes xpybutil remember the parent of every window it looks up, so that
+    finding the frame of a window (i.e., in ``get_geometry`` or
+    ``moveresize``) only costs a QueryTree request the first time. This
+    includes the grandparent used for KWin. The size of each frame's
+    decorations, which ``moveresize`` needs, is remembered too.
+
+    The cache is kept up to date from the ReparentNotify, DestroyNotify and
+    ConfigureNotify events seen by the ``event`` dispatcher. Thus, you must
+    be running the dispatcher and have selected SubstructureNotify on the
+    root window:
+
+      ::
+
+        window.listen(xpybutil.root, 'SubstructureNotify')
+        window.cache_frames()
+
+    :rtype: void
+    """
+    global __parents, __extents
+
+    if __parents is None:
+        __parents = {}
+        __extents = {}
+        event.add_hook('ReparentNotify', __update_parent)
+        event.add_hook('DestroyNotify', __forget_window)
+        event.add_hook('ConfigureNotify', __check_extents)
+
 def get_parent_window(window):
     """
     Uses QueryTree() to find the parent of the given window.
 
+    If ``cache_frames`` has been called, the parent is only queried once.
+
     :param window: Window identifier.
     :return: Parent window identifier of 'window'.
     :rtype: int
     """
-    return conn.core.QueryTree(window).reply().parent
+    if __parents is not None and window in __parents:
+        return __parents[window]
+
+    parent = conn.core.QueryTree(window).reply().parent
+    if __parents is not None:
+        __parents[window] = parent
+
+    return parent
 
 def get_geometry(window, window_manager=None):
     """
@@ -95,10 +788,13 @@ def get_geometry(window, window_manager=None):
 
     :param window: Window identifier.
     :param window_manager: A class variable from Window.WindowManagers
+                           (detected automatically if None)
     :type window_manager: int
     :return: Real geometry of a client window starting from the top-left corner.
     :rtype: (top_left_x, top_left_y, width, height)
     """
+    if window_manager is None:
+        window_manager = get_window_manager()
 
     if window_manager is WindowManagers.KWin:
         p = get_parent_window(window)
@@ -106,6 +802,49 @@ def get_geometry(window, window_manager=None):
     else:
         return __get_geometry(get_parent_window(window))
 
+def get_geometries(windows, window_manager=None):
+    """
+    Returns the geometries of many windows at once, along with the geometry
+    of each window's frame (its decorations). This is the bulk version of
+    ``get_geometry``: the QueryTree requests for all windows are sent before
+    any reply is read, and likewise for the GetGeometry requests. So this
+    costs two round trips (three for KWin) regardless of how many windows
+    there are.
+
+    :param windows: A list of window identifiers.
+    :param window_manager: A class variable from Window.WindowManagers
+                           (detected automatically if None)
+    :type window_manager: int
+    :return: A list, in the same order as ``windows``, of pairs of the frame
+             geometry (as returned by ``get_geometry``) and the geometry of
+             the window itself (relative to its parent). If a window no
+             longer exists, its entry is None.
+    :rtype: [((x, y, width, height), (x, y, width, height))]
+    """
+    if window_manager is None:
+        window_manager = get_window_manager()
+
+    windows = list(windows)
+
+    frames = __query_parents(windows)
+    if window_manager is WindowManagers.KWin:
+        frames = __query_parents(frames)
+
+    cookies = [(conn.core.GetGeometry(w), conn.core.GetGeometry(f))
+               if f is not None else None
+               for w, f in zip(windows, frames)]
+
+    geoms = []
+    for cookie in cookies:
+        geom = None
+        if cookie is not None:
+            client, frame = [__geometry_reply(c) for c in cookie]
+            if client is not None and frame is not None:
+                geom = (frame, client)
+        geoms.append(geom)
+
+    return geoms
+
 def moveresize(win, x=None, y=None, w=None, h=None, window_manager=None):
     """
     This function attempts to properly move/resize a window, accounting for
@@ -115,29 +854,210 @@ def moveresize(win, x=None, y=None, w=None, h=None, window_manager=None):
     parent window to adjust the width and height. (I've found _NET_FRAME_EXTENTS
     to be wildly unreliable.)
 
+    If ``cache_frames`` has been called, the size of the decorations is only
+    measured the first time a window is moved, so this usually doesn't wait
+    on the X server at all. Use ``moveresize_many`` to move several windows.
+
     :param win: Window identifier.
     :param x: Top left x coordinate.
     :param y: Top left y coordinate.
     :param w: Client width.
     :param h: Client height.
     :param window_manager: A class variable from Window.WindowManagers
+                           (detected automatically if None)
+    :type window_manager: int
+    :rtype: void
+    """
+    moveresize_many([(win, x, y, w, h)], window_manager)
+
+def moveresize_many(moves, window_manager=None):
+    """
+    Moves and/or resizes many windows at once, accounting for their
+    decorations just like ``moveresize``. The decorations of all windows are
+    measured with pipelined requests (unless they're already cached), and
+    all of the _NET_MOVERESIZE_WINDOW messages are sent with a single flush.
+
+    :param moves: A list of ``(win, x, y, w, h)`` tuples, with the same
+                  meaning as the parameters of ``moveresize``. Any of x, y,
+                  w and h may be None to leave it unchanged.
+    :param window_manager: A class variable from Window.WindowManagers
+                           (detected automatically if None)
     :type window_manager: int
     :rtype: void
     """
+    if window_manager is None:
+        window_manager = get_window_manager()
+
+    moves = list(moves)
+    windows = [move[0] for move in moves]
+
+    frames = __query_parents(windows)
     if window_manager is WindowManagers.KWin:
-        tomove = get_parent_window(get_parent_window(win))
-    else:
-        tomove = get_parent_window(win)
+        frames = __query_parents(frames)
+
+    extents = __decoration_extents(windows, frames)
+    for (win, x, y, w, h), frame, ext in zip(moves, frames, extents):
+        if ext is not None:
+            dw, dh, fw, fh = ext
+            if w is not None:
+                fw, w = w, w - dw
+            if h is not None:
+                fh, h = h, h - dh
+            if __extents is not None and frame in __extents:
+                __extents[frame] = (dw, dh, fw, fh)
 
-    if tomove:
-        cx, cy, cw, ch = __get_geometry(win)
-        px, py, pw, ph = __get_geometry(tomove)
+        ewmh.request_moveresize_window(win, x=x, y=y,
+                                       width=None if w is None else max(1, w),
+                                       height=None if h is None else max(1, h),
+                                       source=2)
 
-        w -= pw - cw
-        h -= ph - ch
+    conn.flush()
 
-    ewmh.request_moveresize_window(win, x=x, y=y, width=max(1, w),
-                                   height=max(1, h), source=2)
+def __event_mask(event_mask_names):
+    """
+    Private function that ORs together event masks given by name.
+
+    :type event_mask_names: List of xcb.xproto.EventMask class variable names
+    :rtype: int
+    """
+    masks = 0
+    for mask_name in event_mask_names:
+        assert hasattr(xproto.EventMask, mask_name)
+        masks |= getattr(xproto.EventMask, mask_name)
+    return masks
+
+def __query_parents(windows):
+    """
+    Private function that finds the parents of many windows with pipelined
+    QueryTree requests.
+
+    Parents in the frame cache (see ``cache_frames``) aren't queried.
+
+    :param windows: A list of window identifiers (or None).
+    :return: A list of parent window identifiers, with None for each window
+             that was None or no longer exists.
+    :rtype: [int]
+    """
+    cache = __parents if __parents is not None else {}
+    cookies = [conn.core.QueryTree(w) if w is not None and w not in cache
+               else None
+               for w in windows]
+
+    parents = []
+    for w, cookie in zip(windows, cookies):
+        parent = cache.get(w)
+        if cookie is not None:
+            try:
+                parent = cookie.reply().parent
+                if __parents is not None:
+                    __parents[w] = parent
+            except xproto.BadWindow:
+                pass
+        parents.append(parent)
+
+    return parents
+
+def __decoration_extents(windows, frames):
+    """
+    Private function that measures how much wider and taller each frame is
+    than its window, with pipelined GetGeometry requests. Frames whose
+    extents are cached (see ``cache_frames``) aren't measured.
+
+    :param windows: A list of window identifiers.
+    :param frames: A list of their frames (or None).
+    :return: A list of ``(dw, dh, fw, fh)``, where ``fw`` and ``fh`` are the
+             frame's size, or None for windows that have no frame.
+    :rtype: [(int, int, int, int)]
+    """
+    cache = __extents if __extents is not None else {}
+
+    extents, pending = [], []
+    for i, (win, frame) in enumerate(zip(windows, frames)):
+        extents.append(cache.get(frame))
+        if frame is not None and frame != root and frame not in cache:
+            pending.append((i, frame, conn.core.GetGeometry(win),
+                            conn.core.GetGeometry(frame)))
+
+    for i, frame, wcookie, fcookie in pending:
+        wgeom, fgeom = __geometry_reply(wcookie), __geometry_reply(fcookie)
+        if wgeom is not None and fgeom is not None:
+            extents[i] = (fgeom[2] - wgeom[2], fgeom[3] - wgeom[3],
+                          fgeom[2], fgeom[3])
+            if __extents is not None:
+                __extents[frame] = extents[i]
+
+    return extents
+
+def __check_extents(e):
+    """
+    Private function that forgets the cached decoration extents of a frame
+    when it changes to a size that we didn't ask for. (i.e., the window
+    manager changed its decorations or the user resized it.) Moves and the
+    resizes requested by ``moveresize`` don't invalidate anything.
+
+    :param e: A ConfigureNotify event.
+    :type e: xcb.xproto.ConfigureNotifyEvent
+    :rtype: void
+    """
+    ext = __extents.get(e.window)
+    if ext is not None and ext[2:] != (e.width, e.height):
+        del __extents[e.window]
+
+def __check_window_manager(e):
+    """
+    Private function that forgets the detected window manager when
+    _NET_SUPPORTING_WM_CHECK changes on the root window.
+
+    :param e: A PropertyNotify event.
+    :type e: xcb.xproto.PropertyNotifyEvent
+    :rtype: void
+    """
+    global __window_manager
+
+    if e.window == root and e.atom == __wm_check_atom:
+        __window_manager = None
+
+def __update_parent(e):
+    """
+    Private function that records the new parent of a reparented window in
+    the frame cache.
+
+    :param e: A ReparentNotify event.
+    :type e: xcb.xproto.ReparentNotifyEvent
+    :rtype: void
+    """
+    __parents[e.window] = e.parent
+
+def __forget_window(e):
+    """
+    Private function that drops a destroyed window from the frame cache,
+    along with every cached window inside of it. (Destroying a frame
+    destroys its children too, but we may not hear about them.)
+
+    :param e: A DestroyNotify event.
+    :type e: xcb.xproto.DestroyNotifyEvent
+    :rtype: void
+    """
+    gone = set([e.window])
+    while gone:
+        for w in gone:
+            __parents.pop(w, None)
+            __extents.pop(w, None)
+        gone = set(w for w, p in __parents.items() if p in gone)
+
+def __geometry_reply(cookie):
+    """
+    Private function that reads a GetGeometry reply as a rectangle.
+
+    :type cookie: xcb.xproto.GetGeometryCookie
+    :return: X rectangle of the window, or None if it no longer exists.
+    :rtype: (x, y, width, height)
+    """
+    try:
+        raw = cookie.reply()
+    except (xproto.BadWindow, xproto.BadDrawable):
+        return None
+    return raw.x, raw.y, raw.width, raw.height
 
 def __get_geometry(win):
     """
@@ -7,15 +7,36 @@ The 'get_physical_mapping' function will produce a list of
 monitor indices in a physical ordering (left to right, top to
 bottom). These indices can then be used in the list returned by
 'get_monitors'.
+
+The 'get_topology' function returns the monitors along with their
+output names, which one is primary and their refresh rates. It
+uses RandR when it's available (falling back to Xinerama), and the
+result is cached until the event dispatcher sees the monitor
+configuration change.
+
+A 'MonitorIndex' answers "which monitor is this point on" and "which
+monitor is to the left of this one" from precomputed tables, and follows
+'get_topology' by default.
 """
-from xpybutil.compat import xinerama
+from bisect import bisect_right
+from collections import namedtuple
+
+from xpybutil.compat import randr, xcb_Exception, xinerama
 
-from xpybutil import conn
+from xpybutil import conn, root, event
 
 ext = None
 if conn is not None:
     ext = conn(xinerama.key)
 
+Monitor = namedtuple('Monitor', ['x', 'y', 'width', 'height',
+                                 'name', 'primary', 'refresh'])
+
+__topology = None
+__randr = None # The RandR extension, False if it isn't usable
+__callbacks = []
+__pending = None # Handle of the scheduled '__notify_topology', if any
+
 def get_monitors():
     '''
     Returns a list of Xinerama screen rectangles.
@@ -49,3 +70,301 @@ def get_physical_mapping(monitors):
 
     return retval
 
+
+class MonitorIndex(object):
+    '''
+    Lookup tables over a list of monitors: their physical order, the
+    neighboring monitor in each direction and a point-to-monitor table.
+    The tables are built once, and lookups cost a couple of bisections.
+
+    If no monitors are given, the index follows 'get_topology' and
+    rebuilds itself whenever the topology changes. Otherwise, call
+    'update' when the monitors change.
+
+    Monitors are referred to by their index in the list of monitors.
+    '''
+    Left, Right, Up, Down = 'left', 'right', 'up', 'down'
+
+    def __init__(self, monitors=None):
+        '''
+        :param monitors: List of (x, y, w, h) rectangles (or Monitor
+                         tuples). Defaults to following 'get_topology'.
+        '''
+        self.__follow = monitors is None
+        self.__source = None
+        if not self.__follow:
+            self.update(monitors)
+
+    def update(self, monitors):
+        '''
+        Rebuilds the index for a new list of monitors.
+
+        :param monitors:  List of (x, y, w, h) rectangles
+        :rtype:           void
+        '''
+        self.__source = monitors
+        rects = [tuple(m[:4]) for m in monitors]
+        self.__monitors = rects
+        self.__order = get_physical_mapping(rects)
+
+        self.__xs = sorted(set(e for x, _, w, _ in rects for e in (x, x + w)))
+        self.__ys = sorted(set(e for _, y, _, h in rects for e in (y, y + h)))
+        self.__cells = {}
+        for i in reversed(range(len(rects))): # The first monitor wins
+            x, y, w, h = rects[i]
+            cols = range(self.__xs.index(x), self.__xs.index(x + w))
+            rows = range(self.__ys.index(y), self.__ys.index(y + h))
+            for col in cols:
+                for row in rows:
+                    self.__cells[(col, row)] = i
+
+        self.__neighbors = {}
+        for i in range(len(rects)):
+            for direction in (self.Left, self.Right, self.Up, self.Down):
+                self.__neighbors[(i, direction)] = self.__find_neighbor(
+                    i, direction)
+
+    def monitors(self):
+        '''
+        :rtype: List of (x, y, w, h) rectangles
+        '''
+        self.__refresh()
+        return list(self.__monitors)
+
+    def physical_order(self):
+        '''
+        :return: Monitor indices from left to right and then top to bottom,
+                 as returned by 'get_physical_mapping'.
+        :rtype: List of monitor indices
+        '''
+        self.__refresh()
+        return list(self.__order)
+
+    def monitor_at(self, x, y):
+        '''
+        :return: The index of the monitor containing the point (x, y), or
+                 None if the point isn't on any monitor. If monitors
+                 overlap, the first one wins.
+        :rtype: int
+        '''
+        self.__refresh()
+        col = bisect_right(self.__xs, x) - 1
+        row = bisect_right(self.__ys, y) - 1
+        return self.__cells.get((col, row))
+
+    def neighbor(self, monitor, direction):
+        '''
+        Finds the closest monitor in a direction whose edge faces the given
+        monitor. (i.e., for MonitorIndex.Right, a monitor entirely to the
+        right that shares some rows with it.) Ties go to the monitor with
+        the most rows (or columns) in common.
+
+        :param monitor: A monitor index.
+        :param direction: MonitorIndex.Left, Right, Up or Down.
+        :return: A monitor index, or None if there's no monitor there.
+        :rtype: int
+        '''
+        self.__refresh()
+        return self.__neighbors[(monitor, direction)]
+
+    def __refresh(self):
+        if self.__follow:
+            topology = get_topology()
+            if topology is not self.__source:
+                self.update(topology)
+
+    def __find_neighbor(self, i, direction):
+        x, y, w, h = self.__monitors[i]
+        best, best_key = None, None
+        for j, (ox, oy, ow, oh) in enumerate(self.__monitors):
+            if j == i:
+                continue
+            if direction in (self.Left, self.Right):
+                overlap = min(y + h, oy + oh) - max(y, oy)
+                if direction == self.Right:
+                    gap = ox - (x + w)
+                else:
+                    gap = x - (ox + ow)
+            else:
+                overlap = min(x + w, ox + ow) - max(x, ox)
+                if direction == self.Down:
+                    gap = oy - (y + h)
+                else:
+                    gap = y - (oy + oh)
+            if overlap <= 0 or gap < 0:
+                continue
+            key = (gap, -overlap)
+            if best_key is None or key < best_key:
+                best, best_key = j, key
+        return best
+
+def get_topology():
+    '''
+    Returns the active monitors, in the order RandR reports its CRTCs (or
+    in Xinerama's order if RandR 1.3 isn't available).
+
+    The topology is fetched with pipelined requests the first time, and
+    is then cached. The event dispatcher drops the cache when RandR
+    reports that the screen, a CRTC or an output changed, so the next
+    call fetches it again.
+
+    With Xinerama, the name is None, no monitor is primary, the refresh
+    rate is 0 and the cache is never dropped.
+
+    :rtype: Tuple of Monitor(x, y, width, height, name, primary, refresh),
+            where refresh is in Hz
+    '''
+    global __topology
+
+    if __topology is None:
+        if __randr_extension():
+            __topology = __randr_topology()
+        else:
+            __topology = tuple(Monitor(x, y, w, h, None, False, 0)
+                               for x, y, w, h in get_monitors())
+
+    return __topology
+
+def invalidate_topology():
+    '''
+    Drops the cached topology, as if the monitor configuration changed.
+    Callbacks registered with 'add_topology_callback' are called.
+
+    :rtype: void
+    '''
+    global __topology, __pending
+
+    __topology = None
+    if __pending is not None:
+        event.cancel_call(__pending)
+        __pending = None
+    for cb in list(__callbacks):
+        cb()
+
+def add_topology_callback(callback):
+    '''
+    Registers a function (that takes no arguments) to be called whenever
+    the monitor configuration changes. Calling 'get_topology' from it
+    returns the new topology. The event dispatcher must be running.
+
+    Callbacks are called once the events describing a change have all been
+    dispatched, rather than once per event.
+
+    :rtype: void
+    '''
+    get_topology() # selects RandR events if need be
+    __callbacks.append(callback)
+
+def remove_topology_callback(callback):
+    if callback in __callbacks:
+        __callbacks.remove(callback)
+
+def __randr_extension():
+    '''
+    Private function that sets up RandR the first time it's needed: it
+    checks for version 1.3 (for GetScreenResourcesCurrent and
+    GetOutputPrimary) and selects the events that change the topology.
+
+    :return: The RandR extension, or False if it can't be used.
+    '''
+    global __randr
+
+    if __randr is None:
+        __randr = False
+        try:
+            r = conn(randr.key)
+            version = r.QueryVersion(1, 3).reply()
+            if (version.major_version, version.minor_version) >= (1, 3):
+                r.SelectInput(root, randr.NotifyMask.ScreenChange
+                                    | randr.NotifyMask.CrtcChange
+                                    | randr.NotifyMask.OutputChange)
+                event.add_hook(randr.ScreenChangeNotifyEvent,
+                               __topology_changed)
+                event.add_hook(randr.NotifyEvent, __topology_changed)
+                __randr = r
+        except xcb_Exception:
+            pass
+
+    return __randr
+
+def __randr_topology():
+    '''
+    Private function that fetches the active CRTCs and their outputs with
+    RandR. This costs two round trips.
+
+    :rtype: Tuple of Monitor
+    '''
+    res_cookie = __randr.GetScreenResourcesCurrent(root)
+    primary_cookie = __randr.GetOutputPrimary(root)
+    res = res_cookie.reply()
+    primary = primary_cookie.reply().output
+
+    stamp = res.config_timestamp
+    crtc_cookies = [__randr.GetCrtcInfo(c, stamp) for c in res.crtcs]
+    output_cookies = [(o, __randr.GetOutputInfo(o, stamp))
+                      for o in res.outputs]
+
+    refresh = {}
+    for mode in res.modes:
+        refresh[mode.id] = __refresh_rate(mode)
+
+    outputs = {}
+    for output, cookie in output_cookies:
+        try:
+            info = cookie.reply()
+        except xcb_Exception:
+            continue
+        name = bytes(info.name.buf()).decode('utf-8', 'replace')
+        outputs[output] = name
+
+    monitors = []
+    for cookie in crtc_cookies:
+        try:
+            crtc = cookie.reply()
+        except xcb_Exception:
+            continue
+        if not crtc.mode or not crtc.width or not crtc.height:
+            continue
+
+        names = [outputs[o] for o in crtc.outputs if o in outputs]
+        monitors.append(Monitor(crtc.x, crtc.y, crtc.width, crtc.height,
+                                names[0] if names else None,
+                                primary in crtc.outputs,
+                                refresh.get(crtc.mode, 0)))
+
+    return tuple(monitors)
+
+def __refresh_rate(mode):
+    '''
+    Private function that computes the refresh rate of a RandR mode in Hz.
+    '''
+    vtotal = mode.vtotal
+    if mode.mode_flags & randr.ModeFlag.DoubleScan:
+        vtotal *= 2
+    if mode.mode_flags & randr.ModeFlag.Interlace:
+        vtotal /= 2.0
+    if not mode.htotal or not vtotal:
+        return 0
+    return mode.dot_clock / float(mode.htotal * vtotal)
+
+def __topology_changed(e):
+    global __topology, __pending
+
+    if isinstance(e, randr.NotifyEvent) and \
+            e.subCode not in (randr.Notify.CrtcChange,
+                              randr.Notify.OutputChange):
+        return
+
+    # A single change usually produces a burst of notify events. Drop the
+    # cache right away, but only tell the callbacks once the burst has been
+    # dispatched.
+    __topology = None
+    if __pending is None and __callbacks:
+        __pending = event.call_later(0, __notify_topology)
+
+def __notify_topology():
+    global __pending
+
+    __pending = None
+    for cb in list(__callbacks):
+        cb()